@@ -1,7 +1,42 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 
 
 class CmspluginBlocks_Config(AppConfig):
     name = "cmsplugin_blocks"
     verbose_name = "CMS Blocks"
     default_auto_field = "django.db.models.AutoField"
+
+    def ready(self):
+        from .models import Feature
+        from .signals import (
+            feature_deleted, feature_deleting, feature_saved, plugin_features_changed,
+        )
+        from .utils.features import get_feature_models
+
+        post_save.connect(
+            feature_saved,
+            sender=Feature,
+            dispatch_uid="cmsplugin_blocks_feature_saved",
+        )
+        pre_delete.connect(
+            feature_deleting,
+            sender=Feature,
+            dispatch_uid="cmsplugin_blocks_feature_deleting",
+        )
+        post_delete.connect(
+            feature_deleted,
+            sender=Feature,
+            dispatch_uid="cmsplugin_blocks_feature_deleted",
+        )
+
+        for model in get_feature_models():
+            for scope, through, link_attrname in model.get_features_relations():
+                m2m_changed.connect(
+                    plugin_features_changed,
+                    sender=through,
+                    dispatch_uid="cmsplugin_blocks_{}_{}_features_changed".format(
+                        model._meta.model_name,
+                        scope,
+                    ),
+                )
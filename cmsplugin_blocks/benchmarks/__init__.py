@@ -0,0 +1,6 @@
+"""
+Benchmarks to measure application performances on the current project database.
+
+They are not tests, they are meant to be run from their management commands to
+report measures. Some of them require the development requirements.
+"""
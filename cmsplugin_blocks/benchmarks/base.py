@@ -0,0 +1,82 @@
+import statistics
+import time
+
+
+def percentile(values, rank):
+    """
+    Compute a percentile with the nearest rank method.
+
+    Arguments:
+        values (list): Numbers to compute percentile from.
+        rank (integer): Percentile rank from 0 to 100.
+
+    Returns:
+        float: The percentile value or None if there is no values.
+    """
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    index = max(0, int(round(rank / 100 * len(ordered))) - 1)
+
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def summarize(durations):
+    """
+    Build statistics from durations.
+
+    Arguments:
+        durations (list): Durations in seconds.
+
+    Returns:
+        dict: Statistics in milliseconds with items ``count``, ``min``,
+        ``median``, ``p95`` and ``max``.
+    """
+    milliseconds = [item * 1000 for item in durations]
+
+    return {
+        "count": len(milliseconds),
+        "min": min(milliseconds) if milliseconds else None,
+        "median": statistics.median(milliseconds) if milliseconds else None,
+        "p95": percentile(milliseconds, 95),
+        "max": max(milliseconds) if milliseconds else None,
+    }
+
+
+def measure(func, repeat=10):
+    """
+    Call a function many times and measure its durations.
+
+    Arguments:
+        func (callable): Function to call without any argument.
+
+    Keyword Arguments:
+        repeat (integer): Number of calls.
+
+    Returns:
+        dict: Statistics as returned from ``summarize()``.
+    """
+    durations = []
+
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+
+    return summarize(durations)
+
+
+def format_stats(stats):
+    """
+    Format statistics to a single line.
+
+    Arguments:
+        stats (dict): Statistics as returned from ``summarize()``.
+
+    Returns:
+        string: Formatted statistics.
+    """
+    return (
+        "min {min:.3f}ms, median {median:.3f}ms, p95 {p95:.3f}ms, max {max:.3f}ms"
+    ).format(**stats)
@@ -0,0 +1,137 @@
+"""
+Benchmark CSS class name validation.
+
+The compiled validator is measured against the previous character loop, for a
+single class name per value and for multiple class names per value as allowed by
+setting ``BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES``. This does not involve the
+database.
+"""
+import random
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.test.utils import override_settings
+from django.utils.translation import gettext_lazy as _
+
+from ..utils.validators import get_css_classnames_errors, validate_css_classname
+from .base import measure
+
+
+CLASSNAME_PARTS = [
+    "col", "row", "bg", "text", "border", "shadow", "flex", "grid", "gap", "p", "m",
+    "sm", "md", "lg", "xl", "primary", "success", "warning", "danger", "center",
+]
+"""
+Words to build random class names from.
+"""
+
+
+def legacy_validate_css_classname(value):
+    """
+    The previous CSS class name validator which checks each character, kept as is
+    for comparison.
+
+    Raises:
+        ValidationError: If given value is an invalid CSS class name.
+
+    Arguments:
+        value (string): A string with a CSS class name to validate.
+
+    Returns:
+        bool: True if valid.
+    """
+    msg = _("'%(value)s' is not a valid CSS class name")
+
+    if not value:
+        raise ValidationError(msg, params={"value": value})
+
+    if settings.BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES is True:
+        classnames = value.split(" ")
+    else:
+        classnames = [value]
+
+    for name in classnames:
+        for i, item in enumerate(name):
+            if i == 0 and item.isdigit():
+                raise ValidationError(msg, params={"value": name})
+
+            if item.isalnum() or item in ["-", "_"]:
+                continue
+
+            raise ValidationError(msg, params={"value": name})
+
+    return True
+
+
+def build_values(count, multiple=False, seed=None):
+    """
+    Build random valid values.
+
+    Arguments:
+        count (integer): Number of values.
+
+    Keyword Arguments:
+        multiple (boolean): If True, values are made of one to four class names
+            divided by whitespaces.
+        seed (integer): Optional seed for random values.
+
+    Returns:
+        list: Values.
+    """
+    generator = random.Random(seed)
+
+    def classname():
+        return "-".join(
+            generator.sample(CLASSNAME_PARTS, k=generator.randint(1, 3)) +
+            [str(generator.randint(1, 12))]
+        )
+
+    return [
+        " ".join(
+            classname() for i in range(generator.randint(1, 4) if multiple else 1)
+        )
+        for j in range(count)
+    ]
+
+
+def run(values=10000, repeat=5, seed=None):
+    """
+    Run benchmark.
+
+    Keyword Arguments:
+        values (integer): Number of values to validate for each mode.
+        repeat (integer): Number of measured validations of all values.
+        seed (integer): Optional seed for random values.
+
+    Returns:
+        dict: Benchmark results with number of ``values`` and items ``single`` and
+        ``multiple`` for each mode. Each mode has timing stats for ``legacy``
+        validator, ``compiled`` validator called on each value and ``list`` for
+        ``get_css_classnames_errors()`` called once for all values.
+    """
+    results = {"values": values}
+
+    for name, multiple in (("single", False), ("multiple", True)):
+        items = build_values(values, multiple=multiple, seed=seed)
+
+        with override_settings(BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES=multiple):
+            # Validators must agree before being compared
+            if get_css_classnames_errors(items):
+                raise ValueError("Invalid benchmark values")
+
+            results[name] = {
+                "legacy": measure(
+                    lambda: [legacy_validate_css_classname(item) for item in items],
+                    repeat=repeat,
+                ),
+                "compiled": measure(
+                    lambda: [validate_css_classname(item) for item in items],
+                    repeat=repeat,
+                ),
+                "list": measure(
+                    lambda: get_css_classnames_errors(items),
+                    repeat=repeat,
+                ),
+            }
+
+    return results
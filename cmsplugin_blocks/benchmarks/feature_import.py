@@ -0,0 +1,127 @@
+"""
+Benchmark Feature import from synthetic JSON dumps.
+
+Dump validation and save are measured separately from ``FeatureImportForm``. Each
+save happens in a transaction which is rolled back, so every repeat starts from the
+same existing features.
+"""
+import json
+import random
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from ..forms import FeatureImportForm
+from ..models import Feature
+from .base import measure
+from .feature_indexes import create_features
+
+
+def build_dump(count, seed=None):
+    """
+    Build a synthetic JSON dump of features.
+
+    Arguments:
+        count (integer): Number of dump items.
+
+    Keyword Arguments:
+        seed (integer): Optional seed for random values.
+
+    Returns:
+        bytes: JSON dump content.
+    """
+    generator = random.Random(seed)
+    scopes = [k for k, v in Feature.SCOPE_CHOICES]
+    plugins = settings.BLOCKS_KNOWED_FEATURES_PLUGINS
+
+    return json.dumps({
+        "version": "benchmark",
+        "items": [
+            {
+                "title": "Benchmark {}".format(i),
+                "value": "benchmark-{}".format(i),
+                "scope": generator.choice(scopes),
+                "plugins": sorted(generator.sample(
+                    plugins,
+                    k=generator.randint(1, min(3, len(plugins))),
+                )),
+            }
+            for i in range(count)
+        ],
+    }).encode("utf-8")
+
+
+def get_form(dump):
+    """
+    Return a bound import form for a dump.
+
+    Arguments:
+        dump (bytes): JSON dump content.
+
+    Returns:
+        cmsplugin_blocks.forms.FeatureImportForm: Bound form.
+    """
+    return FeatureImportForm({}, {
+        "json_file": SimpleUploadedFile(
+            "dump.json",
+            dump,
+            content_type="application/json",
+        ),
+    })
+
+
+def run(features=20000, existing=0, repeat=3, seed=None):
+    """
+    Run benchmark.
+
+    Keyword Arguments:
+        features (integer): Number of dump items.
+        existing (integer): Number of features to create before import. Their titles
+            are the same than the first dump items, so they are duplicates.
+        repeat (integer): Number of measured validations and saves.
+        seed (integer): Optional seed for random values.
+
+    Returns:
+        dict: Benchmark results with database ``vendor``, number of dump
+        ``features``, number of ``existing`` features, ``validation`` and ``save``
+        timing stats, ``queries`` count from a save and its ``results`` counts.
+    """
+    dump = build_dump(features, seed=seed)
+
+    def validate():
+        form = get_form(dump)
+        if not form.is_valid():
+            raise ValueError("Invalid benchmark dump: {}".format(form.errors))
+        return form
+
+    def save():
+        with transaction.atomic():
+            form.save()
+            transaction.set_rollback(True)
+
+    with transaction.atomic():
+        create_features(existing, seed=seed)
+
+        form = validate()
+        results = {
+            "vendor": connection.vendor,
+            "features": features,
+            "existing": existing,
+            "validation": measure(validate, repeat=repeat),
+            "save": measure(save, repeat=repeat),
+        }
+
+        with CaptureQueriesContext(connection) as captured:
+            report = form.save()
+
+        results["queries"] = len(captured.captured_queries)
+        results["results"] = {
+            "created": len(report["created"]),
+            "duplicates": len(report["duplicates"]),
+        }
+
+        transaction.set_rollback(True)
+
+    return results
@@ -0,0 +1,152 @@
+"""
+Benchmark Feature indexes on the common feature filtering queries.
+
+Queries are measured and explained with application indexes, then again once they
+have been dropped. Everything happens in a transaction which is rolled back at the
+end, including index removals, so this requires a database backend which supports
+transactional DDL like SQLite or PostgreSQL.
+"""
+import random
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from ..models import Feature, FeaturePlugin
+from .base import measure
+
+
+BENCHMARKED_INDEXES = [
+    "blocks_feature_scope_value",
+    "blocks_feature_plugin_name",
+]
+"""
+Application index names to drop for the measures without indexes.
+"""
+
+
+def create_features(count, seed=None):
+    """
+    Create features with random scope and allowed plugins, in bulk.
+
+    Arguments:
+        count (integer): Number of features to create.
+
+    Keyword Arguments:
+        seed (integer): Optional seed for random values.
+
+    Returns:
+        list: Created Feature objects.
+    """
+    generator = random.Random(seed)
+    scopes = [k for k, v in Feature.SCOPE_CHOICES]
+    plugins = settings.BLOCKS_KNOWED_FEATURES_PLUGINS
+
+    features = Feature.objects.bulk_create(
+        [
+            Feature(
+                title="Benchmark {}".format(i),
+                value="benchmark-{}".format(i),
+                scope=generator.choice(scopes),
+                plugins=sorted(generator.sample(
+                    plugins,
+                    k=generator.randint(1, min(3, len(plugins))),
+                )),
+            )
+            for i in range(count)
+        ],
+        batch_size=1000,
+    )
+
+    FeaturePlugin.objects.bulk_create(
+        [
+            FeaturePlugin(feature=feature, name=name)
+            for feature in features
+            for name in feature.plugins
+        ],
+        batch_size=1000,
+    )
+
+    return features
+
+
+def get_queries(plugin, value):
+    """
+    Return querysets to benchmark.
+
+    Arguments:
+        plugin (string): Plugin name to filter on.
+        value (string): Feature value to filter on.
+
+    Returns:
+        dict: Callables which return a queryset, indexed on a query label.
+    """
+    return {
+        "scope and plugin (contains)": lambda: Feature.objects.filter(
+            scope=Feature.SIZING,
+            plugins__contains=plugin,
+        ).values_list("value", "scope"),
+        "scope and plugin (indexed)": lambda: Feature.objects.filter(
+            scope=Feature.SIZING,
+            allowed_plugins__name=plugin,
+        ).values_list("value", "scope"),
+        "scope and value": lambda: Feature.objects.filter(
+            scope=Feature.SIZING,
+            value=value,
+        ).values_list("id", flat=True),
+    }
+
+
+def drop_indexes(names):
+    """
+    Drop database indexes.
+
+    Arguments:
+        names (list): Index names.
+    """
+    with connection.cursor() as cursor:
+        for name in names:
+            cursor.execute("DROP INDEX {}".format(connection.ops.quote_name(name)))
+
+
+def run(features=10000, repeat=20, seed=None):
+    """
+    Run benchmark.
+
+    Keyword Arguments:
+        features (integer): Number of features to create.
+        repeat (integer): Number of executions for each measured query.
+        seed (integer): Optional seed for random values.
+
+    Returns:
+        dict: Benchmark results with database ``vendor``, number of created
+        ``features`` and ``queries`` results. Each query result is indexed on its
+        label and contains items ``indexed`` and ``unindexed``, each one with the
+        query ``plan`` and its timing ``stats``.
+    """
+    results = {
+        "vendor": connection.vendor,
+        "features": features,
+        "queries": {},
+    }
+
+    with transaction.atomic():
+        create_features(features, seed=seed)
+        queries = get_queries(
+            plugin=settings.BLOCKS_KNOWED_FEATURES_PLUGINS[0],
+            value="benchmark-{}".format(features // 2),
+        )
+
+        for state in ("indexed", "unindexed"):
+            if state == "unindexed":
+                drop_indexes(BENCHMARKED_INDEXES)
+
+            for label, build in queries.items():
+                results["queries"].setdefault(label, {})[state] = {
+                    "plan": build().explain(),
+                    "stats": measure(lambda: list(build()), repeat=repeat),
+                }
+
+        # Drop everything from benchmark, including index removals
+        transaction.set_rollback(True)
+
+    return results
@@ -0,0 +1,303 @@
+"""
+Benchmark plugin rendering.
+
+For each plugin type, a placeholder is filled with plugin objects built from the
+application factories, with their features, items and nested containers. Then the
+placeholder is rendered many times to measure render durations, queries and memory.
+
+Everything happens in a transaction which is rolled back at the end. Only a single
+image file is stored for all objects and it is removed at the end, however the
+thumbnails generated from it are left in media directory.
+
+This requires the development requirements for factories.
+"""
+import time
+import tracemalloc
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.template import Context
+from django.test import RequestFactory
+
+from cms.api import add_plugin
+from cms.models import Placeholder
+from cms.plugin_rendering import ContentRenderer
+from cms.toolbar.toolbar import CMSToolbar
+
+from ..factories import (
+    AccordionFactory, AccordionItemFactory, AlbumFactory, AlbumItemFactory,
+    CardFactory, ContainerFactory, FeatureFactory, HeroFactory, SliderFactory,
+    SlideItemFactory,
+)
+from ..models import Feature
+from ..plugins.accordion import AccordionPlugin
+from ..plugins.album import AlbumPlugin
+from ..plugins.card import CardPlugin
+from ..plugins.container import ContainerPlugin
+from ..plugins.hero import HeroPlugin
+from ..plugins.slider import SliderPlugin
+from ..utils.factories import create_image_file
+from .base import summarize
+
+
+BENCHMARKED_PLUGINS = {
+    "Accordion": (AccordionPlugin, AccordionFactory, AccordionItemFactory),
+    "Album": (AlbumPlugin, AlbumFactory, AlbumItemFactory),
+    "Card": (CardPlugin, CardFactory, None),
+    "Container": (ContainerPlugin, ContainerFactory, None),
+    "Hero": (HeroPlugin, HeroFactory, None),
+    "Slider": (SliderPlugin, SliderFactory, SlideItemFactory),
+}
+"""
+Plugin class, plugin model factory and item factory for each benchmarked plugin.
+"""
+
+
+def get_factory_values(factory_class, **kwargs):
+    """
+    Build field values for a plugin model from its factory.
+
+    Arguments:
+        factory_class (factory.django.DjangoModelFactory): Plugin model factory.
+        **kwargs: Values to enforce.
+
+    Returns:
+        dict: Values for fields which are defined on plugin model itself, fields
+        inherited from ``CMSPlugin`` are ignored.
+    """
+    instance = factory_class.build(**kwargs)
+
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.local_concrete_fields
+        if field.editable and not field.primary_key
+    }
+
+
+def add_benchmark_plugin(placeholder, name, image, features, items=0,
+                         target=None):
+    """
+    Add a plugin object with its features and items to a placeholder.
+
+    Arguments:
+        placeholder (cms.models.Placeholder): Placeholder where to add plugin.
+        name (string): Benchmarked plugin name.
+        image (string): Image file path for image fields.
+        features (list): Feature objects to attach.
+
+    Keyword Arguments:
+        items (integer): Number of items to create if plugin has items.
+        target (object): Parent plugin object if any.
+
+    Returns:
+        object: Created plugin object.
+    """
+    plugin_class, factory_class, item_factory = BENCHMARKED_PLUGINS[name]
+
+    values = {}
+    if "image" in [f.name for f in plugin_class.model._meta.get_fields()]:
+        values["image"] = image
+
+    instance = add_plugin(
+        placeholder,
+        plugin_class,
+        "en",
+        target=target,
+        **get_factory_values(factory_class, **values)
+    )
+
+    for scope, label in Feature.SCOPE_CHOICES:
+        getattr(instance, "{}_features".format(scope)).set([
+            feature for feature in features if feature.scope == scope
+        ])
+
+    if item_factory and items:
+        field = plugin_class.model._meta.get_field(plugin_class.items_relation)
+        item_factory.create_batch(
+            items,
+            image=image,
+            **{field.field.name: instance}
+        )
+
+    return instance
+
+
+def build_placeholder(name, image, objects=5, items=10, features=3, depth=1,
+                      children=3):
+    """
+    Build a placeholder filled with objects of a plugin.
+
+    Arguments:
+        name (string): Benchmarked plugin name.
+        image (string): Image file path for image fields.
+
+    Keyword Arguments:
+        objects (integer): Number of plugin objects.
+        items (integer): Number of items for each plugin object with items.
+        features (integer): Number of features for each scope.
+        depth (integer): For Container plugin only, depth of nested containers
+            in each plugin object.
+        children (integer): For Container plugin only, number of Card plugin
+            objects in each nested container.
+
+    Returns:
+        cms.models.Placeholder: Filled placeholder.
+    """
+    placeholder = Placeholder.objects.create(slot="benchmark")
+
+    plugin_features = [
+        FeatureFactory(scope=scope, plugins=[name, "Card"])
+        for scope, label in Feature.SCOPE_CHOICES
+        for i in range(features)
+    ]
+
+    for i in range(objects):
+        instance = add_benchmark_plugin(
+            placeholder, name, image, plugin_features, items=items,
+        )
+
+        if name == "Container":
+            parent = instance
+            for level in range(depth):
+                parent = add_benchmark_plugin(
+                    placeholder, name, image, plugin_features, target=parent,
+                )
+                for j in range(children):
+                    add_benchmark_plugin(
+                        placeholder, "Card", image, plugin_features, target=parent,
+                    )
+
+    return placeholder
+
+
+def render_placeholder(placeholder):
+    """
+    Render a placeholder like DjangoCMS does for an anonymous user.
+
+    A new request, renderer and placeholder object are used, so there is no memory
+    cache from a previous render.
+
+    Arguments:
+        placeholder (cms.models.Placeholder): Placeholder to render.
+
+    Returns:
+        string: Rendered HTML.
+    """
+    request = RequestFactory().get("/")
+    request.user = AnonymousUser()
+    request.toolbar = CMSToolbar(request)
+
+    return ContentRenderer(request).render_placeholder(
+        Placeholder.objects.get(pk=placeholder.pk),
+        context=Context({"request": request}),
+        language="en",
+    )
+
+
+def measure_render(placeholder, repeat=20):
+    """
+    Measure renders of a placeholder.
+
+    A first render is done before measures so thumbnails are already generated.
+
+    Arguments:
+        placeholder (cms.models.Placeholder): Placeholder to render.
+
+    Keyword Arguments:
+        repeat (integer): Number of measured renders.
+
+    Returns:
+        dict: Render ``stats`` as returned from ``summarize()``, number of
+        ``queries`` for a render and ``memory`` peak in bytes for a render.
+    """
+    render_placeholder(placeholder)
+
+    durations = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        render_placeholder(placeholder)
+        durations.append(time.perf_counter() - start)
+
+    # Queries are counted from a wrapper since the query log is capped
+    executed = {"queries": 0}
+
+    def count_queries(execute, sql, params, many, context):
+        executed["queries"] += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_queries):
+        render_placeholder(placeholder)
+
+    # Memory is traced apart since tracing slows down execution
+    tracemalloc.start()
+    try:
+        render_placeholder(placeholder)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "stats": summarize(durations),
+        "queries": executed["queries"],
+        "memory": peak,
+    }
+
+
+def run(plugins=None, objects=5, items=10, features=3, depth=1, children=3,
+        repeat=20):
+    """
+    Run benchmark.
+
+    Keyword Arguments:
+        plugins (list): Names of plugins to benchmark. Default to all plugins.
+        objects (integer): Number of plugin objects in each placeholder.
+        items (integer): Number of items for each plugin object with items.
+        features (integer): Number of features for each scope.
+        depth (integer): Depth of nested containers in each Container object.
+        children (integer): Number of Card objects in each nested container.
+        repeat (integer): Number of measured renders for each plugin.
+
+    Returns:
+        dict: Benchmark results with the used ``options`` and a ``plugins`` item
+        with results from ``measure_render()`` indexed on plugin names.
+    """
+    plugins = plugins or list(BENCHMARKED_PLUGINS.keys())
+
+    results = {
+        "options": {
+            "objects": objects,
+            "items": items,
+            "features": features,
+            "depth": depth,
+            "children": children,
+            "repeat": repeat,
+        },
+        "plugins": {},
+    }
+
+    image = default_storage.save(
+        "blocks/benchmark/image.png",
+        create_image_file(),
+    )
+
+    try:
+        with transaction.atomic():
+            for name in plugins:
+                placeholder = build_placeholder(
+                    name,
+                    image,
+                    objects=objects,
+                    items=items,
+                    features=features,
+                    depth=depth,
+                    children=children,
+                )
+                results["plugins"][name] = measure_render(placeholder, repeat=repeat)
+
+            # Drop everything from benchmark
+            transaction.set_rollback(True)
+    finally:
+        default_storage.delete(image)
+
+    return results
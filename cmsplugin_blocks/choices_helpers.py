@@ -6,10 +6,16 @@ directly use their related settings.
 
 Callables for defaults return a single string. Callables for choices
 return a tuple of choice tuples. None of them accept any argument.
+
+``FeatureChoicesLimit`` is a callable for ``limit_choices_to`` of plugin feature
+relations.
 """
 from django.conf import settings
+from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
 
+from .managers import get_plugin_lookup
+
 
 def get_accordion_template_choices(): return settings.BLOCKS_ACCORDION_TEMPLATES
 
@@ -65,3 +71,30 @@ def get_value_help_text():
         return _("A list of valid CSS classnames divided with a whitespace.")
     else:
         return _("A valid CSS classname.")
+
+
+@deconstructible
+class FeatureChoicesLimit:
+    """
+    Callable to limit Feature choices to a scope and a plugin name.
+
+    Since it is resolved each time choices are built, the plugin lookup follows the
+    current value of setting ``BLOCKS_FEATURE_INDEXED_PLUGINS``.
+
+    Arguments:
+        scope (string): Feature scope name.
+        plugin (string): Plugin name.
+    """
+    def __init__(self, scope, plugin):
+        self.scope = scope
+        self.plugin = plugin
+
+    def __call__(self):
+        return {"scope": self.scope, **get_plugin_lookup(self.plugin)}
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, FeatureChoicesLimit) and
+            self.scope == other.scope and
+            self.plugin == other.plugin
+        )
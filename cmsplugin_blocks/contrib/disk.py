@@ -12,6 +12,7 @@ DISKETTE_DEFINITIONS = [
             "models": [
                 # Keep feature model on top since plugins depend on it
                 "cmsplugin_blocks.Feature",
+                "cmsplugin_blocks.FeaturePlugin",
                 "cmsplugin_blocks.Accordion",
                 "cmsplugin_blocks.AccordionItem",
                 "cmsplugin_blocks.Album",
@@ -24,15 +24,29 @@ from ..defaults import (
     BLOCKS_KNOWED_FEATURES_PLUGINS,
     BLOCKS_FEATURE_PLUGINS,
     BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES,
+    BLOCKS_FEATURE_REGISTRY,
+    BLOCKS_FEATURE_DENORMALIZED,
+    BLOCKS_FEATURE_INDEXED_PLUGINS,
+    BLOCKS_PLACEHOLDER_PREFETCH,
     BLOCKS_ALBUM_TEMPLATES,
     BLOCKS_CARD_TEMPLATES,
     BLOCKS_CONTAINER_TEMPLATES,
     BLOCKS_HERO_TEMPLATES,
     BLOCKS_SLIDER_TEMPLATES,
     BLOCKS_ACCORDION_TEMPLATES,
+    BLOCKS_THUMBNAIL_WARMUP,
     BLOCKS_MODEL_TRUNCATION_LENGTH,
     BLOCKS_MODEL_TRUNCATION_CHR,
     BLOCKS_MASSUPLOAD_FILESIZE_LIMIT,
+    BLOCKS_MASSUPLOAD_SPOOL_SIZE,
+    BLOCKS_MASSUPLOAD_UNCOMPRESSED_LIMIT,
+    BLOCKS_MASSUPLOAD_MEMBER_LIMIT,
+    BLOCKS_MASSUPLOAD_MEMBERS_LIMIT,
+    BLOCKS_MASSUPLOAD_PIXELS_LIMIT,
+    BLOCKS_MASSUPLOAD_DEDUPLICATE,
+    BLOCKS_MASSUPLOAD_WORKERS,
+    BLOCKS_MASSUPLOAD_JOB_RUNNER,
+    BLOCKS_MASSUPLOAD_JOB_TIMEOUT,
 )
 
 
@@ -49,6 +63,14 @@ class CmsBlocksDefaultSettings:
 
     BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES = BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES
 
+    BLOCKS_FEATURE_REGISTRY = BLOCKS_FEATURE_REGISTRY
+
+    BLOCKS_FEATURE_DENORMALIZED = BLOCKS_FEATURE_DENORMALIZED
+
+    BLOCKS_FEATURE_INDEXED_PLUGINS = BLOCKS_FEATURE_INDEXED_PLUGINS
+
+    BLOCKS_PLACEHOLDER_PREFETCH = BLOCKS_PLACEHOLDER_PREFETCH
+
     BLOCKS_ALBUM_TEMPLATES = BLOCKS_ALBUM_TEMPLATES
 
     BLOCKS_CARD_TEMPLATES = BLOCKS_CARD_TEMPLATES
@@ -61,8 +83,28 @@ class CmsBlocksDefaultSettings:
 
     BLOCKS_ACCORDION_TEMPLATES = BLOCKS_ACCORDION_TEMPLATES
 
+    BLOCKS_THUMBNAIL_WARMUP = BLOCKS_THUMBNAIL_WARMUP
+
     BLOCKS_MODEL_TRUNCATION_LENGTH = BLOCKS_MODEL_TRUNCATION_LENGTH
 
     BLOCKS_MODEL_TRUNCATION_CHR = BLOCKS_MODEL_TRUNCATION_CHR
 
     BLOCKS_MASSUPLOAD_FILESIZE_LIMIT = BLOCKS_MASSUPLOAD_FILESIZE_LIMIT
+
+    BLOCKS_MASSUPLOAD_SPOOL_SIZE = BLOCKS_MASSUPLOAD_SPOOL_SIZE
+
+    BLOCKS_MASSUPLOAD_UNCOMPRESSED_LIMIT = BLOCKS_MASSUPLOAD_UNCOMPRESSED_LIMIT
+
+    BLOCKS_MASSUPLOAD_MEMBER_LIMIT = BLOCKS_MASSUPLOAD_MEMBER_LIMIT
+
+    BLOCKS_MASSUPLOAD_MEMBERS_LIMIT = BLOCKS_MASSUPLOAD_MEMBERS_LIMIT
+
+    BLOCKS_MASSUPLOAD_PIXELS_LIMIT = BLOCKS_MASSUPLOAD_PIXELS_LIMIT
+
+    BLOCKS_MASSUPLOAD_DEDUPLICATE = BLOCKS_MASSUPLOAD_DEDUPLICATE
+
+    BLOCKS_MASSUPLOAD_WORKERS = BLOCKS_MASSUPLOAD_WORKERS
+
+    BLOCKS_MASSUPLOAD_JOB_RUNNER = BLOCKS_MASSUPLOAD_JOB_RUNNER
+
+    BLOCKS_MASSUPLOAD_JOB_TIMEOUT = BLOCKS_MASSUPLOAD_JOB_TIMEOUT
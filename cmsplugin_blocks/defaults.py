@@ -39,6 +39,10 @@ matched with a part of another key. Like ``Slider`` could match ``Slider`` or
 
     If you just want to disable some available cmsplugin-blocks plugins from features,
     see ``BLOCKS_FEATURE_PLUGINS``.
+
+.. Note::
+    Key name collisions do not apply when ``BLOCKS_FEATURE_INDEXED_PLUGINS`` is
+    enabled since plugin names are then matched exactly.
 """
 
 BLOCKS_FEATURE_PLUGINS = [
@@ -67,6 +71,58 @@ Be aware that you won't be able to import a JSON dump of features from a project
 does not use the same value of this setting.
 """
 
+BLOCKS_FEATURE_REGISTRY = False
+"""
+Enable the process-wide Feature registry to resolve plugin features.
+
+When enabled, all features are loaded once in memory and plugin rendering only
+performs a single query on feature relations instead of a query on features for
+each scope. The registry is cleared when a Feature object is saved or deleted.
+
+Since the registry lives in process memory, you should only enable it if your
+project is served from a single process or if you are fine with restarting
+processes after feature changes. See ``cmsplugin_blocks.registry`` for details.
+"""
+
+BLOCKS_FEATURE_DENORMALIZED = False
+"""
+Enable denormalized features on plugin objects.
+
+When enabled, results of ``flat_features()`` and ``scoped_features()`` are stored in
+plugin object fields ``features_cache`` and ``scoped_features_cache``. They are
+updated when plugin features relations change and when a Feature object is saved or
+deleted, so rendering plugin features does not need any query.
+
+Denormalized features are not maintained when this setting is disabled, so once you
+enable it you must rebuild them with command: ::
+
+    python manage.py blocks_features_cache
+"""
+
+BLOCKS_FEATURE_INDEXED_PLUGINS = False
+"""
+Enable exact and indexed lookups to filter features allowed for a plugin.
+
+On default, features are filtered with a ``contains`` lookup on the comma separated
+string of ``Feature.plugins`` which can not use any index and may match a plugin
+name which is a part of another one (see ``BLOCKS_KNOWED_FEATURES_PLUGINS``).
+
+When enabled, features are filtered on the indexed relation ``FeaturePlugin`` which
+is automatically maintained when a Feature is saved and has been filled from
+existing features by migrations.
+"""
+
+BLOCKS_PLACEHOLDER_PREFETCH = True
+"""
+Enable prefetching of features and items for all plugin objects of a placeholder.
+
+When enabled, the first rendered plugin object from this application in a
+placeholder prefetches features and items of all plugin objects from the
+placeholder, so there is a single query for each relation table instead of queries
+for each plugin object. See ``cmsplugin_blocks.utils.prefetch.prefetch_plugins()``
+for details.
+"""
+
 BLOCKS_ACCORDION_TEMPLATES = [
     ("cmsplugin_blocks/accordion/default.html", "Default"),
 ]
@@ -109,6 +165,16 @@ BLOCKS_SLIDER_TEMPLATES = [
 Available template choices to render a Slider object and its items.
 """
 
+BLOCKS_THUMBNAIL_WARMUP = False
+"""
+If enabled, thumbnails of Album, Slider and Accordion items are generated when
+items are saved from plugin form or mass upload, instead of on the first render.
+
+Thumbnail sizes are discovered from ``media_thumb`` tags in every template choice
+of the plugin. Existing items can be processed with management command
+``blocks_thumbnails_warmup``.
+"""
+
 BLOCKS_MODEL_TRUNCATION_LENGTH = 4
 """
 Word length limit for model string representation truncation.
@@ -147,3 +213,84 @@ See:
 
 https://stackoverflow.com/questions/2472422/django-file-upload-size-limit
 """
+
+BLOCKS_MASSUPLOAD_SPOOL_SIZE = 2097152
+"""
+Maximum size (in bytes) of an image from a mass upload archive to keep in memory
+while it is extracted. Images bigger than this size are extracted into a temporary
+file on disk instead.
+"""
+
+BLOCKS_MASSUPLOAD_UNCOMPRESSED_LIMIT = 524288000
+"""
+Maximum total size (in bytes) of decompressed files from a mass upload archive.
+
+It is checked from archive metadatas before any decompression, so a small archive
+can not expand into a huge amount of data. Default is ~500MiO, set it to ``None``
+to disable this limit.
+"""
+
+BLOCKS_MASSUPLOAD_MEMBER_LIMIT = 52428800
+"""
+Maximum size (in bytes) of a single decompressed file from a mass upload archive.
+
+It is checked from archive metadatas before any decompression. Default is ~50MiO,
+set it to ``None`` to disable this limit.
+"""
+
+BLOCKS_MASSUPLOAD_MEMBERS_LIMIT = 1000
+"""
+Maximum number of files in a mass upload archive, directories are not counted. Set
+it to ``None`` to disable this limit.
+"""
+
+BLOCKS_MASSUPLOAD_PIXELS_LIMIT = 40000000
+"""
+Maximum number of pixels (width multiplied by height) of an image from a mass
+upload archive. It is checked from image header read from the beginning of the
+archive member, before the rest of the member is decompressed. Bigger images are
+skipped. Default is 40 megapixels, set it to ``None`` to disable this limit.
+"""
+
+BLOCKS_MASSUPLOAD_DEDUPLICATE = False
+"""
+If enabled, images from a mass upload archive are stored to a path made from a hash
+of their content, so an image which has already been uploaded before reuses the
+same file and its thumbnails instead of being stored again.
+
+.. Warning::
+    Stored files may be shared between many items, so you must not automatically
+    remove item files when an item is deleted or changed.
+"""
+
+BLOCKS_MASSUPLOAD_WORKERS = 1
+"""
+Number of threads to extract, verify and store images from a mass upload archive.
+Images are processed sequentially when it is lower than ``2``.
+
+Threads mostly help when the storage backend has a network latency, like with a
+cloud storage. Created items are always in the order of image filenames.
+"""
+
+BLOCKS_MASSUPLOAD_JOB_RUNNER = None
+"""
+Python path to a runner to process mass upload archives from jobs instead of the
+admin request. When empty, archives are processed in the admin request.
+
+Available runners are:
+
+* ``"cmsplugin_blocks.jobs.run_job"`` to process jobs immediately in the same
+  process;
+* ``"cmsplugin_blocks.jobs.queue_job"`` to leave jobs pending so they are processed
+  by management command ``blocks_massupload_worker``.
+
+See ``cmsplugin_blocks.jobs`` for details.
+"""
+
+BLOCKS_MASSUPLOAD_JOB_TIMEOUT = 3600
+"""
+Number of seconds without any progress after which a running mass upload job is
+considered stale, like when its process has been killed. A stale job can be claimed
+again to be processed from start. Set it to ``None`` to never claim running jobs
+again.
+"""
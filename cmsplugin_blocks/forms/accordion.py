@@ -2,15 +2,24 @@ from django import forms
 
 from ..compat.editor_widget import TextEditorWidget
 from ..models.accordion import Accordion, AccordionItem
+from .mixins import MassUploadFormMixin
 
 
-class AccordionForm(forms.ModelForm):
+class AccordionForm(MassUploadFormMixin, forms.ModelForm):
+    """
+    Form to manage a Accordion with possible ZIP file to store items.
+
+    See ``MassUploadFormMixin`` about how items from ZIP file are saved.
+    """
+    massupload_plugin = "cmsplugin_blocks.plugins.accordion.AccordionPlugin"
+
     class Meta:
         model = Accordion
         exclude = []
         fields = [
             "title",
             "template",
+            "mass_upload",
             "keep_open",
             "size_features",
             "color_features",
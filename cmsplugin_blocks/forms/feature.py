@@ -3,11 +3,148 @@ import json
 from django.conf import settings
 from django import forms
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
-from ..models import Feature
+from ..models import Feature, FeaturePlugin
+from ..registry import feature_registry
 from ..choices_helpers import get_feature_plugin_choices
-from ..utils.validators import validate_css_classname
+from ..signals import bulk_feature_deletion, update_related_plugins
+from ..utils.cache import is_cms_cache_enabled
+from ..utils.features import get_related_plugin_ids
+from ..utils.validators import find_invalid_css_classname
+
+
+FEATURE_IMPORT_BATCH_SIZE = 500
+"""
+Maximum number of objects to insert within a single query on Feature import.
+"""
+
+
+IMPORT_MODE_CREATE = "create"
+IMPORT_MODE_UPDATE = "update"
+IMPORT_MODE_SYNC = "sync"
+
+IMPORT_MODE_CHOICES = [
+    (IMPORT_MODE_CREATE, _("Only create missing features")),
+    (IMPORT_MODE_UPDATE, _("Create missing features and update existing ones")),
+    (
+        IMPORT_MODE_SYNC,
+        _(
+            "Create missing features, update existing ones and delete the ones "
+            "that are not in the dump"
+        ),
+    ),
+]
+"""
+Available modes for Feature import.
+"""
+
+
+def apply_features_diff(created=None, updated=None, deleted=None):
+    """
+    Apply a Feature diff in a single transaction.
+
+    Features are deleted with a single queryset deletion, updated with
+    ``bulk_update()`` and created with ``bulk_create()``, along their
+    ``FeaturePlugin`` relations.
+
+    Since bulk operations do not send any signal, the Feature registry is cleared
+    once diff is applied and plugin objects related to updated or deleted features
+    are updated just like signal receivers would do. Related plugin objects are
+    collected with a single batch of queries for all features before the diff is
+    applied, deletion receivers are skipped for each deleted feature with
+    ``bulk_feature_deletion()``.
+
+    Keyword Arguments:
+        created (list): Feature objects to create.
+        updated (list): Existing Feature objects to update, they must have their
+            primary key.
+        deleted (list): Primary keys of Feature objects to delete.
+
+    Returns:
+        dict: Items ``created``, ``updated`` and ``deleted`` with the given
+        objects and primary keys.
+    """
+    created = created or []
+    updated = updated or []
+    deleted = deleted or []
+
+    with transaction.atomic():
+        # Relations to deleted features won't exist anymore once deleted
+        related = None
+        if (updated or deleted) and (
+            settings.BLOCKS_FEATURE_DENORMALIZED or is_cms_cache_enabled()
+        ):
+            related = get_related_plugin_ids(
+                [feature.pk for feature in updated] + list(deleted)
+            )
+
+        if deleted:
+            with bulk_feature_deletion():
+                Feature.objects.filter(pk__in=deleted).delete()
+
+        if updated:
+            Feature.objects.bulk_update(
+                updated,
+                ["value", "plugins"],
+                batch_size=FEATURE_IMPORT_BATCH_SIZE,
+            )
+            # Allowed plugins are simply rebuilt for updated features
+            FeaturePlugin.objects.filter(
+                feature_id__in=[feature.pk for feature in updated]
+            ).delete()
+
+        if created:
+            created = Feature.objects.bulk_create(
+                created,
+                batch_size=FEATURE_IMPORT_BATCH_SIZE,
+            )
+
+            # Some database backends do not set primary keys from bulk_create()
+            if any(feature.pk is None for feature in created):
+                pks = {
+                    (scope, title): pk
+                    for pk, scope, title in Feature.objects.filter(
+                        title__in={feature.title for feature in created}
+                    ).values_list("pk", "scope", "title")
+                }
+                for feature in created:
+                    feature.pk = pks[(feature.scope, feature.title)]
+
+        FeaturePlugin.objects.bulk_create(
+            [
+                FeaturePlugin(feature=feature, name=name)
+                for feature in updated + created
+                for name in sorted(set(feature.plugins))
+            ],
+            batch_size=FEATURE_IMPORT_BATCH_SIZE,
+        )
+
+        # Once allowed plugins are up to date
+        update_related_plugins(related)
+
+    feature_registry.clear_on_commit()
+
+    return {
+        "created": created,
+        "updated": updated,
+        "deleted": deleted,
+    }
+
+
+def bulk_create_features(features):
+    """
+    Create features and their ``FeaturePlugin`` relations with ``bulk_create()``
+    in a single transaction.
+
+    Arguments:
+        features (list): Feature objects to create.
+
+    Returns:
+        list: Created Feature objects.
+    """
+    return apply_features_diff(created=features)["created"]
 
 
 class FeatureForm(forms.ModelForm):
@@ -44,6 +181,17 @@ class FeatureImportForm(forms.Form):
             "created as Feature objects."
         ),
     )
+    mode = forms.ChoiceField(
+        label=_("Mode"),
+        required=False,
+        choices=IMPORT_MODE_CHOICES,
+        initial=IMPORT_MODE_CREATE,
+        widget=forms.RadioSelect,
+        help_text=_(
+            "Existing features are matched on their scope and title. Features from "
+            "ignored scopes are never updated or deleted."
+        ),
+    )
     json_file = forms.FileField(
         required=True,
         help_text=_("A valid feature JSON file."),
@@ -52,9 +200,16 @@ class FeatureImportForm(forms.Form):
     class Meta:
         fields = [
             "scopes",
+            "mode",
             "json_file",
         ]
 
+    def clean_mode(self):
+        """
+        Default to the create mode when no mode is given.
+        """
+        return self.cleaned_data["mode"] or IMPORT_MODE_CREATE
+
     def clean_json_file(self):
         """
         Open file to validate it as JSON and return its content.
@@ -88,14 +243,19 @@ class FeatureImportForm(forms.Form):
             if not isinstance(payload["items"], list):
                 raise ValidationError(_("Item 'items' must be a list"))
 
-            # Build registry of existing titles
-            existing_titles = {k: [] for k, v in Feature.SCOPE_CHOICES}
+            scopes = {k for k, v in Feature.SCOPE_CHOICES}
+            plugins = set(settings.BLOCKS_KNOWED_FEATURES_PLUGINS)
+            allow_multiple = settings.BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES is True
+
+            # Registry of already validated items on their scope and title
+            seen = set()
 
             # Check for some errors from items
             error_lines = []
             for i, feature in enumerate(payload["items"], start=1):
                 # Get missing field or empty values from loaded items
                 if (
+                    not isinstance(feature, dict) or
                     not feature.get("title", "") or not feature.get("value", "") or
                     not feature.get("scope", "") or not feature.get("plugins", "")
                 ):
@@ -103,35 +263,32 @@ class FeatureImportForm(forms.Form):
                     error_lines.append(msg.format(i))
 
                 # Check we have a knowed scope
-                elif feature["scope"] not in [k for k, v in Feature.SCOPE_CHOICES]:
+                elif feature["scope"] not in scopes:
                     msg = _("#{} define a scope choice that is not enabled")
                     error_lines.append(msg.format(i))
 
                 # Check we have only well known plugin names
-                elif len([
-                    item
-                    for item in feature["plugins"]
-                    if item not in settings.BLOCKS_KNOWED_FEATURES_PLUGINS
-                ]) > 0:
+                elif not plugins.issuperset(feature["plugins"]):
                     msg = _("#{} define a plugin name that is not enabled")
                     error_lines.append(msg.format(i))
 
                 # Check for duplicate title per scope
-                elif feature["title"] in existing_titles[feature["scope"]]:
+                elif (feature["scope"], feature["title"]) in seen:
                     msg = _("#{} define a title that already exists")
                     error_lines.append(msg.format(i))
 
-                # Almost everything seems ok, finally use value validator before
-                # storing item
+                # Almost everything seems ok, finally check value like its validator
+                # before storing item
+                elif find_invalid_css_classname(
+                    feature["value"],
+                    allow_multiple=allow_multiple,
+                ) is not None:
+                    msg = _("#{} has invalid CSS classname(s)")
+                    error_lines.append(msg.format(i))
+
+                # Everything is ok, store item as an existing one
                 else:
-                    try:
-                        validate_css_classname(feature["value"])
-                    except ValidationError:
-                        msg = _("#{} has invalid CSS classname(s)")
-                        error_lines.append(msg.format(i))
-                    # Everything is ok, store title as an existing one for its scope
-                    else:
-                        existing_titles[feature["scope"]].append(feature["title"])
+                    seen.add((feature["scope"], feature["title"]))
 
             # Raise error in case of any error messages
             if error_lines:
@@ -145,45 +302,106 @@ class FeatureImportForm(forms.Form):
         """
         Save elligible items from loaded JSON as feature objects.
 
+        Existing features are fetched with a single query and compared on their
+        scope and title to compute a diff which depends on the import mode:
+
+        * ``create``: Items for existing features are reported as duplicates, other
+          items are created;
+        * ``update``: Like ``create`` except items for existing features update
+          their value and plugins if they differ, else they are reported as
+          unchanged;
+        * ``sync``: Like ``update`` and existing features which are not in dump
+          items are deleted.
+
+        Features from ignored scopes are never created, updated or deleted. New and
+        updated features are validated then the diff is applied in a single
+        transaction with ``apply_features_diff()``.
+
         Arguments:
             commit (boolean): Only save objects if True.
 
         Returns:
-            dict: A dictionnary with items for effectively created and ignored items
-            from loaded JSON.
+            dict: A dictionnary with items for effectively created, updated,
+            deleted, unchanged and ignored items from loaded JSON. Deleted items are
+            built from deleted features.
         """
         created = []
+        updated = []
+        deleted = []
+        unchanged = []
         duplicates = []
         ignored = []
+        mode = self.cleaned_data.get("mode") or IMPORT_MODE_CREATE
+        disallowed_scopes = set(self.cleaned_data["scopes"])
 
         # Fetch existing items
-        existing = Feature.objects.all().query_full_payload()
-        existing_titles = {}
-        for k, v in Feature.SCOPE_CHOICES:
-            existing_titles[k] = [
-                item["title"]
-                for item in existing
-                if item["scope"] == k
-            ]
-
-        # Create features from loaded data if they do not already exists (based on
-        # their title)
+        existing = {
+            (scope, title): (pk, value, plugins)
+            for pk, scope, title, value, plugins in Feature.objects.values_list(
+                "pk", "scope", "title", "value", "plugins"
+            )
+        }
+
+        # Compare loaded data to existing features on their scope and title
+        new_features = []
+        updated_features = []
         for feature_data in self.cleaned_data["json_file"]["items"]:
-            if feature_data["title"] not in existing_titles[feature_data["scope"]]:
-                if feature_data["scope"] in self.cleaned_data["scopes"]:
-                    ignored.append(feature_data)
+            key = (feature_data["scope"], feature_data["title"])
+
+            if key in existing and mode == IMPORT_MODE_CREATE:
+                duplicates.append(feature_data)
+            elif feature_data["scope"] in disallowed_scopes:
+                ignored.append(feature_data)
+            elif key in existing:
+                pk, value, plugins = existing.pop(key)
+
+                if (
+                    value == feature_data["value"] and
+                    set(plugins) == set(feature_data["plugins"])
+                ):
+                    unchanged.append(feature_data)
                 else:
-                    new_item = Feature(**feature_data)
-                    new_item.full_clean()
-                    if commit:
-                        new_item.save()
-                    created.append(feature_data)
+                    item = Feature(pk=pk, **feature_data)
+                    item.full_clean(validate_unique=False, validate_constraints=False)
+                    updated_features.append(item)
+                    updated.append(feature_data)
             else:
-                duplicates.append(feature_data)
+                new_item = Feature(**feature_data)
+                # Uniqueness is already checked from existing items
+                new_item.full_clean(validate_unique=False, validate_constraints=False)
+                existing[key] = (None, new_item.value, new_item.plugins)
+                new_features.append(new_item)
+                created.append(feature_data)
+
+        # Remaining existing features are the ones missing from loaded data
+        deleted_pks = []
+        if mode == IMPORT_MODE_SYNC:
+            for (scope, title), (pk, value, plugins) in existing.items():
+                if pk is None or scope in disallowed_scopes:
+                    continue
+
+                deleted_pks.append(pk)
+                deleted.append({
+                    "title": title,
+                    "value": value,
+                    "scope": scope,
+                    "plugins": plugins,
+                })
+
+        if commit and (new_features or updated_features or deleted_pks):
+            apply_features_diff(
+                created=new_features,
+                updated=updated_features,
+                deleted=deleted_pks,
+            )
 
         return {
+            "mode": mode,
             "disallowed_scopes": self.cleaned_data["scopes"],
             "created": created,
+            "updated": updated,
+            "deleted": deleted,
+            "unchanged": unchanged,
             "duplicates": duplicates,
             "ignored": ignored,
         }
@@ -0,0 +1,95 @@
+from django import forms
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+
+from smart_media.widgets import FileInputButtonBase
+
+from ..utils import (
+    validate_file_size,
+    validate_zip,
+    store_images_from_zip,
+)
+
+
+class MassUploadFormMixin(forms.Form):
+    """
+    Form mixin to add a ZIP file field to create items from its images.
+
+    It is meant to be used with a ModelForm for a plugin model, the form ``Meta``
+    must include ``mass_upload`` in its ``fields``.
+
+    Be aware that this form does not finally save collected image items, they
+    are stored to attribute ``_awaiting_items`` on plugin instance. Then in the
+    common workflow, the CMS plugin using this form will get this attribute and
+    perform final save (see ``MassUploadPluginMixin``). If you use this form without
+    the CMS plugin edit workflow, you will need to reproduce it.
+
+    When setting ``BLOCKS_MASSUPLOAD_JOB_RUNNER`` is enabled, the uploaded archive
+    is stored to attribute ``_awaiting_archive`` instead so the CMS plugin creates
+    a job to process it.
+    """
+    massupload_plugin = None
+    """
+    Python path to the CMS plugin class which defines options for items creation,
+    see ``MassUploadPluginMixin.get_massupload_options()``.
+    """
+
+    mass_upload = forms.FileField(
+        label=_("Add items from a ZIP"),
+        max_length=100,
+        required=False,
+        help_text=_("Select a '*.zip' file of images to upload as new items."),
+        widget=FileInputButtonBase,
+    )
+
+    def __init__(self, *args, **kwargs):
+        self.uploaded_zip = None
+        self.uploaded_manifest = None
+
+        super().__init__(*args, **kwargs)
+
+    def get_massupload_options(self):
+        """
+        Return options for items creation from an archive.
+
+        Options are defined from the plugin class in ``massupload_plugin`` so they
+        are the same as the ones used for a job.
+
+        Returns:
+            dict: Arguments for ``store_images_from_zip()``.
+        """
+        return import_string(self.massupload_plugin).get_massupload_options()
+
+    def clean_mass_upload(self):
+        """
+        Validate uploaded ZIP archive file and temporary store it to
+        "uploaded_zip" form object attribute if valid.
+        """
+        data = self.cleaned_data["mass_upload"]
+
+        if data:
+            validate_file_size(data)
+            validate_zip(data, obj=self)
+
+        return data
+
+    def save(self, *args, **kwargs):
+        instance = super().save(*args, **kwargs)
+
+        # In job mode, archive is processed later from a job
+        if settings.BLOCKS_MASSUPLOAD_JOB_RUNNER and self.uploaded_zip:
+            self.uploaded_zip.close()
+            instance._awaiting_archive = self.cleaned_data["mass_upload"]
+            instance._awaiting_items = []
+            return instance
+
+        # Collect item from zip if any so final stage code can save them
+        instance._awaiting_items = store_images_from_zip(
+            instance,
+            self.uploaded_zip,
+            manifest=self.uploaded_manifest,
+            **self.get_massupload_options()
+        )
+
+        return instance
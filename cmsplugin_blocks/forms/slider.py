@@ -2,15 +2,24 @@ from django import forms
 
 from ..compat.editor_widget import TextEditorWidget
 from ..models.slider import Slider, SlideItem
+from .mixins import MassUploadFormMixin
 
 
-class SliderForm(forms.ModelForm):
+class SliderForm(MassUploadFormMixin, forms.ModelForm):
+    """
+    Form to manage a Slider with possible ZIP file to store items.
+
+    See ``MassUploadFormMixin`` about how items from ZIP file are saved.
+    """
+    massupload_plugin = "cmsplugin_blocks.plugins.slider.SliderPlugin"
+
     class Meta:
         model = Slider
         exclude = []
         fields = [
             "title",
             "template",
+            "mass_upload",
             "size_features",
             "color_features",
             "extra_features",
@@ -0,0 +1,218 @@
+"""
+Mass upload jobs to create plugin items from an archive outside of the admin
+request.
+
+When setting ``BLOCKS_MASSUPLOAD_JOB_RUNNER`` is empty, items are created from
+archive directly in the admin request. Else, the validated archive is stored with a
+``MassUploadJob`` object and the runner is called with this job once the current
+transaction has been committed.
+
+Available runners are:
+
+``cmsplugin_blocks.jobs.run_job``
+    Process job immediately in the current process.
+``cmsplugin_blocks.jobs.queue_job``
+    Do nothing, pending jobs are processed by management command
+    ``blocks_massupload_worker``.
+
+A running job without any progress since setting ``BLOCKS_MASSUPLOAD_JOB_TIMEOUT``
+is considered stale, like when its process has been killed, so it can be claimed
+again and processed from start.
+
+A runner can be any callable which accepts a job object. For example a custom
+runner may send job id to a task queue where a task calls ``process_job()``.
+"""
+import datetime
+import logging
+import zipfile
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models.massupload import MassUploadJob
+from .utils.archive import store_images_from_zip
+from .utils.cache import invalidate_plugins_cache
+
+
+logger = logging.getLogger("cmsplugin_blocks.jobs")
+
+
+def get_job_runner():
+    """
+    Return the job runner from settings.
+
+    Returns:
+        callable: The runner or None if job mode is disabled.
+    """
+    if not settings.BLOCKS_MASSUPLOAD_JOB_RUNNER:
+        return None
+
+    return import_string(settings.BLOCKS_MASSUPLOAD_JOB_RUNNER)
+
+
+def create_job(instance, archive):
+    """
+    Store an archive with a new job and dispatch it to the runner once current
+    transaction is committed.
+
+    Arguments:
+        instance (object): Saved plugin object to create items for.
+        archive (django.core.files.File): Validated archive file.
+
+    Returns:
+        cmsplugin_blocks.models.MassUploadJob: Created job.
+    """
+    job = MassUploadJob(plugin=instance)
+    job.archive.save(archive.name, archive, save=False)
+    job.save()
+
+    runner = get_job_runner()
+    if runner:
+        transaction.on_commit(lambda: runner(job))
+
+    return job
+
+
+def get_claimable_jobs():
+    """
+    Return jobs which can be claimed, that is pending jobs and stale running jobs.
+
+    Returns:
+        django.db.models.QuerySet: Claimable jobs.
+    """
+    claimable = Q(status=MassUploadJob.STATUS_PENDING)
+
+    if settings.BLOCKS_MASSUPLOAD_JOB_TIMEOUT is not None:
+        expired = timezone.now() - datetime.timedelta(
+            seconds=settings.BLOCKS_MASSUPLOAD_JOB_TIMEOUT
+        )
+        claimable |= Q(
+            status=MassUploadJob.STATUS_RUNNING,
+            updated_at__lt=expired,
+        )
+
+    return MassUploadJob.objects.filter(claimable)
+
+
+def claim_job(job):
+    """
+    Mark a pending or stale running job as running.
+
+    This relies on a conditional update, so only a single worker can claim a job.
+
+    Arguments:
+        job (cmsplugin_blocks.models.MassUploadJob): Job to claim.
+
+    Returns:
+        boolean: True if job has been claimed, False if it was not claimable
+        anymore.
+    """
+    claimed = get_claimable_jobs().filter(pk=job.pk).update(
+        status=MassUploadJob.STATUS_RUNNING,
+        updated_at=timezone.now(),
+    )
+
+    if claimed:
+        job.status = MassUploadJob.STATUS_RUNNING
+
+    return bool(claimed)
+
+
+def process_job(job):
+    """
+    Create items from job archive.
+
+    Job progress is updated after each archive file. Once items are saved, CMS cache
+    is invalidated for the plugin object placeholder. Finally job status is set to
+    done or failed and its archive file is removed.
+
+    Job is expected to have been claimed before, see ``claim_job()``.
+
+    Arguments:
+        job (cmsplugin_blocks.models.MassUploadJob): Job to process.
+
+    Returns:
+        cmsplugin_blocks.models.MassUploadJob: Processed job.
+    """
+    def progress(processed, total):
+        MassUploadJob.objects.filter(pk=job.pk).update(
+            processed=processed,
+            total=total,
+            updated_at=timezone.now(),
+        )
+        job.processed = processed
+        job.total = total
+
+    try:
+        instance, plugin = job.plugin.get_plugin_instance()
+        options = plugin.get_massupload_options()
+
+        with job.archive.open("rb") as fp:
+            items = store_images_from_zip(
+                instance,
+                zipfile.ZipFile(fp),
+                callback=progress,
+                **options
+            )
+
+        plugin.save_massupload_items(instance, items)
+        invalidate_plugins_cache({instance.__class__: {instance.pk}})
+    except Exception as e:
+        logger.exception("Mass upload job #%s has failed", job.pk)
+        job.status = MassUploadJob.STATUS_FAILED
+        job.error = str(e)
+    else:
+        job.status = MassUploadJob.STATUS_DONE
+        job.created = len(items)
+    finally:
+        job.archive.delete(save=False)
+        job.save()
+
+    return job
+
+
+def run_job(job):
+    """
+    Runner to process a job immediately in the current process.
+
+    Arguments:
+        job (cmsplugin_blocks.models.MassUploadJob): Job to process.
+    """
+    if claim_job(job):
+        process_job(job)
+
+
+def queue_job(job):
+    """
+    Runner which leaves job pending for the worker command.
+
+    Arguments:
+        job (cmsplugin_blocks.models.MassUploadJob): Job to process.
+    """
+    pass
+
+
+def process_pending_jobs(limit=None):
+    """
+    Claim and process pending and stale running jobs, oldest first.
+
+    Arguments:
+        limit (integer): Maximum number of jobs to process.
+
+    Returns:
+        list: Processed jobs.
+    """
+    queryset = get_claimable_jobs().order_by("created_at", "id")
+
+    if limit:
+        queryset = queryset[:limit]
+
+    processed = []
+    for job in queryset:
+        if claim_job(job):
+            processed.append(process_job(job))
+
+    return processed
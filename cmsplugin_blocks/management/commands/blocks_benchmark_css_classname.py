@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+
+from ...benchmarks.base import format_stats
+from ...benchmarks.css_classname import run
+
+
+class Command(BaseCommand):
+    """
+    Benchmark CSS class name validation.
+    """
+    help = (
+        "Benchmark the compiled CSS class name validator against the previous "
+        "character loop, for single and multiple class names modes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--values",
+            type=int,
+            default=10000,
+            help="Number of values to validate for each mode.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of measured validations of all values.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Seed for random values.",
+        )
+
+    def handle(self, *args, **options):
+        results = run(
+            values=options["values"],
+            repeat=options["repeat"],
+            seed=options["seed"],
+        )
+
+        self.stdout.write("Values: {}".format(results["values"]))
+        for mode in ("single", "multiple"):
+            self.stdout.write("{} class name(s) mode:".format(mode.capitalize()))
+            for name in ("legacy", "compiled", "list"):
+                self.stdout.write("- {}: {}".format(
+                    name.capitalize(),
+                    format_stats(results[mode][name]),
+                ))
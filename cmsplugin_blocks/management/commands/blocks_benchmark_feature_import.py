@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand
+
+from ...benchmarks.base import format_stats
+from ...benchmarks.feature_import import run
+
+
+class Command(BaseCommand):
+    """
+    Benchmark Feature import from a synthetic dump.
+    """
+    help = (
+        "Benchmark Feature import from a synthetic JSON dump. Created features are "
+        "rolled back once finished."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--features",
+            type=int,
+            default=20000,
+            help="Number of dump items.",
+        )
+        parser.add_argument(
+            "--existing",
+            type=int,
+            default=0,
+            help="Number of features to create before import, as duplicates.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Number of measured validations and saves.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Seed for random values.",
+        )
+
+    def handle(self, *args, **options):
+        results = run(
+            features=options["features"],
+            existing=options["existing"],
+            repeat=options["repeat"],
+            seed=options["seed"],
+        )
+
+        self.stdout.write(
+            "Database: {}, dump items: {}, existing features: {}".format(
+                results["vendor"],
+                results["features"],
+                results["existing"],
+            )
+        )
+        self.stdout.write("- Validation: {}".format(
+            format_stats(results["validation"])
+        ))
+        self.stdout.write("- Save: {}".format(format_stats(results["save"])))
+        self.stdout.write("- Save queries: {}".format(results["queries"]))
+        self.stdout.write("- Created: {created}, duplicates: {duplicates}".format(
+            **results["results"]
+        ))
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from ...benchmarks.base import format_stats
+from ...benchmarks.feature_indexes import run
+
+
+class Command(BaseCommand):
+    """
+    Benchmark Feature indexes on common feature filtering queries.
+    """
+    help = (
+        "Benchmark Feature indexes on common feature filtering queries. Created "
+        "features and index removals are rolled back once finished."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--features",
+            type=int,
+            default=10000,
+            help="Number of features to create.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of executions for each measured query.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Seed for random values.",
+        )
+
+    def handle(self, *args, **options):
+        if not connection.features.can_rollback_ddl:
+            raise CommandError(
+                "Database backend '{}' does not support transactional DDL, index "
+                "removals could not be rolled back.".format(connection.vendor)
+            )
+
+        results = run(
+            features=options["features"],
+            repeat=options["repeat"],
+            seed=options["seed"],
+        )
+
+        self.stdout.write("Database: {}, created features: {}".format(
+            results["vendor"],
+            results["features"],
+        ))
+
+        for label, states in results["queries"].items():
+            self.stdout.write("")
+            self.stdout.write(self.style.MIGRATE_HEADING(label))
+            for state, result in states.items():
+                self.stdout.write("- {}: {}".format(
+                    state,
+                    format_stats(result["stats"]),
+                ))
+                for line in result["plan"].splitlines():
+                    self.stdout.write("    {}".format(line))
@@ -0,0 +1,89 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...benchmarks.base import format_stats
+from ...benchmarks.render import BENCHMARKED_PLUGINS, run
+
+
+class Command(BaseCommand):
+    """
+    Benchmark plugin rendering.
+    """
+    help = (
+        "Benchmark plugin rendering with generated objects. Created objects are "
+        "rolled back once finished."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--plugin",
+            action="append",
+            dest="plugins",
+            default=[],
+            help=(
+                "Name of a plugin to benchmark, like 'Album'. Can be given many "
+                "times. Default to all plugins."
+            ),
+        )
+        parser.add_argument(
+            "--objects",
+            type=int,
+            default=5,
+            help="Number of plugin objects in placeholder.",
+        )
+        parser.add_argument(
+            "--items",
+            type=int,
+            default=10,
+            help="Number of items for each Accordion, Album and Slider object.",
+        )
+        parser.add_argument(
+            "--features",
+            type=int,
+            default=3,
+            help="Number of features for each scope.",
+        )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=1,
+            help="Depth of nested containers in each Container object.",
+        )
+        parser.add_argument(
+            "--children",
+            type=int,
+            default=3,
+            help="Number of Card objects in each nested container.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of measured renders for each plugin.",
+        )
+
+    def handle(self, *args, **options):
+        unknowns = [
+            name
+            for name in options["plugins"]
+            if name not in BENCHMARKED_PLUGINS
+        ]
+        if unknowns:
+            raise CommandError("Unknown plugin(s): {}".format(", ".join(unknowns)))
+
+        results = run(
+            plugins=options["plugins"],
+            objects=options["objects"],
+            items=options["items"],
+            features=options["features"],
+            depth=options["depth"],
+            children=options["children"],
+            repeat=options["repeat"],
+        )
+
+        for name, result in results["plugins"].items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write("- Render: {}".format(format_stats(result["stats"])))
+            self.stdout.write("- Queries: {}".format(result["queries"]))
+            self.stdout.write("- Memory peak: {:.1f}KiB".format(
+                result["memory"] / 1024
+            ))
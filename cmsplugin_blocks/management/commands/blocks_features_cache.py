@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...utils.features import get_feature_models, rebuild_features_cache
+
+
+class Command(BaseCommand):
+    """
+    Rebuild denormalized features of all plugin objects.
+    """
+    help = (
+        "Rebuild denormalized features of all plugin objects. You should run it once "
+        "after enabling setting 'BLOCKS_FEATURE_DENORMALIZED'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            default=[],
+            help=(
+                "Name of a plugin model to process, like 'Album'. Can be given "
+                "multiple times. If not given, all plugin models are processed."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Maximum number of objects to process at once.",
+        )
+
+    def handle(self, *args, **options):
+        models = {model.__name__: model for model in get_feature_models()}
+
+        unknowns = [name for name in options["models"] if name not in models]
+        if unknowns:
+            raise CommandError(
+                "Unknown plugin model(s): {}. Available ones are: {}".format(
+                    ", ".join(unknowns),
+                    ", ".join(sorted(models.keys())),
+                )
+            )
+
+        names = options["models"] or sorted(models.keys())
+
+        for name in names:
+            count = rebuild_features_cache(
+                models[name],
+                batch_size=options["batch_size"],
+            )
+            self.stdout.write("- {}: {} object(s)".format(name, count))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Feature
+from ...utils.dumps import DUMP_FORMATS, iter_feature_dump
+
+
+class Command(BaseCommand):
+    """
+    Export features into a dump.
+    """
+    help = (
+        "Export all features into a JSON dump, with the same format than the admin "
+        "export view. The dump is streamed so features are never all loaded in "
+        "memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            nargs="?",
+            default="-",
+            help="File path to write dump to. If not given or '-', dump is written "
+                 "to standard output.",
+        )
+        parser.add_argument(
+            "--format",
+            default="json",
+            choices=sorted(DUMP_FORMATS.keys()),
+            help="Dump format. Only 'json' and 'compact' formats can be imported.",
+        )
+
+    def handle(self, *args, **options):
+        chunks = iter_feature_dump(
+            Feature.objects.all().order_by("scope", "title"),
+            output_format=options["format"],
+        )
+
+        if options["path"] == "-":
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        try:
+            with open(options["path"], "w", encoding="utf-8") as fp:
+                for chunk in chunks:
+                    fp.write(chunk)
+        except OSError as e:
+            raise CommandError("Unable to write dump: {}".format(str(e)))
@@ -0,0 +1,110 @@
+import shutil
+import sys
+import tempfile
+
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+
+from ...forms import FeatureImportForm
+from ...forms.feature import IMPORT_MODE_CHOICES, IMPORT_MODE_CREATE
+from ...models import Feature
+
+
+class Command(BaseCommand):
+    """
+    Import features from a dump.
+    """
+    help = (
+        "Import features from a JSON dump, with the same format and validation than "
+        "the admin import view."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            nargs="?",
+            default="-",
+            help="File path to read dump from. If not given or '-', dump is read "
+                 "from standard input.",
+        )
+        parser.add_argument(
+            "--mode",
+            default=IMPORT_MODE_CREATE,
+            choices=[name for name, label in IMPORT_MODE_CHOICES],
+            help=(
+                "Import mode, 'create' only creates missing features, 'update' "
+                "also updates existing ones and 'sync' also deletes existing "
+                "features missing from the dump."
+            ),
+        )
+        parser.add_argument(
+            "--ignore-scope",
+            action="append",
+            dest="scopes",
+            default=[],
+            choices=[name for name, label in Feature.SCOPE_CHOICES],
+            help=(
+                "Scope to ignore from dump, its features are never created, "
+                "updated or deleted. Can be given multiple times."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate dump and output stats without saving anything.",
+        )
+
+    def get_dump_file(self, path):
+        """
+        Return the dump file to import.
+
+        Standard input can not be seeked so it is copied in a temporary file which
+        must be closed once done.
+
+        Arguments:
+            path (string): Dump file path or ``-`` for standard input.
+
+        Returns:
+            django.core.files.File: Dump file.
+        """
+        if path == "-":
+            fp = tempfile.TemporaryFile()
+            shutil.copyfileobj(sys.stdin.buffer, fp)
+            fp.seek(0)
+            return File(fp, name="stdin.json")
+
+        try:
+            return File(open(path, "rb"))
+        except OSError as e:
+            raise CommandError("Unable to read dump: {}".format(str(e)))
+
+    def handle(self, *args, **options):
+        dump = self.get_dump_file(options["path"])
+
+        try:
+            form = FeatureImportForm(
+                {"mode": options["mode"], "scopes": options["scopes"]},
+                {"json_file": dump},
+            )
+
+            if not form.is_valid():
+                raise CommandError("\n".join([
+                    str(message)
+                    for field, errors in form.errors.as_data().items()
+                    for error in errors
+                    for message in error.messages
+                ]))
+
+            results = form.save(commit=not options["dry_run"])
+        finally:
+            dump.close()
+
+        if options["dry_run"]:
+            self.stdout.write("Dry run, nothing has been saved.")
+
+        for name in ("created", "updated", "deleted", "unchanged", "duplicates",
+                     "ignored"):
+            self.stdout.write("- {}: {}".format(
+                name.capitalize(),
+                len(results[name]),
+            ))
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...jobs import process_pending_jobs
+
+
+class Command(BaseCommand):
+    """
+    Process pending mass upload jobs.
+    """
+    help = (
+        "Process pending mass upload jobs. It runs until interrupted unless "
+        "'--once' is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process pending jobs then exit.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait between two lookups for pending jobs.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Maximum number of jobs to process on each lookup.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            for job in process_pending_jobs(limit=options["limit"]):
+                self.stdout.write("Job {}: {}".format(job, job.get_progress_display()))
+
+            if options["once"]:
+                break
+
+            time.sleep(options["interval"])
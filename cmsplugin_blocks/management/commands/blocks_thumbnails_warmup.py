@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...plugins.accordion import AccordionPlugin
+from ...plugins.album import AlbumPlugin
+from ...plugins.slider import SliderPlugin
+
+
+ITEMS_PLUGINS = (AccordionPlugin, AlbumPlugin, SliderPlugin)
+"""
+Plugins with items to process.
+"""
+
+
+class Command(BaseCommand):
+    """
+    Generate thumbnails of all plugin items.
+    """
+    help = (
+        "Generate thumbnails of Album, Slider and Accordion items for every template "
+        "choice, so they are not generated on first render."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            default=[],
+            help=(
+                "Name of a plugin model to process, like 'Album'. Can be given "
+                "multiple times. If not given, all plugin models are processed."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of items to fetch at once.",
+        )
+
+    def handle(self, *args, **options):
+        plugins = {plugin.model.__name__: plugin for plugin in ITEMS_PLUGINS}
+
+        unknowns = [name for name in options["models"] if name not in plugins]
+        if unknowns:
+            raise CommandError(
+                "Unknown plugin model(s): {}. Available ones are: {}".format(
+                    ", ".join(unknowns),
+                    ", ".join(sorted(plugins.keys())),
+                )
+            )
+
+        names = options["models"] or sorted(plugins.keys())
+
+        for name in names:
+            plugin = plugins[name]
+            items = plugin.get_items_queryset().exclude(
+                **{plugin.items_image_attrname: ""}
+            ).exclude(
+                **{plugin.items_image_attrname + "__isnull": True}
+            )
+
+            count = plugin.warmup_items_thumbnails(
+                items.iterator(chunk_size=options["batch_size"]),
+                force=True,
+            )
+            self.stdout.write("- {}: {} thumbnail(s)".format(name, count))
@@ -1,7 +1,44 @@
+from django.conf import settings
 from django.db import models
 
 
+def get_plugin_lookup(name, prefix=""):
+    """
+    Build lookup to filter features allowed for a plugin.
+
+    When setting ``BLOCKS_FEATURE_INDEXED_PLUGINS`` is enabled, this is an exact
+    lookup on the indexed ``FeaturePlugin`` relation, else it is a ``contains``
+    lookup on the comma separated string from ``Feature.plugins``.
+
+    Arguments:
+        name (string): Plugin name.
+
+    Keyword Arguments:
+        prefix (string): Optional prefix for lookup name, like ``feature__`` to
+            filter from a model related to Feature.
+
+    Returns:
+        dict: Lookup to give to queryset ``filter()``.
+    """
+    if settings.BLOCKS_FEATURE_INDEXED_PLUGINS:
+        return {prefix + "allowed_plugins__name": name}
+
+    return {prefix + "plugins__contains": name}
+
+
 class FeatureQuerySet(models.QuerySet):
+    def filter_plugin(self, name):
+        """
+        Filter features allowed for given plugin name.
+
+        Arguments:
+            name (string): Plugin name.
+
+        Returns:
+            models.QuerySet: Result queryset.
+        """
+        return self.filter(**get_plugin_lookup(name))
+
     def query_full_payload(self):
         """
         Return a queryset of item values with all feature fields except id.
@@ -0,0 +1,145 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cmsplugin_blocks", "0013_card_link_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="accordion",
+            name="features_cache",
+            field=models.TextField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="accordion",
+            name="scoped_features_cache",
+            field=models.JSONField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="scoped features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="album",
+            name="features_cache",
+            field=models.TextField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="album",
+            name="scoped_features_cache",
+            field=models.JSONField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="scoped features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="card",
+            name="features_cache",
+            field=models.TextField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="card",
+            name="scoped_features_cache",
+            field=models.JSONField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="scoped features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="container",
+            name="features_cache",
+            field=models.TextField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="container",
+            name="scoped_features_cache",
+            field=models.JSONField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="scoped features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="hero",
+            name="features_cache",
+            field=models.TextField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="hero",
+            name="scoped_features_cache",
+            field=models.JSONField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="scoped features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="slider",
+            name="features_cache",
+            field=models.TextField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="features cache",
+            ),
+        ),
+        migrations.AddField(
+            model_name="slider",
+            name="scoped_features_cache",
+            field=models.JSONField(
+                blank=True,
+                default=None,
+                editable=False,
+                null=True,
+                verbose_name="scoped features cache",
+            ),
+        ),
+    ]
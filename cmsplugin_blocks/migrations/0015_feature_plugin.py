@@ -0,0 +1,138 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:27
+
+import cmsplugin_blocks.choices_helpers
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_feature_plugins(apps, schema_editor):
+    """
+    Create allowed plugin relations from existing feature plugins.
+    """
+    Feature = apps.get_model("cmsplugin_blocks", "Feature")
+    FeaturePlugin = apps.get_model("cmsplugin_blocks", "FeaturePlugin")
+
+    FeaturePlugin.objects.bulk_create(
+        [
+            FeaturePlugin(feature_id=pk, name=name)
+            for pk, plugins in Feature.objects.values_list("id", "plugins")
+            for name in sorted(set(plugins))
+            if name
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cmsplugin_blocks", "0014_features_cache"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="accordion",
+            name="color_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("color", "Accordion"), related_name="%(app_label)s_%(class)s_color_related", to="cmsplugin_blocks.feature", verbose_name="color features"),
+        ),
+        migrations.AlterField(
+            model_name="accordion",
+            name="extra_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("extra", "Accordion"), related_name="%(app_label)s_%(class)s_extra_related", to="cmsplugin_blocks.feature", verbose_name="extra features"),
+        ),
+        migrations.AlterField(
+            model_name="accordion",
+            name="size_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("size", "Accordion"), related_name="%(app_label)s_%(class)s_size_related", to="cmsplugin_blocks.feature", verbose_name="size features"),
+        ),
+        migrations.AlterField(
+            model_name="album",
+            name="color_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("color", "Album"), related_name="%(app_label)s_%(class)s_color_related", to="cmsplugin_blocks.feature", verbose_name="color features"),
+        ),
+        migrations.AlterField(
+            model_name="album",
+            name="extra_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("extra", "Album"), related_name="%(app_label)s_%(class)s_extra_related", to="cmsplugin_blocks.feature", verbose_name="extra features"),
+        ),
+        migrations.AlterField(
+            model_name="album",
+            name="size_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("size", "Album"), related_name="%(app_label)s_%(class)s_size_related", to="cmsplugin_blocks.feature", verbose_name="size features"),
+        ),
+        migrations.AlterField(
+            model_name="card",
+            name="color_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("color", "Card"), related_name="%(app_label)s_%(class)s_color_related", to="cmsplugin_blocks.feature", verbose_name="color features"),
+        ),
+        migrations.AlterField(
+            model_name="card",
+            name="extra_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("extra", "Card"), related_name="%(app_label)s_%(class)s_extra_related", to="cmsplugin_blocks.feature", verbose_name="extra features"),
+        ),
+        migrations.AlterField(
+            model_name="card",
+            name="size_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("size", "Card"), related_name="%(app_label)s_%(class)s_size_related", to="cmsplugin_blocks.feature", verbose_name="size features"),
+        ),
+        migrations.AlterField(
+            model_name="container",
+            name="color_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("color", "Container"), related_name="%(app_label)s_%(class)s_color_related", to="cmsplugin_blocks.feature", verbose_name="color features"),
+        ),
+        migrations.AlterField(
+            model_name="container",
+            name="extra_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("extra", "Container"), related_name="%(app_label)s_%(class)s_extra_related", to="cmsplugin_blocks.feature", verbose_name="extra features"),
+        ),
+        migrations.AlterField(
+            model_name="container",
+            name="size_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("size", "Container"), related_name="%(app_label)s_%(class)s_size_related", to="cmsplugin_blocks.feature", verbose_name="size features"),
+        ),
+        migrations.AlterField(
+            model_name="hero",
+            name="color_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("color", "Hero"), related_name="%(app_label)s_%(class)s_color_related", to="cmsplugin_blocks.feature", verbose_name="color features"),
+        ),
+        migrations.AlterField(
+            model_name="hero",
+            name="extra_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("extra", "Hero"), related_name="%(app_label)s_%(class)s_extra_related", to="cmsplugin_blocks.feature", verbose_name="extra features"),
+        ),
+        migrations.AlterField(
+            model_name="hero",
+            name="size_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("size", "Hero"), related_name="%(app_label)s_%(class)s_size_related", to="cmsplugin_blocks.feature", verbose_name="size features"),
+        ),
+        migrations.AlterField(
+            model_name="slider",
+            name="color_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("color", "Slider"), related_name="%(app_label)s_%(class)s_color_related", to="cmsplugin_blocks.feature", verbose_name="color features"),
+        ),
+        migrations.AlterField(
+            model_name="slider",
+            name="extra_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("extra", "Slider"), related_name="%(app_label)s_%(class)s_extra_related", to="cmsplugin_blocks.feature", verbose_name="extra features"),
+        ),
+        migrations.AlterField(
+            model_name="slider",
+            name="size_features",
+            field=models.ManyToManyField(blank=True, limit_choices_to=cmsplugin_blocks.choices_helpers.FeatureChoicesLimit("size", "Slider"), related_name="%(app_label)s_%(class)s_size_related", to="cmsplugin_blocks.feature", verbose_name="size features"),
+        ),
+        migrations.CreateModel(
+            name="FeaturePlugin",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=50, verbose_name="name")),
+                ("feature", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="allowed_plugins", to="cmsplugin_blocks.feature")),
+            ],
+            options={
+                "verbose_name": "Feature allowed plugin",
+                "verbose_name_plural": "Feature allowed plugins",
+                "indexes": [models.Index(fields=["name", "feature"], name="blocks_feature_plugin_name")],
+                "constraints": [models.UniqueConstraint(fields=("feature", "name"), name="blocks_unique_feature_plugin")],
+            },
+        ),
+        migrations.RunPython(fill_feature_plugins, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cmsplugin_blocks", "0015_feature_plugin"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="feature",
+            index=models.Index(fields=["scope", "value"], name="blocks_feature_scope_value"),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cms", "0045_pageurl_site_unique_path"),
+        ("cmsplugin_blocks", "0016_feature_scope_value_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MassUploadJob",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("archive", models.FileField(blank=True, max_length=255, upload_to="blocks/massupload/%y/%m", verbose_name="archive")),
+                ("status", models.CharField(choices=[("pending", "Pending"), ("running", "Running"), ("done", "Done"), ("failed", "Failed")], default="pending", max_length=10, verbose_name="status")),
+                ("total", models.PositiveIntegerField(default=0, verbose_name="total")),
+                ("processed", models.PositiveIntegerField(default=0, verbose_name="processed")),
+                ("created", models.PositiveIntegerField(default=0, verbose_name="created")),
+                ("error", models.TextField(blank=True, default="", verbose_name="error")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="created at")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="updated at")),
+                ("plugin", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="blocks_massupload_jobs", to="cms.cmsplugin", verbose_name="plugin")),
+            ],
+            options={
+                "verbose_name": "Mass upload job",
+                "verbose_name_plural": "Mass upload jobs",
+                "ordering": ["-created_at", "-id"],
+                "indexes": [models.Index(fields=["status", "created_at"], name="blocks_massupload_status")],
+            },
+        ),
+    ]
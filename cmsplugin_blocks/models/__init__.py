@@ -2,8 +2,9 @@ from .accordion import Accordion, AccordionItem
 from .album import Album, AlbumItem
 from .card import Card
 from .container import Container
-from .feature import Feature
+from .feature import Feature, FeaturePlugin
 from .hero import Hero
+from .massupload import MassUploadJob
 from .slider import Slider, SlideItem
 
 
@@ -15,7 +16,9 @@ __all__ = [
     "Card",
     "Container",
     "Feature",
+    "FeaturePlugin",
     "Hero",
+    "MassUploadJob",
     "Slider",
     "SlideItem",
 ]
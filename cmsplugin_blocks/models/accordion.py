@@ -18,7 +18,7 @@ from smart_media.mixins import SmartFormatMixin
 from smart_media.modelfields import SmartMediaField
 
 from ..choices_helpers import (
-    get_accordion_template_choices, get_accordion_template_default
+    FeatureChoicesLimit, get_accordion_template_choices, get_accordion_template_default
 )
 from .mixins import FeatureMixinModel
 
@@ -67,7 +67,7 @@ class Accordion(FeatureMixinModel, CMSPlugin):
         verbose_name=_("size features"),
         related_name="%(app_label)s_%(class)s_size_related",
         blank=True,
-        limit_choices_to={"scope": "size", "plugins__contains": "Accordion"},
+        limit_choices_to=FeatureChoicesLimit("size", "Accordion"),
     )
     """
     Optional related size features.
@@ -78,7 +78,7 @@ class Accordion(FeatureMixinModel, CMSPlugin):
         verbose_name=_("color features"),
         related_name="%(app_label)s_%(class)s_color_related",
         blank=True,
-        limit_choices_to={"scope": "color", "plugins__contains": "Accordion"},
+        limit_choices_to=FeatureChoicesLimit("color", "Accordion"),
     )
     """
     Optional related color features.
@@ -89,12 +89,36 @@ class Accordion(FeatureMixinModel, CMSPlugin):
         verbose_name=_("extra features"),
         related_name="%(app_label)s_%(class)s_extra_related",
         blank=True,
-        limit_choices_to={"scope": "extra", "plugins__contains": "Accordion"},
+        limit_choices_to=FeatureChoicesLimit("extra", "Accordion"),
     )
     """
     Optional related extra features.
     """
 
+    features_cache = models.TextField(
+        _("features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``flat_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
+    scoped_features_cache = models.JSONField(
+        _("scoped features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``scoped_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
     def __str__(self):
         return Truncator(strip_tags(self.title)).words(
             settings.BLOCKS_MODEL_TRUNCATION_LENGTH,
@@ -26,7 +26,9 @@ from cms.models.pluginmodel import CMSPlugin
 from smart_media.mixins import SmartFormatMixin
 from smart_media.modelfields import SmartMediaField
 
-from ..choices_helpers import get_album_template_choices, get_album_template_default
+from ..choices_helpers import (
+    FeatureChoicesLimit, get_album_template_choices, get_album_template_default,
+)
 from .mixins import FeatureMixinModel
 
 
@@ -62,7 +64,7 @@ class Album(FeatureMixinModel, CMSPlugin):
         verbose_name=_("size features"),
         related_name="%(app_label)s_%(class)s_size_related",
         blank=True,
-        limit_choices_to={"scope": "size", "plugins__contains": "Album"},
+        limit_choices_to=FeatureChoicesLimit("size", "Album"),
     )
     """
     Optional related size features.
@@ -73,7 +75,7 @@ class Album(FeatureMixinModel, CMSPlugin):
         verbose_name=_("color features"),
         related_name="%(app_label)s_%(class)s_color_related",
         blank=True,
-        limit_choices_to={"scope": "color", "plugins__contains": "Album"},
+        limit_choices_to=FeatureChoicesLimit("color", "Album"),
     )
     """
     Optional related color features.
@@ -84,12 +86,36 @@ class Album(FeatureMixinModel, CMSPlugin):
         verbose_name=_("extra features"),
         related_name="%(app_label)s_%(class)s_extra_related",
         blank=True,
-        limit_choices_to={"scope": "extra", "plugins__contains": "Album"},
+        limit_choices_to=FeatureChoicesLimit("extra", "Album"),
     )
     """
     Optional related extra features.
     """
 
+    features_cache = models.TextField(
+        _("features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``flat_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
+    scoped_features_cache = models.JSONField(
+        _("scoped features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``scoped_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
     def __str__(self):
         return Truncator(strip_tags(self.title)).words(
             settings.BLOCKS_MODEL_TRUNCATION_LENGTH,
@@ -13,7 +13,9 @@ from cms.models.pluginmodel import CMSPlugin
 from smart_media.mixins import SmartFormatMixin
 from smart_media.modelfields import SmartMediaField
 
-from ..choices_helpers import get_card_template_choices, get_card_template_default
+from ..choices_helpers import (
+    FeatureChoicesLimit, get_card_template_choices, get_card_template_default,
+)
 from .mixins import FeatureMixinModel
 
 
@@ -108,7 +110,7 @@ class Card(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("size features"),
         related_name="%(app_label)s_%(class)s_size_related",
         blank=True,
-        limit_choices_to={"scope": "size", "plugins__contains": "Card"},
+        limit_choices_to=FeatureChoicesLimit("size", "Card"),
     )
     """
     Optional related size features.
@@ -119,7 +121,7 @@ class Card(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("color features"),
         related_name="%(app_label)s_%(class)s_color_related",
         blank=True,
-        limit_choices_to={"scope": "color", "plugins__contains": "Card"},
+        limit_choices_to=FeatureChoicesLimit("color", "Card"),
     )
     """
     Optional related color features.
@@ -130,12 +132,36 @@ class Card(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("extra features"),
         related_name="%(app_label)s_%(class)s_extra_related",
         blank=True,
-        limit_choices_to={"scope": "extra", "plugins__contains": "Card"},
+        limit_choices_to=FeatureChoicesLimit("extra", "Card"),
     )
     """
     Optional related extra features.
     """
 
+    features_cache = models.TextField(
+        _("features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``flat_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
+    scoped_features_cache = models.JSONField(
+        _("scoped features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``scoped_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
     class Meta:
         verbose_name = _("Card")
         verbose_name_plural = _("Cards")
@@ -15,6 +15,7 @@ from smart_media.mixins import SmartFormatMixin
 from smart_media.modelfields import SmartMediaField
 
 from ..choices_helpers import (
+    FeatureChoicesLimit,
     get_container_template_choices,
     get_container_template_default,
 )
@@ -85,7 +86,7 @@ class Container(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("size features"),
         related_name="%(app_label)s_%(class)s_size_related",
         blank=True,
-        limit_choices_to={"scope": "size", "plugins__contains": "Container"},
+        limit_choices_to=FeatureChoicesLimit("size", "Container"),
     )
     """
     Optional related size features.
@@ -96,7 +97,7 @@ class Container(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("color features"),
         related_name="%(app_label)s_%(class)s_color_related",
         blank=True,
-        limit_choices_to={"scope": "color", "plugins__contains": "Container"},
+        limit_choices_to=FeatureChoicesLimit("color", "Container"),
     )
     """
     Optional related color features.
@@ -107,12 +108,36 @@ class Container(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("extra features"),
         related_name="%(app_label)s_%(class)s_extra_related",
         blank=True,
-        limit_choices_to={"scope": "extra", "plugins__contains": "Container"},
+        limit_choices_to=FeatureChoicesLimit("extra", "Container"),
     )
     """
     Optional related extra features.
     """
 
+    features_cache = models.TextField(
+        _("features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``flat_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
+    scoped_features_cache = models.JSONField(
+        _("scoped features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``scoped_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.content = force_str(self.content)
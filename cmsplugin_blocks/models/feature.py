@@ -75,6 +75,83 @@ class Feature(models.Model):
                 fields=["scope", "title"],
             ),
         ]
+        # Filters on scope alone already use the index from unique constraint
+        indexes = [
+            models.Index(
+                name="blocks_feature_scope_value",
+                fields=["scope", "value"],
+            ),
+        ]
 
     def __str__(self):
         return "{}:{}".format(self.get_scope_display(), self.title)
+
+    def sync_allowed_plugins(self, created=False):
+        """
+        Synchronize ``FeaturePlugin`` relations from ``plugins`` field value.
+
+        This is called from signal ``post_save`` receiver, before related plugin
+        objects are updated since they may be rebuilt from these relations.
+
+        Keyword Arguments:
+            created (boolean): If True, the object is assumed to be newly created so
+                there is no existing relation to check.
+        """
+        names = set(self.plugins)
+
+        if created:
+            existing = set()
+        else:
+            existing = set(self.allowed_plugins.values_list("name", flat=True))
+
+        if existing - names:
+            self.allowed_plugins.filter(name__in=existing - names).delete()
+
+        if names - existing:
+            FeaturePlugin.objects.bulk_create([
+                FeaturePlugin(feature=self, name=name)
+                for name in sorted(names - existing)
+            ])
+
+
+class FeaturePlugin(models.Model):
+    """
+    Indexed relation of a plugin name allowed for a Feature.
+
+    This is a denormalization of ``Feature.plugins`` which is automatically
+    maintained when a Feature is saved. It is used to filter features for a plugin
+    with an exact and indexed lookup when setting ``BLOCKS_FEATURE_INDEXED_PLUGINS``
+    is enabled.
+    """
+    feature = models.ForeignKey(
+        Feature,
+        related_name="allowed_plugins",
+        on_delete=models.CASCADE,
+    )
+
+    name = models.CharField(
+        _("name"),
+        max_length=50,
+    )
+    """
+    Plugin name as from ``Feature.plugins`` items.
+    """
+
+    class Meta:
+        verbose_name = _("Feature allowed plugin")
+        verbose_name_plural = _("Feature allowed plugins")
+        constraints = [
+            models.UniqueConstraint(
+                name="blocks_unique_feature_plugin",
+                fields=["feature", "name"],
+            ),
+        ]
+        indexes = [
+            models.Index(
+                name="blocks_feature_plugin_name",
+                fields=["name", "feature"],
+            ),
+        ]
+
+    def __str__(self):
+        return "{}:{}".format(self.feature_id, self.name)
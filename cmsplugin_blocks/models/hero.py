@@ -13,7 +13,9 @@ from cms.models.pluginmodel import CMSPlugin
 from smart_media.mixins import SmartFormatMixin
 from smart_media.modelfields import SmartMediaField
 
-from ..choices_helpers import get_hero_template_choices, get_hero_template_default
+from ..choices_helpers import (
+    FeatureChoicesLimit, get_hero_template_choices, get_hero_template_default,
+)
 from .mixins import FeatureMixinModel
 
 
@@ -70,7 +72,7 @@ class Hero(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("size features"),
         related_name="%(app_label)s_%(class)s_size_related",
         blank=True,
-        limit_choices_to={"scope": "size", "plugins__contains": "Hero"},
+        limit_choices_to=FeatureChoicesLimit("size", "Hero"),
     )
     """
     Optional related size features.
@@ -81,7 +83,7 @@ class Hero(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("color features"),
         related_name="%(app_label)s_%(class)s_color_related",
         blank=True,
-        limit_choices_to={"scope": "color", "plugins__contains": "Hero"},
+        limit_choices_to=FeatureChoicesLimit("color", "Hero"),
     )
     """
     Optional related color features.
@@ -92,12 +94,36 @@ class Hero(SmartFormatMixin, FeatureMixinModel, CMSPlugin):
         verbose_name=_("extra features"),
         related_name="%(app_label)s_%(class)s_extra_related",
         blank=True,
-        limit_choices_to={"scope": "extra", "plugins__contains": "Hero"},
+        limit_choices_to=FeatureChoicesLimit("extra", "Hero"),
     )
     """
     Optional related extra features.
     """
 
+    features_cache = models.TextField(
+        _("features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``flat_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
+    scoped_features_cache = models.JSONField(
+        _("scoped features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``scoped_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.content = force_str(self.content)
@@ -0,0 +1,131 @@
+"""
+A mass upload job stores an uploaded archive to create items of a plugin object from
+a background task instead of the admin request.
+
+Jobs are only involved when setting ``BLOCKS_MASSUPLOAD_JOB_RUNNER`` is enabled, see
+``cmsplugin_blocks.jobs`` for details.
+"""
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class MassUploadJob(models.Model):
+    """
+    Mass upload job for items of a plugin object.
+    """
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _("Pending")),
+        (STATUS_RUNNING, _("Running")),
+        (STATUS_DONE, _("Done")),
+        (STATUS_FAILED, _("Failed")),
+    )
+
+    plugin = models.ForeignKey(
+        "cms.CMSPlugin",
+        verbose_name=_("plugin"),
+        related_name="blocks_massupload_jobs",
+        on_delete=models.CASCADE,
+    )
+    """
+    Required plugin object to create items for.
+    """
+
+    archive = models.FileField(
+        _("archive"),
+        max_length=255,
+        blank=True,
+        upload_to="blocks/massupload/%y/%m",
+    )
+    """
+    Uploaded archive file, it is removed once job is finished.
+    """
+
+    status = models.CharField(
+        _("status"),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    """
+    Current job status.
+    """
+
+    total = models.PositiveIntegerField(
+        _("total"),
+        default=0,
+    )
+    """
+    Number of archive files to process, known once job is running.
+    """
+
+    processed = models.PositiveIntegerField(
+        _("processed"),
+        default=0,
+    )
+    """
+    Number of processed archive files.
+    """
+
+    created = models.PositiveIntegerField(
+        _("created"),
+        default=0,
+    )
+    """
+    Number of created items once job is done.
+    """
+
+    error = models.TextField(
+        _("error"),
+        blank=True,
+        default="",
+    )
+    """
+    Error message if job has failed.
+    """
+
+    created_at = models.DateTimeField(
+        _("created at"),
+        auto_now_add=True,
+    )
+
+    updated_at = models.DateTimeField(
+        _("updated at"),
+        auto_now=True,
+    )
+
+    class Meta:
+        verbose_name = _("Mass upload job")
+        verbose_name_plural = _("Mass upload jobs")
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            models.Index(
+                name="blocks_massupload_status",
+                fields=["status", "created_at"],
+            ),
+        ]
+
+    def __str__(self):
+        return "#{} {}".format(self.pk, self.get_status_display())
+
+    def get_progress_display(self):
+        """
+        Return a human readable progress.
+
+        Returns:
+            string: Progress message depending job status.
+        """
+        if self.status == self.STATUS_PENDING:
+            return _("Waiting to be processed")
+        elif self.status == self.STATUS_RUNNING:
+            return _("Processing: {processed}/{total} files").format(
+                processed=self.processed,
+                total=self.total,
+            )
+        elif self.status == self.STATUS_DONE:
+            return _("Done: {created} item(s) created").format(created=self.created)
+
+        return _("Failed: {error}").format(error=self.error)
@@ -1,7 +1,10 @@
 import itertools
 
+from django.conf import settings
+from django.db.models import Value
 from django.utils.functional import cached_property
 
+from ..registry import feature_registry
 from .feature import Feature
 
 
@@ -16,7 +19,7 @@ class FeatureMixinModel:
             verbose_name=_("size features"),
             related_name="%(app_label)s_%(class)s_size_related",
             blank=True,
-            limit_choices_to={"scope": "size", "plugins__contains": NAME},
+            limit_choices_to=FeatureChoicesLimit("size", NAME),
         )
 
         color_features = models.ManyToManyField(
@@ -24,7 +27,7 @@ class FeatureMixinModel:
             verbose_name=_("color features"),
             related_name="%(app_label)s_%(class)s_color_related",
             blank=True,
-            limit_choices_to={"scope": "color", "plugins__contains": NAME},
+            limit_choices_to=FeatureChoicesLimit("color", NAME),
         )
 
         extra_features = models.ManyToManyField(
@@ -32,11 +35,31 @@ class FeatureMixinModel:
             verbose_name=_("extra features"),
             related_name="%(app_label)s_%(class)s_extra_related",
             blank=True,
-            limit_choices_to={"scope": "extra", "plugins__contains": NAME},
+            limit_choices_to=FeatureChoicesLimit("extra", NAME),
+        )
+
+        features_cache = models.TextField(
+            _("features cache"),
+            blank=True,
+            null=True,
+            default=None,
+            editable=False,
+        )
+
+        scoped_features_cache = models.JSONField(
+            _("scoped features cache"),
+            blank=True,
+            null=True,
+            default=None,
+            editable=False,
         )
 
     Where ``NAME`` is the key name to use to limit choices, this name is a model name
-    and must exists in ``settings.BLOCKS_KNOWED_FEATURES_PLUGINS``.
+    and must exists in ``settings.BLOCKS_KNOWED_FEATURES_PLUGINS``. And
+    ``FeatureChoicesLimit`` comes from ``cmsplugin_blocks.choices_helpers``.
+
+    Fields ``features_cache`` and ``scoped_features_cache`` are used to store
+    denormalized features when setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
     """
     def copy_relations(self, oldinstance):
         """
@@ -66,8 +89,7 @@ class FeatureMixinModel:
         """
         queryset = self.size_features.filter(
             scope="size",
-            plugins__contains=self.__class__.__name__,
-        )
+        ).filter_plugin(self.__class__.__name__)
         return queryset.query_minimal_payload()
 
     def query_color_features(self):
@@ -81,8 +103,7 @@ class FeatureMixinModel:
         """
         queryset = self.color_features.filter(
             scope="color",
-            plugins__contains=self.__class__.__name__,
-        )
+        ).filter_plugin(self.__class__.__name__)
         return queryset.query_minimal_payload()
 
     def query_extra_features(self):
@@ -96,10 +117,51 @@ class FeatureMixinModel:
         """
         queryset = self.extra_features.filter(
             scope="extra",
-            plugins__contains=self.__class__.__name__,
-        )
+        ).filter_plugin(self.__class__.__name__)
         return queryset.query_minimal_payload()
 
+    @classmethod
+    def get_features_relations(cls):
+        """
+        Return relation tables details for each feature scope.
+
+        Returns:
+            list: List of tuples ``(scope, through, link_attrname)`` where
+            ``through`` is the relation table model and ``link_attrname`` is the name
+            of relation table column which refers to a plugin object.
+        """
+        relations = []
+        for scope, v in Feature.SCOPE_CHOICES:
+            field = cls._meta.get_field("{}_features".format(scope))
+            relations.append((
+                scope,
+                field.remote_field.through,
+                "{}_id".format(field.m2m_field_name()),
+            ))
+
+        return relations
+
+    def query_feature_relations(self):
+        """
+        Build queryset for listing all related feature ids with the scope of their
+        relation field.
+
+        This only reads the relation tables, Feature table is not involved.
+
+        Returns:
+            Queryset: A 'values_list' queryset of tuples ``(feature_id, scope)``.
+        """
+        querysets = [
+            through.objects.filter(
+                **{link_attrname: self.pk}
+            ).annotate(
+                relation_scope=Value(scope)
+            ).values_list("feature_id", "relation_scope")
+            for scope, through, link_attrname in self.get_features_relations()
+        ]
+
+        return querysets[0].union(*querysets[1:], all=True)
+
     @cached_property
     def query_features(self):
         """
@@ -109,9 +171,19 @@ class FeatureMixinModel:
         session and it will only perform queryset request once. This is a memory cache
         not a proper cache as from Django’s cache framework.
 
+        When setting ``BLOCKS_FEATURE_REGISTRY`` is enabled, features are resolved
+        from the Feature registry so only the relation tables are queried.
+
         Returns:
-            Queryset: A 'value_list' queryset of features.
+            Queryset or list: A 'value_list' queryset of features, or a list of
+            feature dictionnaries when resolved from registry.
         """
+        if settings.BLOCKS_FEATURE_REGISTRY:
+            return feature_registry.resolve(
+                self.query_feature_relations(),
+                self.__class__.__name__,
+            )
+
         sizes = self.query_size_features()
         colors = self.query_color_features()
         extras = self.query_extra_features()
@@ -119,23 +191,13 @@ class FeatureMixinModel:
         # Join results from queryset unions
         return extras.union(sizes, colors)
 
-    def scoped_features(self):
+    def build_scoped_features(self):
         """
-        Return a structured data of feature items per scope.
+        Build a structured data of feature items per scope from related features.
 
         Returns:
             dict: Dictionnary where each key is a scope and associated value is a list
-            of string for feature value. Scope without any item is still present but
-            as an empty list. This enforces classnames uniqueness on each scope value.
-
-            Example: ::
-                >>> some_object_with_features.scoped_features()
-
-                {
-                    "size": ["bar", "foo"],
-                    "color": [],
-                    "extra": ["foo", "ping"],
-                }
+            of string for feature value. See ``scoped_features()`` for details.
         """
         # Join results from queryset unions
         values = list(self.query_features)
@@ -151,10 +213,69 @@ class FeatureMixinModel:
             for k, v in Feature.SCOPE_CHOICES
         }
 
+    def build_flat_features(self):
+        """
+        Build a string of feature items from related features.
+
+        Returns:
+            string: Feature items divided by a whitespace. See ``flat_features()``
+            for details.
+        """
+        # Join results from queryset unions
+        parts = " ".join([item["value"] for item in self.query_features])
+
+        # Split again classnames to remove duplicate and reorder
+        return " ".join(sorted(set(parts.split())))
+
+    def use_features_cache(self, attrname):
+        """
+        Check if the denormalized features can be used for given cache field.
+
+        Arguments:
+            attrname (string): Cache field name.
+
+        Returns:
+            boolean: True if setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled and
+            cache field has been filled.
+        """
+        return (
+            settings.BLOCKS_FEATURE_DENORMALIZED and
+            getattr(self, attrname, None) is not None
+        )
+
+    def scoped_features(self):
+        """
+        Return a structured data of feature items per scope.
+
+        When setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled, value is read from
+        field ``scoped_features_cache`` if it has been filled.
+
+        Returns:
+            dict: Dictionnary where each key is a scope and associated value is a list
+            of string for feature value. Scope without any item is still present but
+            as an empty list. This enforces classnames uniqueness on each scope value.
+
+            Example: ::
+                >>> some_object_with_features.scoped_features()
+
+                {
+                    "size": ["bar", "foo"],
+                    "color": [],
+                    "extra": ["foo", "ping"],
+                }
+        """
+        if self.use_features_cache("scoped_features_cache"):
+            return self.scoped_features_cache
+
+        return self.build_scoped_features()
+
     def flat_features(self):
         """
         Merge features items into a single string with a whitespace divider.
 
+        When setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled, value is read from
+        field ``features_cache`` if it has been filled.
+
         Returns:
             string: Feature items divided by a whitespace. This enforces classnames
             uniqueness.
@@ -164,8 +285,7 @@ class FeatureMixinModel:
 
                 "bar foo ping"
         """
-        # Join results from queryset unions
-        parts = " ".join([item["value"] for item in self.query_features])
+        if self.use_features_cache("features_cache"):
+            return self.features_cache
 
-        # Split again classnames to remove duplicate and reorder
-        return " ".join(sorted(set(parts.split())))
+        return self.build_flat_features()
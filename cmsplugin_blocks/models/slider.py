@@ -17,7 +17,9 @@ from cms.models.pluginmodel import CMSPlugin
 from smart_media.mixins import SmartFormatMixin
 from smart_media.modelfields import SmartMediaField
 
-from ..choices_helpers import get_slider_template_choices, get_slider_template_default
+from ..choices_helpers import (
+    FeatureChoicesLimit, get_slider_template_choices, get_slider_template_default,
+)
 from .mixins import FeatureMixinModel
 
 
@@ -53,7 +55,7 @@ class Slider(FeatureMixinModel, CMSPlugin):
         verbose_name=_("size features"),
         related_name="%(app_label)s_%(class)s_size_related",
         blank=True,
-        limit_choices_to={"scope": "size", "plugins__contains": "Slider"},
+        limit_choices_to=FeatureChoicesLimit("size", "Slider"),
     )
     """
     Optional related size features.
@@ -64,7 +66,7 @@ class Slider(FeatureMixinModel, CMSPlugin):
         verbose_name=_("color features"),
         related_name="%(app_label)s_%(class)s_color_related",
         blank=True,
-        limit_choices_to={"scope": "color", "plugins__contains": "Slider"},
+        limit_choices_to=FeatureChoicesLimit("color", "Slider"),
     )
     """
     Optional related color features.
@@ -75,12 +77,36 @@ class Slider(FeatureMixinModel, CMSPlugin):
         verbose_name=_("extra features"),
         related_name="%(app_label)s_%(class)s_extra_related",
         blank=True,
-        limit_choices_to={"scope": "extra", "plugins__contains": "Slider"},
+        limit_choices_to=FeatureChoicesLimit("extra", "Slider"),
     )
     """
     Optional related extra features.
     """
 
+    features_cache = models.TextField(
+        _("features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``flat_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
+    scoped_features_cache = models.JSONField(
+        _("scoped features cache"),
+        blank=True,
+        null=True,
+        default=None,
+        editable=False,
+    )
+    """
+    Denormalized result of ``scoped_features()``, automatically maintained when
+    setting ``BLOCKS_FEATURE_DENORMALIZED`` is enabled.
+    """
+
     def __str__(self):
         return Truncator(strip_tags(self.title)).words(
             settings.BLOCKS_MODEL_TRUNCATION_LENGTH,
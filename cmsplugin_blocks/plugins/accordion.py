@@ -8,9 +8,18 @@ from ..admin.accordion import AccordionItemAdmin
 from ..choices_helpers import get_accordion_template_default
 from ..forms.accordion import AccordionForm
 from ..models.accordion import Accordion
+from .mixins import (
+    MassUploadPluginMixin, OrderedItemsPluginMixin, PlaceholderPrefetchPluginMixin,
+)
 
 
-class AccordionPlugin(SmartAdminMixin, CMSPluginBase):
+class AccordionPlugin(
+    PlaceholderPrefetchPluginMixin,
+    MassUploadPluginMixin,
+    OrderedItemsPluginMixin,
+    SmartAdminMixin,
+    CMSPluginBase,
+):
     """
     Accordion interface is able to add/edit/remove accordion items as inline forms.
     """
@@ -18,6 +27,7 @@ class AccordionPlugin(SmartAdminMixin, CMSPluginBase):
     name = _("Accordion")
     model = Accordion
     form = AccordionForm
+    items_relation = "accordion_item"
     inlines = (AccordionItemAdmin,)
     render_template = get_accordion_template_default()
     cache = True
@@ -39,8 +49,16 @@ class AccordionPlugin(SmartAdminMixin, CMSPluginBase):
                     "title",
                 ),
             }),
+            (_("Options"), {
+                "fields": (
+                    "mass_upload",
+                ),
+            }),
         ]
 
+        if self.has_massupload_status(obj):
+            fieldsets[-1][1]["fields"] += ("massupload_status",)
+
         display_features = True
         if display_features:
             fieldsets.append((_("Features"), {
@@ -56,7 +74,7 @@ class AccordionPlugin(SmartAdminMixin, CMSPluginBase):
     def render(self, context, instance, placeholder):
         context = super().render(context, instance, placeholder)
         self.render_template = instance.template
-        slides = instance.accordion_item.all().order_by("order")
+        slides = self.get_ordered_items(instance)
         context.update({
             "instance": instance,
             "slides": slides,
@@ -8,9 +8,18 @@ from ..admin.album import AlbumItemAdmin
 from ..choices_helpers import get_album_template_default
 from ..forms.album import AlbumForm
 from ..models.album import Album
+from .mixins import (
+    MassUploadPluginMixin, OrderedItemsPluginMixin, PlaceholderPrefetchPluginMixin,
+)
 
 
-class AlbumPlugin(SmartAdminMixin, CMSPluginBase):
+class AlbumPlugin(
+    PlaceholderPrefetchPluginMixin,
+    MassUploadPluginMixin,
+    OrderedItemsPluginMixin,
+    SmartAdminMixin,
+    CMSPluginBase,
+):
     """
     Album interface is able to add/edit/remove items within inline forms.
 
@@ -20,6 +29,7 @@ class AlbumPlugin(SmartAdminMixin, CMSPluginBase):
     name = _("Album")
     model = Album
     form = AlbumForm
+    items_relation = "album_item"
     inlines = (AlbumItemAdmin,)
     render_template = get_album_template_default()
     cache = True
@@ -47,6 +57,9 @@ class AlbumPlugin(SmartAdminMixin, CMSPluginBase):
             }),
         ]
 
+        if self.has_massupload_status(obj):
+            fieldsets[-1][1]["fields"] += ("massupload_status",)
+
         display_features = True
         if display_features:
             fieldsets.append((_("Features"), {
@@ -62,19 +75,9 @@ class AlbumPlugin(SmartAdminMixin, CMSPluginBase):
     def render(self, context, instance, placeholder):
         context = super().render(context, instance, placeholder)
         self.render_template = instance.template
-        ressources = instance.album_item.all().order_by("order")
+        ressources = self.get_ordered_items(instance)
         context.update({
             "instance": instance,
             "ressources": ressources,
         })
         return context
-
-    def save_model(self, request, obj, form, change):
-        result = super().save_model(request, obj, form, change)
-
-        # Save awaiting item in memory
-        for item in getattr(obj, "_awaiting_items", []):
-            item.album = obj
-            item.save()
-
-        return result
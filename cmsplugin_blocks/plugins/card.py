@@ -7,9 +7,10 @@ from smart_media.admin import SmartAdminMixin
 from ..choices_helpers import get_card_template_default
 from ..forms.card import CardForm
 from ..models.card import Card
+from .mixins import PlaceholderPrefetchPluginMixin
 
 
-class CardPlugin(SmartAdminMixin, CMSPluginBase):
+class CardPlugin(PlaceholderPrefetchPluginMixin, SmartAdminMixin, CMSPluginBase):
     module = _("Blocks")
     name = _("Card")
     model = Card
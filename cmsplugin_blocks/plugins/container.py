@@ -7,9 +7,10 @@ from smart_media.admin import SmartAdminMixin
 from ..choices_helpers import get_container_template_default
 from ..forms.container import ContainerForm
 from ..models.container import Container
+from .mixins import PlaceholderPrefetchPluginMixin
 
 
-class ContainerPlugin(SmartAdminMixin, CMSPluginBase):
+class ContainerPlugin(PlaceholderPrefetchPluginMixin, SmartAdminMixin, CMSPluginBase):
     module = _("Blocks")
     name = _("Container")
     model = Container
@@ -7,9 +7,10 @@ from smart_media.admin import SmartAdminMixin
 from ..choices_helpers import get_hero_template_default
 from ..forms.hero import HeroForm
 from ..models.hero import Hero
+from .mixins import PlaceholderPrefetchPluginMixin
 
 
-class HeroPlugin(SmartAdminMixin, CMSPluginBase):
+class HeroPlugin(PlaceholderPrefetchPluginMixin, SmartAdminMixin, CMSPluginBase):
     module = _("Blocks")
     name = _("Hero")
     model = Hero
@@ -0,0 +1,374 @@
+from django.conf import settings
+from django.contrib import admin
+from django.db import router, transaction
+from django.db.models import Prefetch, prefetch_related_objects
+from django.db.models.signals import post_save, pre_save
+from django.utils.translation import gettext_lazy as _
+
+from cms.models import Placeholder
+
+from ..jobs import create_job
+from ..models.massupload import MassUploadJob
+from ..utils.prefetch import prefetch_placeholder
+from ..utils.thumbnails import generate_thumbnails, get_templates_thumbnails
+
+
+class PlaceholderPrefetchPluginMixin:
+    """
+    Plugin mixin to prefetch features and items for all plugin objects of the
+    rendered placeholder.
+
+    The prefetch is done once for a placeholder, on the first rendered plugin object
+    which implements this mixin. It is disabled when setting
+    ``BLOCKS_PLACEHOLDER_PREFETCH`` is false.
+
+    .. Note::
+        DjangoCMS only gives the placeholder slot name to plugin ``render()``, the
+        placeholder object is retrieved from the one it attaches to the root plugin
+        objects it renders. So plugin objects nested in a plugin which does not
+        implement this mixin are not prefetched.
+    """
+    def get_rendered_placeholder(self, instance, placeholder):
+        """
+        Return the placeholder object which is being rendered.
+
+        Arguments:
+            instance (object): Plugin model object.
+            placeholder (object): Placeholder object or slot name as given to
+                ``render()``.
+
+        Returns:
+            cms.models.Placeholder: The placeholder object or None if it can not be
+            retrieved without a query.
+        """
+        if isinstance(placeholder, Placeholder):
+            return placeholder
+
+        return getattr(instance, "_placeholder_cache", None)
+
+    def render(self, context, instance, placeholder):
+        if settings.BLOCKS_PLACEHOLDER_PREFETCH:
+            rendered = self.get_rendered_placeholder(instance, placeholder)
+            if rendered is not None:
+                prefetch_placeholder(rendered)
+
+        return super().render(context, instance, placeholder)
+
+
+class OrderedItemsPluginMixin:
+    """
+    Plugin mixin to load ordered items of a container plugin object.
+
+    Items are loaded from the reverse relation named from ``items_relation``
+    attribute and ordered on ``items_ordering`` fields.
+
+    If items have already been prefetched on the plugin object (like from
+    ``prefetch_items()``) they are used as is without any query, so a prefetch done
+    from elsewhere with a custom ``Prefetch`` queryset must respect the same
+    ordering.
+
+    When setting ``BLOCKS_THUMBNAIL_WARMUP`` is enabled, thumbnails of items saved
+    from plugin form are generated for every template choice, see
+    ``warmup_items_thumbnails()``.
+    """
+    items_relation = None
+    """
+    Name of reverse relation from plugin model to its items.
+    """
+
+    items_ordering = ("order",)
+    """
+    Field names to order items on.
+    """
+
+    items_image_attrname = "image"
+    """
+    Name of item field for image to generate thumbnails.
+    """
+
+    @classmethod
+    def get_items_queryset(cls):
+        """
+        Return the queryset to use for items.
+
+        Returns:
+            django.db.models.QuerySet: Ordered queryset for item model.
+        """
+        field = cls.model._meta.get_field(cls.items_relation)
+
+        return field.related_model.objects.order_by(*cls.items_ordering)
+
+    @classmethod
+    def get_items_prefetch(cls):
+        """
+        Return the prefetch for plugin object items.
+
+        Returns:
+            django.db.models.Prefetch: Prefetch on items relation with the ordered
+            queryset.
+        """
+        return Prefetch(cls.items_relation, queryset=cls.get_items_queryset())
+
+    @classmethod
+    def prefetch_items(cls, instances):
+        """
+        Prefetch ordered items for all given plugin objects with a single query.
+
+        Plugin objects which already have their items prefetched are left
+        untouched.
+
+        Arguments:
+            instances (list): Plugin model objects.
+
+        Returns:
+            list: Plugin objects for which items have been prefetched.
+        """
+        pending = [
+            instance
+            for instance in instances
+            if cls.items_relation not in getattr(
+                instance, "_prefetched_objects_cache", {}
+            )
+        ]
+
+        if pending:
+            prefetch_related_objects(pending, cls.get_items_prefetch())
+
+        return pending
+
+    @classmethod
+    def get_items_thumbnails(cls):
+        """
+        Return thumbnail specifications for items from every template choice of
+        plugin model.
+
+        Returns:
+            list: Specifications as tuples ``(geometry, options)``.
+        """
+        field = cls.model._meta.get_field("template")
+
+        return get_templates_thumbnails(
+            [name for name, label in field.flatchoices],
+            exclude_root="instance",
+        )
+
+    @classmethod
+    def warmup_items_thumbnails(cls, items, force=False):
+        """
+        Generate thumbnails of item images so the first render does not have to.
+
+        Arguments:
+            items (iterable): Saved item objects.
+
+        Keyword Arguments:
+            force (boolean): Generate thumbnails even if setting
+                ``BLOCKS_THUMBNAIL_WARMUP`` is disabled.
+
+        Returns:
+            integer: Number of generated thumbnails.
+        """
+        if not force and not settings.BLOCKS_THUMBNAIL_WARMUP:
+            return 0
+
+        return generate_thumbnails(
+            (getattr(item, cls.items_image_attrname) for item in items),
+            cls.get_items_thumbnails(),
+        )
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+
+        # Generate thumbnails for items added or changed from inline forms
+        items = []
+        for formset in formsets:
+            if formset.model is self.get_items_queryset().model:
+                items.extend(formset.new_objects)
+                items.extend([item for item, fields in formset.changed_objects])
+
+        if items:
+            self.warmup_items_thumbnails(items)
+
+    def get_ordered_items(self, instance):
+        """
+        Return ordered items for a plugin object.
+
+        Arguments:
+            instance (object): Plugin model object.
+
+        Returns:
+            django.db.models.QuerySet: Ordered items queryset, its results come from
+            prefetch cache when there is one.
+        """
+        manager = getattr(instance, self.items_relation)
+
+        if self.items_relation in getattr(instance, "_prefetched_objects_cache", {}):
+            return manager.all()
+
+        return manager.all().order_by(*self.items_ordering)
+
+
+class MassUploadPluginMixin:
+    """
+    Plugin mixin to save items created from a mass upload archive.
+
+    The plugin form is expected to collect items from archive into plugin object
+    attribute ``_awaiting_items``, or to put the archive into plugin object attribute
+    ``_awaiting_archive`` when setting ``BLOCKS_MASSUPLOAD_JOB_RUNNER`` is enabled.
+
+    This requires ``items_relation`` attribute from ``OrderedItemsPluginMixin``.
+    """
+    readonly_fields = ("massupload_status",)
+
+    massupload_image_attrname = "image"
+    """
+    Name of item field to store image.
+    """
+
+    massupload_label_attrname = "title"
+    """
+    Name of item field to fill with image filename or title from manifest.
+    """
+
+    massupload_alt_attrname = "image_alt"
+    """
+    Name of item field to fill with alternative text from manifest.
+    """
+
+    massupload_order_attrname = "order"
+    """
+    Name of item field to fill with order from manifest.
+    """
+
+    @classmethod
+    def get_massupload_options(cls):
+        """
+        Return options for items creation from an archive.
+
+        Returns:
+            dict: Arguments ``item_model``, ``link_attrname``, ``image_attrname``,
+            ``label_attrname``, ``alt_attrname`` and ``order_attrname`` for
+            ``store_images_from_zip()``.
+        """
+        field = cls.model._meta.get_field(cls.items_relation)
+
+        return {
+            "item_model": field.related_model,
+            "link_attrname": field.field.name,
+            "image_attrname": cls.massupload_image_attrname,
+            "label_attrname": cls.massupload_label_attrname,
+            "alt_attrname": cls.massupload_alt_attrname,
+            "order_attrname": cls.massupload_order_attrname,
+        }
+
+    @classmethod
+    def save_massupload_items(cls, instance, items):
+        """
+        Save items created from an archive.
+
+        Item image files have already been stored, so items are inserted with
+        ``bulk_create()`` which performs a query for each batch instead of a query
+        for each item. Since ``bulk_create()`` does not send any signal, signals
+        ``pre_save`` and ``post_save`` are explicitly sent for each item when
+        item model has receivers for them.
+
+        Note that item objects only get their primary key from ``bulk_create()``
+        with database backends which support it, like PostgreSQL and SQLite.
+
+        Arguments:
+            instance (object): Saved plugin object.
+            items (list): Item objects to save.
+
+        Returns:
+            list: Saved item objects.
+        """
+        if not items:
+            return []
+
+        options = cls.get_massupload_options()
+        item_model = options["item_model"]
+        using = router.db_for_write(item_model, instance=instance)
+
+        with transaction.atomic(using=using):
+            for item in items:
+                setattr(item, options["link_attrname"], instance)
+
+                if pre_save.has_listeners(item_model):
+                    pre_save.send(
+                        sender=item_model,
+                        instance=item,
+                        raw=False,
+                        using=using,
+                        update_fields=None,
+                    )
+
+            saved = item_model.objects.using(using).bulk_create(items)
+
+            if post_save.has_listeners(item_model):
+                for item in saved:
+                    post_save.send(
+                        sender=item_model,
+                        instance=item,
+                        created=True,
+                        raw=False,
+                        using=using,
+                        update_fields=None,
+                    )
+
+        cls.warmup_items_thumbnails(saved)
+
+        return saved
+
+    def get_massupload_job(self, obj):
+        """
+        Return the latest mass upload job of a plugin object.
+
+        Arguments:
+            obj (object): Plugin object.
+
+        Returns:
+            cmsplugin_blocks.models.MassUploadJob: The job or None if there is none.
+        """
+        if obj is None or obj.pk is None:
+            return None
+
+        return MassUploadJob.objects.filter(plugin_id=obj.pk).first()
+
+    def has_massupload_status(self, obj):
+        """
+        Check if the mass upload status should be displayed in plugin form.
+
+        Jobs are only looked up when setting ``BLOCKS_MASSUPLOAD_JOB_RUNNER`` is
+        enabled, so the plugin form does not perform a query for nothing.
+
+        Arguments:
+            obj (object): Plugin object.
+
+        Returns:
+            boolean: True if job mode is enabled and plugin object has a job.
+        """
+        if not settings.BLOCKS_MASSUPLOAD_JOB_RUNNER:
+            return False
+
+        return self.get_massupload_job(obj) is not None
+
+    @admin.display(description=_("Mass upload status"))
+    def massupload_status(self, obj):
+        """
+        Read only field to display progress of the latest mass upload job.
+        """
+        job = self.get_massupload_job(obj)
+
+        return job.get_progress_display() if job else "-"
+
+    def save_model(self, request, obj, form, change):
+        result = super().save_model(request, obj, form, change)
+
+        # Save awaiting item in memory
+        self.save_massupload_items(obj, getattr(obj, "_awaiting_items", []))
+
+        # Or create job for awaiting archive
+        archive = getattr(obj, "_awaiting_archive", None)
+        if archive:
+            create_job(obj, archive)
+
+        return result
@@ -8,9 +8,18 @@ from ..admin.slider import SlideItemAdmin
 from ..choices_helpers import get_slider_template_default
 from ..forms.slider import SliderForm
 from ..models.slider import Slider
+from .mixins import (
+    MassUploadPluginMixin, OrderedItemsPluginMixin, PlaceholderPrefetchPluginMixin,
+)
 
 
-class SliderPlugin(SmartAdminMixin, CMSPluginBase):
+class SliderPlugin(
+    PlaceholderPrefetchPluginMixin,
+    MassUploadPluginMixin,
+    OrderedItemsPluginMixin,
+    SmartAdminMixin,
+    CMSPluginBase,
+):
     """
     Slider interface is able to add/edit/remove slide items as inline forms.
     """
@@ -18,6 +27,7 @@ class SliderPlugin(SmartAdminMixin, CMSPluginBase):
     name = _("Slider")
     model = Slider
     form = SliderForm
+    items_relation = "slide_item"
     inlines = (SlideItemAdmin,)
     render_template = get_slider_template_default()
     cache = True
@@ -38,8 +48,16 @@ class SliderPlugin(SmartAdminMixin, CMSPluginBase):
                     "title",
                 ),
             }),
+            (_("Options"), {
+                "fields": (
+                    "mass_upload",
+                ),
+            }),
         ]
 
+        if self.has_massupload_status(obj):
+            fieldsets[-1][1]["fields"] += ("massupload_status",)
+
         display_features = True
         if display_features:
             fieldsets.append((_("Features"), {
@@ -55,7 +73,7 @@ class SliderPlugin(SmartAdminMixin, CMSPluginBase):
     def render(self, context, instance, placeholder):
         context = super().render(context, instance, placeholder)
         self.render_template = instance.template
-        slides = instance.slide_item.all().order_by("order")
+        slides = self.get_ordered_items(instance)
         context.update({
             "instance": instance,
             "slides": slides,
@@ -0,0 +1,172 @@
+"""
+A process-wide registry of Feature objects.
+
+Feature objects change rarely compared to how often they are resolved during plugin
+rendering, so instead of querying them again for each rendered plugin, the registry
+loads them all once and keeps them in memory indexed on their id. Plugin feature
+resolution then only needs to read feature ids from relations.
+
+The registry is automatically cleared when a Feature object is saved or deleted, it
+will be loaded again on its next usage. It is cleared again once the current
+transaction is committed, since a concurrent render may have loaded the previous
+features in the meantime. A load which started before a clear never replaces the
+cleared registry.
+
+.. Warning::
+    The registry lives in process memory, signals only clear it for the current
+    process. If your project is served with multiple processes (like with multiple
+    Gunicorn workers), features edited from one process won't be updated in other
+    processes until they are restarted. This is why the registry is only used when
+    setting ``BLOCKS_FEATURE_REGISTRY`` is enabled.
+
+    Also note that queryset methods which do not send signals, like ``update()`` or
+    ``bulk_create()``, won't clear the registry, code using them should call
+    ``feature_registry.clear_on_commit()`` itself.
+"""
+import threading
+
+from django.db import transaction
+
+
+class FeatureRegistry:
+    """
+    Registry of all Feature objects indexed on their id.
+
+    Each registry item is a dictionnary with feature ``value``, ``scope`` and
+    ``plugins``.
+    """
+    def __init__(self):
+        self._features = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self):
+        """
+        Return True if registry has been loaded, else False.
+        """
+        return self._features is not None
+
+    def query_features(self):
+        """
+        Query all features from database.
+
+        Returns:
+            dict: Features indexed on their id.
+        """
+        # Lazy import to avoid circular import since models use the registry
+        from .models import Feature
+
+        return {
+            pk: {
+                "value": value,
+                "scope": scope,
+                "plugins": plugins,
+            }
+            for pk, value, scope, plugins in Feature.objects.values_list(
+                "id", "value", "scope", "plugins"
+            )
+        }
+
+    def load(self):
+        """
+        Load all features from database into the registry.
+
+        Database is queried outside of the lock, so loaded features are only stored
+        if registry has not been cleared in the meantime, else they may be outdated.
+
+        Returns:
+            dict: Loaded features indexed on their id.
+        """
+        with self._lock:
+            generation = self._generation
+
+        features = self.query_features()
+
+        with self._lock:
+            if self._generation == generation:
+                self._features = features
+
+        return features
+
+    def clear(self):
+        """
+        Drop all registry items, registry will be loaded again on its next usage.
+        """
+        with self._lock:
+            self._generation += 1
+            self._features = None
+
+    def clear_on_commit(self, using=None):
+        """
+        Clear registry now and again once the current transaction is committed.
+
+        Keyword Arguments:
+            using (string): Database alias of the transaction.
+        """
+        self.clear()
+        transaction.on_commit(self.clear, using=using)
+
+    def get_features(self):
+        """
+        Return all registry features, load them first if needed.
+
+        Returns:
+            dict: Features indexed on their id.
+        """
+        features = self._features
+
+        if features is None:
+            features = self.load()
+
+        return features
+
+    def get(self, pk):
+        """
+        Return a feature from registry.
+
+        Arguments:
+            pk (integer): Feature object id.
+
+        Returns:
+            dict: Feature item or None if there is no feature for given id.
+        """
+        return self.get_features().get(pk)
+
+    def resolve(self, relations, plugin):
+        """
+        Resolve feature relations to a list of feature payloads.
+
+        Scope and allowed plugin are enforced like with
+        ``FeatureMixinModel.query_size_features()`` and its siblings, excepted
+        that plugin name is matched exactly instead of a ``contains`` lookup.
+
+        Arguments:
+            relations (iterable): Iterable of tuples ``(feature_id, scope)`` where
+                scope is the one from the relation field the feature is related
+                from.
+            plugin (string): Plugin name which feature must be allowed for.
+
+        Returns:
+            list: List of feature dictionnaries with ``value`` and ``scope`` items,
+            like the items returned from ``FeatureQuerySet.query_minimal_payload()``.
+        """
+        features = self.get_features()
+
+        payload = []
+        for pk, scope in relations:
+            feature = features.get(pk)
+            if (
+                feature is not None and
+                feature["scope"] == scope and
+                plugin in feature["plugins"]
+            ):
+                payload.append({"value": feature["value"], "scope": scope})
+
+        return payload
+
+
+feature_registry = FeatureRegistry()
+"""
+The registry instance to use, there is no reason to create another one.
+"""
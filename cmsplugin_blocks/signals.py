@@ -0,0 +1,170 @@
+"""
+Signal receivers for application models.
+
+They are connected from the application config ``ready()`` method.
+"""
+import contextlib
+import contextvars
+import functools
+
+from django.conf import settings
+from django.db import transaction
+
+from .registry import feature_registry
+from .utils.cache import invalidate_plugins_cache, is_cms_cache_enabled
+from .utils.features import get_related_plugin_ids, rebuild_related_features_cache
+
+
+skip_feature_receivers = contextvars.ContextVar(
+    "cmsplugin_blocks_skip_feature_receivers",
+    default=False,
+)
+"""
+Flag to skip Feature deletion receivers, see ``bulk_feature_deletion()``.
+"""
+
+
+@contextlib.contextmanager
+def bulk_feature_deletion():
+    """
+    Context manager to skip Feature deletion receivers for each deleted object.
+
+    This is meant for a bulk deletion which clears the Feature registry and updates
+    related plugin objects once for all deleted features itself, instead of
+    querying related plugin objects for each one.
+    """
+    token = skip_feature_receivers.set(True)
+    try:
+        yield
+    finally:
+        skip_feature_receivers.reset(token)
+
+
+def update_related_plugins(related, using=None):
+    """
+    Update plugin objects after their features have changed.
+
+    Denormalized features are rebuilt if enabled, then DjangoCMS cache is
+    invalidated for placeholders which contain these plugin objects. Cache is only
+    invalidated once the current transaction is committed, else a concurrent
+    request could cache again the previous render before commit.
+
+    Arguments:
+        related (dict): Set of plugin object ids indexed on their model.
+
+    Keyword Arguments:
+        using (string): Database alias of the transaction.
+    """
+    if not related:
+        return
+
+    if settings.BLOCKS_FEATURE_DENORMALIZED:
+        rebuild_related_features_cache(related)
+
+    if is_cms_cache_enabled():
+        transaction.on_commit(
+            functools.partial(invalidate_plugins_cache, related),
+            using=using,
+        )
+
+
+def feature_saved(sender, instance, created=False, raw=False, using=None,
+                  update_fields=None, **kwargs):
+    """
+    When a Feature object has been saved, synchronize its allowed plugin
+    relations, clear the Feature registry and update related plugin objects.
+
+    Allowed plugin relations are synchronized first since related plugin objects
+    may be rebuilt from them. Raw saves from fixtures are left untouched.
+
+    A newly created Feature can not have any related plugin objects yet.
+    """
+    if not raw and (update_fields is None or "plugins" in update_fields):
+        instance.sync_allowed_plugins(created=created)
+
+    feature_registry.clear_on_commit(using=using)
+
+    if not created and not raw and (
+        settings.BLOCKS_FEATURE_DENORMALIZED or is_cms_cache_enabled()
+    ):
+        update_related_plugins(
+            get_related_plugin_ids([instance.pk]),
+            using=using,
+        )
+
+
+def feature_deleting(sender, instance, **kwargs):
+    """
+    Before a Feature object is deleted, collect its related plugin objects since
+    relations won't exist anymore once deleted.
+    """
+    if skip_feature_receivers.get():
+        return
+
+    if settings.BLOCKS_FEATURE_DENORMALIZED or is_cms_cache_enabled():
+        instance._related_plugin_ids = get_related_plugin_ids([instance.pk])
+
+
+def feature_deleted(sender, instance, using=None, **kwargs):
+    """
+    When a Feature object has been deleted, clear the Feature registry and update
+    plugin objects which were related to it.
+    """
+    if skip_feature_receivers.get():
+        return
+
+    feature_registry.clear_on_commit(using=using)
+
+    update_related_plugins(
+        getattr(instance, "_related_plugin_ids", None),
+        using=using,
+    )
+
+
+def plugin_features_changed(sender, instance, action, reverse, model, pk_set,
+                            using=None, **kwargs):
+    """
+    When plugin features relations have changed, update denormalized features of
+    involved plugin objects.
+
+    Relations can be changed from a plugin object (``reverse`` is false and
+    ``instance`` is a plugin object) or from a Feature object (``reverse`` is true
+    and ``model`` is the plugin model). In the latter case, DjangoCMS cache of
+    involved plugin objects is also invalidated since plugin objects have not been
+    edited from DjangoCMS.
+    """
+    if reverse:
+        if not settings.BLOCKS_FEATURE_DENORMALIZED and not is_cms_cache_enabled():
+            return
+
+        # Plugin ids are not given on clear so we collect them before
+        if action == "pre_clear":
+            link_attrname = [
+                attrname
+                for scope, through, attrname in model.get_features_relations()
+                if through is sender
+            ][0]
+            instance._cleared_plugin_ids = set(
+                sender.objects.filter(feature_id=instance.pk).values_list(
+                    link_attrname, flat=True
+                )
+            )
+        elif action == "post_clear":
+            update_related_plugins(
+                {model: getattr(instance, "_cleared_plugin_ids", set())},
+                using=using,
+            )
+        elif action in ("post_add", "post_remove"):
+            update_related_plugins({model: pk_set}, using=using)
+    elif (
+        settings.BLOCKS_FEATURE_DENORMALIZED and
+        action in ("post_add", "post_remove", "post_clear")
+    ):
+        # Drop possible cached queryset from previous features
+        instance.__dict__.pop("query_features", None)
+        instance.features_cache = instance.build_flat_features()
+        instance.scoped_features_cache = instance.build_scoped_features()
+        instance.__class__.objects.filter(pk=instance.pk).update(
+            features_cache=instance.features_cache,
+            scoped_features_cache=instance.scoped_features_cache,
+        )
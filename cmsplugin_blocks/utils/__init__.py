@@ -1,16 +1,20 @@
 from ..utils.archive import store_images_from_zip
 
 from ..utils.validators import (
-    is_valid_image_filename, validate_css_classname, validate_css_classnames,
-    validate_file_size, validate_zip,
+    find_invalid_css_classname, get_css_classnames_errors, is_valid_image_filename,
+    validate_css_classname, validate_css_classnames, validate_file_size,
+    validate_zip, validate_zip_budgets,
 )
 
 
 __all__ = [
+    "find_invalid_css_classname",
+    "get_css_classnames_errors",
     "is_valid_image_filename",
     "store_images_from_zip",
     "validate_css_classname",
     "validate_css_classnames",
     "validate_file_size",
     "validate_zip",
+    "validate_zip_budgets",
 ]
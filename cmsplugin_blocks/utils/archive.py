@@ -1,18 +1,338 @@
-import collections
+import hashlib
+import io
 import logging
-
-from io import BytesIO
+import posixpath
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 from PIL import Image as PILimage
 
-from django.core.files.base import ContentFile
+from django.conf import settings
+from django.core.files import File
 
+from .manifest import read_manifest
 from .validators import is_valid_image_filename
 
 
+ARCHIVE_CHUNK_SIZE = 64 * 1024
+"""
+Size in bytes of chunks to decompress an archive member.
+"""
+
+
+IMAGE_HEADER_SIZE = 256 * 1024
+"""
+Maximum size in bytes of the beginning of an archive member to read image header
+from, before decompressing the rest of the member.
+"""
+
+
+HASHED_UPLOAD_DIR = "blocks/hashed"
+"""
+Directory where to store content addressed images.
+"""
+
+
+def get_hashed_name(digest, filename):
+    """
+    Return the content addressed path for an image.
+
+    Arguments:
+        digest (string): Hexadecimal digest of image content.
+        filename (string): Original image filename, only its extension is used.
+
+    Returns:
+        string: Path made from digest, like ``blocks/hashed/ab/abcdef[...].png``.
+    """
+    extension = posixpath.splitext(filename)[-1].lower()
+
+    return posixpath.join(HASHED_UPLOAD_DIR, digest[:2], digest + extension)
+
+
+def check_image_pixels(width, height):
+    """
+    Check image dimensions against pixel limit from
+    ``settings.BLOCKS_MASSUPLOAD_PIXELS_LIMIT``.
+
+    Raises:
+        ValueError: If image is over the pixel limit.
+
+    Arguments:
+        width (integer): Image width.
+        height (integer): Image height.
+    """
+    limit = settings.BLOCKS_MASSUPLOAD_PIXELS_LIMIT
+
+    if limit is not None and width * height > limit:
+        raise ValueError(
+            "Image size {}x{} is over the limit of {} pixels".format(
+                width, height, limit
+            )
+        )
+
+
+def get_image_header_size(content):
+    """
+    Read image dimensions from the beginning of an image file.
+
+    Arguments:
+        content (bytes): Beginning of image file.
+
+    Returns:
+        tuple: Image width and height or None if content does not contain a
+        complete header for a known image format.
+    """
+    try:
+        with PILimage.open(io.BytesIO(content)) as image:
+            return image.size
+    except PILimage.DecompressionBombError:
+        raise
+    except Exception:
+        return None
+
+
+def read_zip_member(zip_fileobject, member, hasher=None, verify_header=False):
+    """
+    Decompress an archive member into a temporary file object.
+
+    Member is decompressed by chunks into a spooled temporary file which is kept
+    in memory until its size exceeds ``settings.BLOCKS_MASSUPLOAD_SPOOL_SIZE``,
+    then it is moved to a temporary file on disk. So memory usage never depends
+    on member size.
+
+    Since member is read until its end, its CRC is checked by ``zipfile`` and a
+    corrupted member raises an exception.
+
+    Arguments:
+        zip_fileobject (zipfile.ZipFile): Archive file object.
+        member (string or zipfile.ZipInfo): Member name or infos.
+
+    Keyword Arguments:
+        hasher (object): Optional hash object from ``hashlib`` to update with each
+            decompressed chunk, so content is hashed while it is extracted.
+        verify_header (boolean): If true, image dimensions are read from the first
+            decompressed chunks, up to ``IMAGE_HEADER_SIZE`` bytes, and checked
+            with ``check_image_pixels()`` before the rest of member is
+            decompressed. Member is fully decompressed if no header is found.
+
+    Raises:
+        ValueError: If image from header is over the pixel limit.
+
+    Returns:
+        tempfile.SpooledTemporaryFile: Temporary file object with decompressed
+        content, positioned at its start. It is up to the caller to close it.
+    """
+    spooled = tempfile.SpooledTemporaryFile(
+        max_size=settings.BLOCKS_MASSUPLOAD_SPOOL_SIZE
+    )
+
+    try:
+        with zip_fileobject.open(member) as source:
+            if verify_header:
+                prefix = b""
+                size = None
+                while size is None and len(prefix) < IMAGE_HEADER_SIZE:
+                    chunk = source.read(ARCHIVE_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    prefix += chunk
+                    size = get_image_header_size(prefix)
+
+                if size is not None:
+                    check_image_pixels(*size)
+
+                if hasher is not None:
+                    hasher.update(prefix)
+                spooled.write(prefix)
+
+            if hasher is None:
+                shutil.copyfileobj(source, spooled, ARCHIVE_CHUNK_SIZE)
+            else:
+                while chunk := source.read(ARCHIVE_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    spooled.write(chunk)
+    except Exception:
+        spooled.close()
+        raise
+
+    spooled.seek(0)
+
+    return spooled
+
+
+def verify_image(fileobject):
+    """
+    Verify a file object is a valid image.
+
+    Image is not decoded, only its header and structure are checked by PIL, reading
+    from file object so it is never fully loaded in memory.
+
+    Image dimensions from header are checked with ``check_image_pixels()`` before
+    its structure, so an image which would need too much memory to be decoded is
+    rejected. This is done again here since header may not have been found from the
+    beginning of the archive member, see ``read_zip_member()``.
+
+    Raises:
+        ValueError: If image is over the pixel limit.
+        Exception: Any exception from PIL for an invalid image.
+
+    Arguments:
+        fileobject (file object): Image file object.
+    """
+    # Following code is taken from django.forms.fields.ImageField: load() could
+    # spot a truncated JPEG, but it loads the entire image in memory, which is a
+    # DoS vector. See #3848 and #18520. verify() must be called immediately after
+    # the constructor.
+    try:
+        image = PILimage.open(fileobject)
+
+        check_image_pixels(*image.size)
+
+        image.verify()
+    finally:
+        fileobject.seek(0)
+
+
+def store_zip_member(zip_fileobject, member, instance, item_model, link_attrname,
+                     image_attrname, label_attrname=None, values=None,
+                     deduplicate=False):
+    """
+    Create an item object from an archive member image.
+
+    Image file is extracted, verified and stored, but item object is not saved.
+    Member is decompressed only once, image dimensions are checked from its first
+    decompressed chunks then its CRC and image validity are checked from the
+    extracted temporary file. Errors are not raised but logged under logging
+    spacename ``cmsplugin_blocks.utils``.
+
+    Arguments:
+        zip_fileobject (zipfile.ZipFile): Archive file object.
+        member (zipfile.ZipInfo): Member infos.
+        instance (object): Item container instance.
+        item_model (model): Model object used to create items objects.
+        link_attrname (string): Attribute name used for linking instance to
+            item object.
+        image_attrname (string): Attribute name used to store image file in
+            item object.
+
+    Keyword Arguments:
+        label_attrname (string): Optional attribute name to fill with image
+            filename.
+        values (dict): Optional values to set on item object, indexed on their
+            attribute names. They are set after the label so they can override it.
+        deduplicate (boolean): If true, image is stored to a path made from its
+            content hash and an existing file with the same path is reused instead
+            of storing the image again. See ``get_hashed_name()``.
+
+    Returns:
+        object: Created item object or None if member failed.
+    """
+    logger = logging.getLogger("cmsplugin_blocks.utils")
+
+    filename = member.filename
+
+    # Get archived file from ZIP
+    hasher = hashlib.sha256() if deduplicate else None
+
+    try:
+        data = read_zip_member(
+            zip_fileobject,
+            member,
+            hasher=hasher,
+            verify_header=True,
+        )
+    except zipfile.BadZipFile as e:
+        msg = "Corrupted file '{}' in archive: {}".format(filename, str(e))
+        logger.error(msg)
+        return None
+    except (ValueError, PILimage.DecompressionBombError) as e:
+        # Image header is over the pixel limit
+        msg = "Error verifying image: {}".format(str(e))
+        logger.error(msg)
+        return None
+    except Exception as e:
+        msg = "Error reading file from archive: {}".format(str(e))
+        logger.error(msg)
+        return None
+
+    with data:
+        try:
+            verify_image(data)
+        except Exception as e:
+            # if a "bad" file is found we just skip it.
+            msg = "Error verifying image: {}".format(str(e))
+            logger.error(msg)
+            return None
+
+        try:
+            item = item_model(**{link_attrname: instance})
+            fieldfile = getattr(item, image_attrname)
+
+            if hasher:
+                # Content addressed file is only stored if it does not exist yet
+                name = get_hashed_name(hasher.hexdigest(), filename)
+                if not fieldfile.storage.exists(name):
+                    name = fieldfile.storage.save(name, File(data, name=filename))
+                fieldfile.name = name
+            else:
+                # Lazy save since we dont have album id yet when creating
+                fieldfile.save(
+                    filename,
+                    File(data, name=filename),
+                    save=False
+                )
+
+            # Optional string field to fill from filename
+            if label_attrname:
+                setattr(item, label_attrname, filename)
+
+            for attrname, value in (values or {}).items():
+                setattr(item, attrname, value)
+        except Exception as e:
+            msg = "Error creating item from file: {}".format(str(e))
+            logger.error(msg)
+            return None
+
+    return item
+
+
+def get_manifest_values(entry, label_attrname=None, alt_attrname=None,
+                        order_attrname=None):
+    """
+    Map manifest entry fields to item attribute names.
+
+    Arguments:
+        entry (dict): Manifest entry, see ``cmsplugin_blocks.utils.manifest``.
+
+    Keyword Arguments:
+        label_attrname (string): Attribute name for entry ``title``.
+        alt_attrname (string): Attribute name for entry ``alt``.
+        order_attrname (string): Attribute name for entry ``order``.
+
+    Returns:
+        dict: Entry values indexed on attribute names. Fields without an attribute
+        name are ignored.
+    """
+    attrnames = {
+        "title": label_attrname,
+        "alt": alt_attrname,
+        "order": order_attrname,
+    }
+
+    return {
+        attrnames[name]: value
+        for name, value in entry.items()
+        if attrnames.get(name)
+    }
+
+
 def store_images_from_zip(instance, zip_fileobject, item_model,
                           link_attrname, image_attrname,
-                          label_attrname=None):
+                          label_attrname=None, alt_attrname=None,
+                          order_attrname=None, manifest=None, workers=None,
+                          callback=None, deduplicate=None):
     """
     Collect every image from a ZIP as an item object linked to given
     saved instance.
@@ -23,6 +343,16 @@ def store_images_from_zip(instance, zip_fileobject, item_model,
     from instance that does not have an id yet. Items are created and stored
     in a list of item to save further.
 
+    Each image is streamed from archive to the storage, see ``read_zip_member()``,
+    so peak memory does not depend from archive or image sizes.
+
+    Images can be extracted, verified and stored by a pool of threads, items are
+    still returned in the order of their sorted filenames.
+
+    If archive includes a manifest, its entries fill item title, alternative text
+    and order, see ``cmsplugin_blocks.utils.manifest``. Manifest is read once before
+    images.
+
     Since this is a method to be used inside save() method, it is required to
     be silent for non blocking errors on item extraction, plus it should be
     used after ZIP validation. And so no exception should be raised, instead
@@ -46,63 +376,98 @@ def store_images_from_zip(instance, zip_fileobject, item_model,
             filename. If given it must relate to a CharField or a TextField
             field. If CharField, it should have enough character limit to
             accept long paths.
+        alt_attrname (string): Optional attribute name to fill with alternative
+            text from manifest.
+        order_attrname (string): Optional attribute name to fill with order from
+            manifest.
+        manifest (dict): Already parsed manifest entries, as returned from
+            ``read_manifest()``. If not given, manifest is read from archive.
+        workers (integer): Number of threads to process images. Default to
+            ``settings.BLOCKS_MASSUPLOAD_WORKERS``. Images are processed
+            sequentially without any thread if lower than 2.
+        callback (callable): Optional function called after each processed image
+            with the number of processed images and the total number of images to
+            process. It is always called from the calling thread.
+        deduplicate (boolean): Whether to store images to content addressed paths
+            to reuse identical files already stored. Default to
+            ``settings.BLOCKS_MASSUPLOAD_DEDUPLICATE``.
 
     Returns:
         list: List of saved objects from image items.
     """
     logger = logging.getLogger("cmsplugin_blocks.utils")
 
+    workers = settings.BLOCKS_MASSUPLOAD_WORKERS if workers is None else workers
+    deduplicate = (
+        settings.BLOCKS_MASSUPLOAD_DEDUPLICATE if deduplicate is None
+        else deduplicate
+    )
+
     stored_items = []
 
     if zip_fileobject:
-        for filename in sorted(zip_fileobject.namelist()):
-            # Don't process invalid filename or directory
-            if filename.endswith("/") or not is_valid_image_filename(filename):
-                continue
-
-            # Get archived file from ZIP
-            data = zip_fileobject.read(filename)
-            if len(data):
-                try:
-                    # Following code is taken from
-                    # django.forms.fields.ImageField: load() could spot a
-                    # truncated JPEG, but it loads the entire image in memory,
-                    # which is a DoS vector. See #3848 and #18520. verify()
-                    # must be called immediately after the constructor.
-                    PILimage.open(BytesIO(data)).verify()
-                except Exception as e:
-                    # if a "bad" file is found we just skip it.
-                    msg = "Error verifying image: {}".format(str(e))
-                    logger.error(msg)
-                    continue
-
-                if hasattr(data, "seek") and isinstance(data.seek,
-                                                        collections.Callable):
-                    data.seek(0)
-
-                try:
-                    item = item_model(**{link_attrname: instance})
-                    # Lazy save since we dont have album id yet when creating
-                    getattr(
-                        item,
-                        image_attrname
-                    ).save(
-                        filename,
-                        ContentFile(data),
-                        save=False
-                    )
-
-                    # Optional string field to fill from filename
-                    if label_attrname:
-                        setattr(item, label_attrname, filename)
-                except Exception as e:
-                    msg = "Error creating item from file: {}".format(str(e))
-                    logger.error(msg)
-                else:
-                    # Store created item to be saved further in plugin
-                    # 'save_model' method
+        if manifest is None:
+            try:
+                manifest = read_manifest(zip_fileobject)
+            except (ValueError, UnicodeDecodeError) as e:
+                msg = "Error reading manifest from archive: {}".format(str(e))
+                logger.error(msg)
+                manifest = {}
+
+        members = [
+            member
+            for member in sorted(
+                zip_fileobject.infolist(),
+                key=lambda x: x.filename
+            )
+            # Don't process invalid filename, directory or empty file
+            if (
+                not member.is_dir() and
+                is_valid_image_filename(member.filename) and
+                member.file_size
+            )
+        ]
+
+        def process(member):
+            return store_zip_member(
+                zip_fileobject,
+                member,
+                instance,
+                item_model,
+                link_attrname,
+                image_attrname,
+                label_attrname=label_attrname,
+                values=get_manifest_values(
+                    manifest.get(member.filename, {}),
+                    label_attrname=label_attrname,
+                    alt_attrname=alt_attrname,
+                    order_attrname=order_attrname,
+                ),
+                deduplicate=deduplicate,
+            )
+
+        executor = None
+        if workers > 1 and len(members) > 1:
+            executor = ThreadPoolExecutor(max_workers=workers)
+
+        try:
+            # Map results respect the members order
+            results = (
+                executor.map(process, members) if executor
+                else map(process, members)
+            )
+            for processed, item in enumerate(results, start=1):
+                # Store created item to be saved further in plugin 'save_model'
+                # method
+                if item is not None:
                     stored_items.append(item)
 
+                if callback:
+                    callback(processed, len(members))
+        finally:
+            if executor:
+                executor.shutdown()
+
         # Drop ZIP file object from memory/tempdir when finished
         zip_fileobject.close()
 
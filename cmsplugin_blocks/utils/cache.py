@@ -0,0 +1,101 @@
+"""
+Helpers to invalidate DjangoCMS cache for plugin objects.
+"""
+from django.contrib.contenttypes.models import ContentType
+
+from cms.cache import invalidate_cms_page_cache
+from cms.cache.placeholder import clear_placeholder_cache
+from cms.models import CMSPlugin, PageContent, Placeholder
+from cms.utils.conf import get_cms_setting, get_site_id
+
+
+def is_cms_cache_enabled():
+    """
+    Check if any DjangoCMS cache involving plugins is enabled.
+
+    Returns:
+        boolean: True if placeholder or page cache is enabled.
+    """
+    return bool(
+        get_cms_setting("PLACEHOLDER_CACHE") or get_cms_setting("PAGE_CACHE")
+    )
+
+
+def get_placeholders_site_ids(placeholders):
+    """
+    Resolve site id for each given placeholder with a single query.
+
+    Placeholders which are not attached to a page content get the default site id
+    from settings.
+
+    Arguments:
+        placeholders (iterable): Placeholder objects.
+
+    Returns:
+        dict: Site ids indexed on placeholder ids.
+    """
+    content_type = ContentType.objects.get_for_model(PageContent)
+
+    page_contents = [
+        placeholder.object_id
+        for placeholder in placeholders
+        if placeholder.content_type_id == content_type.id
+    ]
+    sites = dict(
+        PageContent.admin_manager.filter(pk__in=page_contents).values_list(
+            "pk", "page__site_id"
+        )
+    ) if page_contents else {}
+
+    return {
+        placeholder.pk: get_site_id(
+            sites.get(placeholder.object_id)
+            if placeholder.content_type_id == content_type.id
+            else None
+        )
+        for placeholder in placeholders
+    }
+
+
+def invalidate_plugins_cache(related):
+    """
+    Invalidate DjangoCMS cache only for placeholders which contain given plugin
+    objects.
+
+    Placeholder cache is cleared for each involved placeholder and language. Since
+    DjangoCMS page cache can not be invalidated per page, it is invalidated once
+    if enabled and if there was at least an involved placeholder.
+
+    Arguments:
+        related (dict): Set of plugin object ids indexed on their model, as returned
+            from ``cmsplugin_blocks.utils.features.get_related_plugin_ids()``.
+
+    Returns:
+        integer: Number of invalidated placeholder caches (one per language).
+    """
+    if not related or not is_cms_cache_enabled():
+        return 0
+
+    pks = set().union(*related.values())
+
+    rows = set(
+        CMSPlugin.objects.filter(
+            pk__in=pks,
+            placeholder__isnull=False,
+        ).values_list(
+            "placeholder_id", "language"
+        )
+    )
+    if not rows:
+        return 0
+
+    placeholders = Placeholder.objects.in_bulk({pk for pk, language in rows})
+    site_ids = get_placeholders_site_ids(placeholders.values())
+
+    for pk, language in sorted(rows):
+        clear_placeholder_cache(placeholders[pk], language, site_ids[pk])
+
+    if get_cms_setting("PAGE_CACHE"):
+        invalidate_cms_page_cache()
+
+    return len(rows)
@@ -1,5 +1,12 @@
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+from django.db import connection
+
 from cms.api import add_plugin
 from cms.models import Placeholder
+from cms.plugin_rendering import ContentRenderer
 from cms.test_utils.testcases import CMSTestCase
 
 
@@ -51,8 +58,88 @@ class CMSPluginTestCase(CMSTestCase):
 
         return context
 
+    @contextmanager
+    def record_render(self):
+        """
+        Record queries and durations of plugin renders.
+
+        Each plugin object rendered from any DjangoCMS content renderer is recorded.
+        Since children plugin objects are rendered from their parent, their queries
+        and duration are also counted in the ones of their parent.
+
+        Queries are counted from a database execute wrapper, not from the query log
+        ``connection.queries`` which is limited to its last 9000 entries.
+
+        Yields:
+            dict: Recorded render statistics, filled once the context manager exits.
+            Item ``queries`` is the total number of queries, ``duration`` is the total
+            render duration in seconds and ``plugins`` is a list of dictionnaries
+            with ``plugin_type``, ``id``, ``queries`` and ``duration`` items for each
+            rendered plugin object, in the order their render has finished.
+        """
+        stats = {
+            "queries": 0,
+            "duration": 0,
+            "plugins": [],
+        }
+
+        executed = {"queries": 0}
+
+        def count_queries(execute, sql, params, many, context):
+            executed["queries"] += 1
+            return execute(sql, params, many, context)
+
+        render_plugin = ContentRenderer.render_plugin
+
+        def recorded_render_plugin(renderer, instance, *args, **kwargs):
+            queries = executed["queries"]
+            start = time.perf_counter()
+            try:
+                return render_plugin(renderer, instance, *args, **kwargs)
+            finally:
+                stats["plugins"].append({
+                    "plugin_type": instance.plugin_type,
+                    "id": instance.pk,
+                    "queries": executed["queries"] - queries,
+                    "duration": time.perf_counter() - start,
+                })
+
+        start = time.perf_counter()
+        patched = mock.patch.object(
+            ContentRenderer, "render_plugin", recorded_render_plugin
+        )
+        with patched, connection.execute_wrapper(count_queries):
+            yield stats
+
+        stats["duration"] = time.perf_counter() - start
+        stats["queries"] = executed["queries"]
+
+    def assertRenderQueries(self, stats, budget):
+        """
+        Assert a recorded render did not perform more queries than the given budget.
+
+        Arguments:
+            stats (dict): Render statistics as recorded from ``record_render()``.
+            budget (integer): Maximum allowed number of queries.
+        """
+        if stats["queries"] > budget:
+            details = "\n".join([
+                "- {plugin_type} #{id}: {queries} queries in {duration:.4f}s".format(
+                    **item
+                )
+                for item in stats["plugins"]
+            ])
+            self.fail(
+                "Render performed {} queries while budget is {}:\n{}".format(
+                    stats["queries"],
+                    budget,
+                    details,
+                )
+            )
+
     def create_basic_render(self, plugin, slot_name="test", lang="en",
-                            copy_relations_from=None, children=None, **kwargs):
+                            copy_relations_from=None, children=None,
+                            query_budget=None, **kwargs):
         """
         A shortcut to create a basic render for a plugin.
 
@@ -74,6 +161,10 @@ class CMSPluginTestCase(CMSTestCase):
                 recursive capability. Each plugin item is a list where the first item
                 is the plugin model to use and the second one is a dict of keyword
                 arguments for model fields to give to ``add_plugin``.
+            query_budget (integer): If given, the placeholder render must not perform
+                more queries than this number else the test fails. Render statistics
+                are always stored in test case attribute ``render_stats``, see
+                ``record_render()`` for details.
 
         Returns:
             tuple: A tuple of items, respectively the used placeholder object, the
@@ -112,8 +203,13 @@ class CMSPluginTestCase(CMSTestCase):
             model_instance.copy_relations(copy_relations_from)
 
         # Render placeholder so plugin is fully rendered in real situation
-        html = context["cms_content_renderer"].render_placeholder(
-            placeholder, context=context, language=lang
-        )
+        with self.record_render() as stats:
+            html = context["cms_content_renderer"].render_placeholder(
+                placeholder, context=context, language=lang
+            )
+
+        self.render_stats = stats
+        if query_budget is not None:
+            self.assertRenderQueries(stats, query_budget)
 
         return placeholder, model_instance, context, html
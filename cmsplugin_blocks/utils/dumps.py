@@ -0,0 +1,102 @@
+"""
+Feature dumps are built incrementally from a queryset iterator, so a dump can be
+streamed without loading every feature in memory.
+
+Available dump formats are:
+
+``json``
+    Indented JSON document, see ``FeatureExportAdminView`` for its structure.
+``compact``
+    The same JSON document without any indentation or whitespace.
+``ndjson``
+    Newline delimited JSON, the first line is an object with ``version`` and
+    ``date`` items then each following line is a feature item.
+"""
+import datetime
+import json
+import textwrap
+
+from .. import __version__
+
+
+DUMP_FORMATS = {
+    "json": "application/json",
+    "compact": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+"""
+Available dump formats with their content type.
+"""
+
+DUMP_CHUNK_SIZE = 2000
+"""
+Number of features to fetch at once from database when building a dump.
+"""
+
+
+def get_dump_header():
+    """
+    Return dump header items.
+
+    Returns:
+        dict: Dump ``version`` and ``date``.
+    """
+    return {
+        "version": __version__,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def iter_feature_dump(queryset, output_format="json", chunk_size=DUMP_CHUNK_SIZE):
+    """
+    Iterate over dump chunks for features.
+
+    Chunks joined together are identical to a dump serialized at once, excepted
+    for the ``ndjson`` format which is not a single JSON document.
+
+    Arguments:
+        queryset (cmsplugin_blocks.managers.FeatureQuerySet): Features to dump.
+
+    Keyword Arguments:
+        output_format (string): A format name from ``DUMP_FORMATS``.
+        chunk_size (integer): Number of features to fetch at once from database.
+
+    Yields:
+        string: Dump chunk.
+    """
+    if output_format not in DUMP_FORMATS:
+        raise ValueError("Unknown dump format: {}".format(output_format))
+
+    header = get_dump_header()
+    items = queryset.query_full_payload().iterator(chunk_size=chunk_size)
+
+    if output_format == "ndjson":
+        yield json.dumps(header) + "\n"
+        for item in items:
+            yield json.dumps(item) + "\n"
+        return
+
+    # An empty list is always serialized without any whitespace
+    if output_format == "compact":
+        opening = json.dumps(header, separators=(",", ":"))[:-1] + ',"items":['
+        closing = "]}"
+        empty_closing = "]}"
+
+        def serialize(item):
+            return json.dumps(item, separators=(",", ":"))
+    else:
+        opening = json.dumps(header, indent=4)[:-2] + ',\n    "items": ['
+        closing = "\n    ]\n}"
+        empty_closing = "]\n}"
+
+        def serialize(item):
+            return "\n" + textwrap.indent(json.dumps(item, indent=4), " " * 8)
+
+    yield opening
+
+    empty = True
+    for item in items:
+        yield ("" if empty else ",") + serialize(item)
+        empty = False
+
+    yield empty_closing if empty else closing
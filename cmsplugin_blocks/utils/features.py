@@ -0,0 +1,114 @@
+"""
+Helpers to manage features of plugin objects in bulk.
+"""
+from django.apps import apps
+
+from ..models.mixins import FeatureMixinModel
+from .prefetch import prefetch_features
+
+
+def get_feature_models():
+    """
+    Return all installed models which implement features.
+
+    Returns:
+        list: Model classes which inherit from ``FeatureMixinModel``.
+    """
+    return [
+        model
+        for model in apps.get_models()
+        if issubclass(model, FeatureMixinModel)
+    ]
+
+
+def get_related_plugin_ids(feature_ids):
+    """
+    Find all plugin objects related to given features.
+
+    This only queries relation tables, with a single query per plugin model.
+
+    Arguments:
+        feature_ids (iterable): Feature object ids.
+
+    Returns:
+        dict: Set of plugin object ids indexed on their model. Models without any
+        related objects are not present.
+    """
+    feature_ids = list(feature_ids)
+    related = {}
+
+    for model in get_feature_models():
+        querysets = [
+            through.objects.filter(
+                feature_id__in=feature_ids
+            ).values_list(link_attrname, flat=True)
+            for scope, through, link_attrname in model.get_features_relations()
+        ]
+
+        pks = set(querysets[0].union(*querysets[1:]))
+        if pks:
+            related[model] = pks
+
+    return related
+
+
+def rebuild_features_cache(model, pks=None, batch_size=500):
+    """
+    Build and store denormalized features for plugin objects of a model.
+
+    Features are fetched in bulk with ``prefetch_features()`` and denormalized
+    fields are stored with ``bulk_update()`` so no signals are sent.
+
+    Arguments:
+        model (class): A plugin model which inherits from ``FeatureMixinModel``.
+
+    Keyword Arguments:
+        pks (iterable): Only process objects with these ids. If not given, every
+            objects of the model are processed.
+        batch_size (integer): Maximum number of objects to process at once.
+
+    Returns:
+        integer: Number of processed objects.
+    """
+    if pks is None:
+        pks = model.objects.values_list("pk", flat=True)
+
+    pks = sorted(pks)
+
+    for i in range(0, len(pks), batch_size):
+        # Bare objects are enough since only their id is used to fetch features
+        # and to update denormalized fields
+        objects = [model(pk=pk) for pk in pks[i:i + batch_size]]
+
+        prefetch_features(objects)
+
+        for instance in objects:
+            instance.features_cache = instance.build_flat_features()
+            instance.scoped_features_cache = instance.build_scoped_features()
+
+        model.objects.bulk_update(
+            objects,
+            ["features_cache", "scoped_features_cache"],
+        )
+
+    return len(pks)
+
+
+def rebuild_related_features_cache(related, batch_size=500):
+    """
+    Rebuild denormalized features for plugin objects of many models.
+
+    Arguments:
+        related (dict): Set of plugin object ids indexed on their model, as returned
+            from ``get_related_plugin_ids()``.
+
+    Keyword Arguments:
+        batch_size (integer): Maximum number of objects to process at once.
+
+    Returns:
+        integer: Number of processed objects.
+    """
+    return sum([
+        rebuild_features_cache(model, pks=pks, batch_size=batch_size)
+        for model, pks in related.items()
+    ])
@@ -0,0 +1,210 @@
+"""
+A mass upload archive may include a manifest file to define title, alternative
+text and order of items created from its images.
+
+Manifest is a file named ``manifest.json`` or ``manifest.csv``, it is searched
+from the archive root then into directories. Image filenames from manifest are
+relative to the manifest directory.
+
+A JSON manifest is a list of objects: ::
+
+    [
+        {"filename": "foo.jpg", "title": "Foo", "alt": "A foo", "order": 1},
+        {"filename": "bar/ping.png", "title": "Ping", "order": 2}
+    ]
+
+Or an object indexed on filenames: ::
+
+    {
+        "foo.jpg": {"title": "Foo", "alt": "A foo", "order": 1},
+        "bar/ping.png": {"title": "Ping", "order": 2}
+    }
+
+A CSV manifest starts with a header row to name its columns: ::
+
+    filename,title,alt,order
+    foo.jpg,Foo,A foo,1
+    bar/ping.png,Ping,,2
+
+Every field except ``filename`` is optional.
+"""
+import csv
+import io
+import json
+import posixpath
+
+
+MANIFEST_FILENAMES = ("manifest.json", "manifest.csv")
+"""
+Filenames of a manifest file.
+"""
+
+MANIFEST_FIELDS = ("title", "alt", "order")
+"""
+Fields available for a manifest entry.
+"""
+
+MANIFEST_MAX_LENGTHS = {
+    "title": 150,
+    "alt": 125,
+}
+"""
+Maximum length of manifest text fields, the same as the item fields they fill.
+"""
+
+MANIFEST_ORDER_RANGE = (-2 ** 31, 2 ** 31 - 1)
+"""
+Minimum and maximum values for manifest order, the range of an ``IntegerField``
+supported by every database backend.
+"""
+
+
+def find_manifest(zip_fileobject):
+    """
+    Find manifest file in an archive.
+
+    Arguments:
+        zip_fileobject (zipfile.ZipFile): Archive file object.
+
+    Returns:
+        zipfile.ZipInfo: Member infos of the manifest with the shortest path or None
+        if there is no manifest.
+    """
+    manifests = [
+        member
+        for member in zip_fileobject.infolist()
+        if (
+            not member.is_dir() and
+            posixpath.basename(member.filename) in MANIFEST_FILENAMES
+        )
+    ]
+
+    if not manifests:
+        return None
+
+    return sorted(manifests, key=lambda x: (x.filename.count("/"), x.filename))[0]
+
+
+def clean_manifest_entry(entry):
+    """
+    Validate and clean a manifest entry.
+
+    Raises:
+        ValueError: If entry is not an object, has an invalid or out of range
+            order or a text value which is not a string or is too long.
+
+    Arguments:
+        entry (dict): Manifest entry.
+
+    Returns:
+        dict: Cleaned entry with only the filled fields from ``MANIFEST_FIELDS``.
+    """
+    if not isinstance(entry, dict):
+        raise ValueError("Manifest entry must be an object")
+
+    cleaned = {}
+    for name in MANIFEST_FIELDS:
+        value = entry.get(name)
+        if value is None or value == "":
+            continue
+
+        if name == "order":
+            # Booleans are integers for Python but not a valid order
+            if isinstance(value, bool):
+                raise ValueError("Invalid order value: {}".format(value))
+
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError("Invalid order value: {}".format(value))
+
+            minimum, maximum = MANIFEST_ORDER_RANGE
+            if not minimum <= value <= maximum:
+                raise ValueError("Order value is out of range: {}".format(value))
+        elif not isinstance(value, str):
+            raise ValueError("Invalid {} value: {}".format(name, value))
+        elif len(value) > MANIFEST_MAX_LENGTHS[name]:
+            raise ValueError("Value for {} is longer than {} characters".format(
+                name,
+                MANIFEST_MAX_LENGTHS[name],
+            ))
+
+        cleaned[name] = value
+
+    return cleaned
+
+
+def parse_manifest(content, filename):
+    """
+    Parse manifest content.
+
+    Raises:
+        ValueError: If manifest content is invalid.
+
+    Arguments:
+        content (bytes): Manifest content.
+        filename (string): Manifest filename, its extension determines the format.
+
+    Returns:
+        list: List of tuples ``(filename, entry)``.
+    """
+    text = content.decode("utf-8-sig")
+
+    if filename.endswith(".csv"):
+        reader = csv.DictReader(io.StringIO(text))
+        if not reader.fieldnames or "filename" not in reader.fieldnames:
+            raise ValueError("Manifest CSV must have a 'filename' column")
+        rows = list(reader)
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError("Invalid manifest JSON: {}".format(str(e)))
+
+        if isinstance(data, dict):
+            rows = [
+                dict(values, filename=name) if isinstance(values, dict) else values
+                for name, values in data.items()
+            ]
+        elif isinstance(data, list):
+            rows = data
+        else:
+            raise ValueError("Manifest JSON must be a list or an object")
+
+    entries = []
+    for row in rows:
+        entry = clean_manifest_entry(row)
+        if not row.get("filename") or not isinstance(row["filename"], str):
+            raise ValueError("Manifest entry must have a filename")
+        entries.append((row["filename"], entry))
+
+    return entries
+
+
+def read_manifest(zip_fileobject):
+    """
+    Read manifest from an archive.
+
+    Raises:
+        ValueError: If manifest is invalid.
+
+    Arguments:
+        zip_fileobject (zipfile.ZipFile): Archive file object.
+
+    Returns:
+        dict: Manifest entries indexed on full archive member filenames. Empty if
+        there is no manifest.
+    """
+    member = find_manifest(zip_fileobject)
+    if member is None:
+        return {}
+
+    basedir = posixpath.dirname(member.filename)
+
+    return {
+        posixpath.normpath(posixpath.join(basedir, filename)): entry
+        for filename, entry in parse_manifest(
+            zip_fileobject.read(member),
+            member.filename
+        )
+    }
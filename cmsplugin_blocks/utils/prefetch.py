@@ -0,0 +1,231 @@
+"""
+Helpers to prefetch data for many plugin objects at once, instead of letting each
+plugin object perform its own queries when rendered.
+"""
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Value
+
+from cms.models import CMSPlugin
+
+from ..managers import get_plugin_lookup
+from ..models.mixins import FeatureMixinModel
+from ..registry import feature_registry
+
+
+logger = logging.getLogger("cmsplugin_blocks.utils")
+
+
+def group_by_model(instances, base=None):
+    """
+    Group given objects by their model.
+
+    Arguments:
+        instances (iterable): Model objects to group. Objects without a primary key
+            are ignored.
+
+    Keyword Arguments:
+        base (class): If given, only objects which are instances of this class are
+            kept.
+
+    Returns:
+        dict: Lists of objects indexed on their model.
+    """
+    groups = defaultdict(list)
+
+    for instance in instances:
+        if instance.pk is None:
+            continue
+        if base is not None and not isinstance(instance, base):
+            continue
+
+        groups[instance._meta.concrete_model].append(instance)
+
+    return groups
+
+
+def prefetch_features(instances):
+    """
+    Fetch features for all given plugin objects in bulk.
+
+    Plugin objects may be of mixed types, only the ones which implement
+    ``FeatureMixinModel`` are processed. For each plugin model there is a single
+    query which joins results from all feature relation tables.
+
+    Fetched features are attached to each plugin object as its
+    ``query_features`` cached property, so ``scoped_features()`` and
+    ``flat_features()`` won't perform any query anymore.
+
+    Scope and allowed plugin are enforced in the same way than from
+    ``FeatureMixinModel.query_features``, including the resolution from Feature
+    registry when setting ``BLOCKS_FEATURE_REGISTRY`` is enabled.
+
+    Arguments:
+        instances (iterable): Plugin model objects.
+
+    Returns:
+        integer: Number of performed queries.
+    """
+    queries = 0
+
+    for model, objects in group_by_model(instances, base=FeatureMixinModel).items():
+        plugin_name = model.__name__
+        payloads = {instance.pk: [] for instance in objects}
+
+        querysets = []
+        for scope, through, link_attrname in model.get_features_relations():
+            queryset = through.objects.filter(**{
+                "{}__in".format(link_attrname): list(payloads.keys())
+            }).annotate(
+                relation_scope=Value(scope)
+            )
+
+            if settings.BLOCKS_FEATURE_REGISTRY:
+                queryset = queryset.values_list(
+                    link_attrname, "feature_id", "relation_scope"
+                )
+            else:
+                queryset = queryset.filter(
+                    feature__scope=scope,
+                    **get_plugin_lookup(plugin_name, prefix="feature__")
+                ).values_list(link_attrname, "feature__value", "relation_scope")
+
+            querysets.append(queryset)
+
+        rows = querysets[0].union(*querysets[1:], all=True)
+
+        if settings.BLOCKS_FEATURE_REGISTRY:
+            for pk, feature_id, scope in rows:
+                payloads[pk].extend(
+                    feature_registry.resolve([(feature_id, scope)], plugin_name)
+                )
+        else:
+            for pk, value, scope in rows:
+                payloads[pk].append({"value": value, "scope": scope})
+
+        queries += 1
+
+        for instance in objects:
+            instance.__dict__["query_features"] = payloads[instance.pk]
+
+    return queries
+
+
+def iter_plugins_tree(instances):
+    """
+    Walk on given plugin objects and all of their descendants.
+
+    Descendants are reached from ``child_plugin_instances`` attribute which is filled
+    by DjangoCMS when it builds plugin tree of a placeholder.
+
+    Arguments:
+        instances (iterable): Plugin model objects.
+
+    Yields:
+        object: Plugin model object. An object is never yielded twice.
+    """
+    seen = set()
+    pending = list(instances)
+
+    while pending:
+        instance = pending.pop(0)
+        if id(instance) in seen:
+            continue
+
+        seen.add(id(instance))
+        pending.extend(getattr(instance, "child_plugin_instances", None) or [])
+
+        yield instance
+
+
+def prefetch_plugins(instances):
+    """
+    Prefetch features and items for all given plugin objects in a single pass.
+
+    Plugin objects may be of mixed types, including plugins from other
+    applications which are ignored, and their descendants are processed also.
+
+    Features are prefetched with ``prefetch_features()`` for objects which does not
+    already have them and which can not use their denormalized features.
+    Items are prefetched for objects of plugins which implements
+    ``prefetch_items()``, with a single query for each item model.
+
+    Arguments:
+        instances (iterable): Plugin model objects, commonly the downcasted plugin
+            objects from a placeholder.
+
+    Returns:
+        dict: A report with the number of processed plugin ``objects``, the number of
+        performed ``queries`` and the number of queries ``saved`` compared to
+        each object performing its own queries.
+    """
+    objects = list(iter_plugins_tree(instances))
+    expected = 0
+    queries = 0
+
+    features_targets = [
+        instance
+        for instance in objects
+        if (
+            isinstance(instance, FeatureMixinModel) and
+            "query_features" not in instance.__dict__ and
+            not instance.use_features_cache("features_cache")
+        )
+    ]
+    if features_targets:
+        expected += len(features_targets)
+        queries += prefetch_features(features_targets)
+
+    for model, items_targets in group_by_model(objects, base=CMSPlugin).items():
+        plugin_class = items_targets[0].get_plugin_class()
+        if not hasattr(plugin_class, "prefetch_items"):
+            continue
+
+        prefetched = plugin_class.prefetch_items(items_targets)
+        if prefetched:
+            expected += len(prefetched)
+            queries += 1
+
+    return {
+        "objects": len(objects),
+        "queries": queries,
+        "saved": expected - queries,
+    }
+
+
+def prefetch_placeholder(placeholder):
+    """
+    Prefetch features and items for all plugin objects of a placeholder.
+
+    This only works on a placeholder for which DjangoCMS has already assigned its
+    plugin objects, like when it is being rendered. The prefetch is performed only
+    once for a placeholder object, its report is stored in placeholder attribute
+    ``_blocks_prefetch``.
+
+    Arguments:
+        placeholder (cms.models.Placeholder): Placeholder object.
+
+    Returns:
+        dict: The report from ``prefetch_plugins()`` or None if placeholder plugins
+        have not been assigned yet.
+    """
+    if hasattr(placeholder, "_blocks_prefetch"):
+        return placeholder._blocks_prefetch
+
+    instances = getattr(placeholder, "_all_plugins_cache", None)
+    if instances is None:
+        instances = getattr(placeholder, "_plugins_cache", None)
+    if instances is None:
+        return None
+
+    placeholder._blocks_prefetch = prefetch_plugins(instances)
+
+    logger.debug(
+        "Prefetched %(objects)s plugin objects with %(queries)s queries, saved "
+        "%(saved)s queries.",
+        placeholder._blocks_prefetch,
+    )
+
+    return placeholder._blocks_prefetch
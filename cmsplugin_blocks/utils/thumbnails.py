@@ -0,0 +1,181 @@
+"""
+Thumbnails from plugin templates can be generated ahead of the first render, when
+objects are saved.
+
+Thumbnail sizes are discovered from the ``media_thumb`` tags of plugin templates,
+only tags with literal geometry and options are involved. Included templates and
+extended templates with a literal name are followed.
+"""
+import functools
+import logging
+
+from django.template import Context, TemplateDoesNotExist
+from django.template.base import Variable
+from django.template.library import SimpleNode
+from django.template.loader import get_template
+from django.template.loader_tags import ExtendsNode, IncludeNode
+
+from smart_media.templatetags.smart_image import media_thumb
+
+
+def resolve_literal(expression):
+    """
+    Resolve a template filter expression only if it is a literal.
+
+    Arguments:
+        expression (django.template.base.FilterExpression): Expression to resolve.
+
+    Returns:
+        object: Resolved literal value or None if expression is a variable.
+    """
+    if isinstance(expression.var, Variable) or expression.filters:
+        return None
+
+    return expression.resolve(Context())
+
+
+def iter_nodelist_thumbnails(nodelist, seen):
+    """
+    Yield thumbnail specifications from ``media_thumb`` tags of a node list.
+
+    Arguments:
+        nodelist (django.template.base.NodeList): Node list to search.
+        seen (set): Names of templates which have already been searched, to avoid
+            infinite recursion.
+
+    Yields:
+        tuple: Specification as a tuple ``(source, geometry, options)`` where
+        ``source`` is the variable path of the source image, like ``item.image``,
+        and ``options`` a tuple of sorted option items.
+    """
+    for node in nodelist.get_nodes_by_type(SimpleNode):
+        if node.func is not media_thumb or len(node.args) < 2:
+            continue
+
+        source = node.args[0].var
+        geometry = resolve_literal(node.args[1])
+        options = {
+            name: resolve_literal(value)
+            for name, value in node.kwargs.items()
+        }
+        if not isinstance(source, Variable) or not geometry or None in options.values():
+            continue
+
+        yield (source.var, str(geometry), tuple(sorted(options.items())))
+
+    for node in nodelist.get_nodes_by_type(IncludeNode):
+        name = resolve_literal(node.template)
+        if isinstance(name, str):
+            yield from iter_template_thumbnails(name, seen)
+
+    for node in nodelist.get_nodes_by_type(ExtendsNode):
+        name = resolve_literal(node.parent_name)
+        if isinstance(name, str):
+            yield from iter_template_thumbnails(name, seen)
+
+
+def iter_template_thumbnails(template_name, seen):
+    """
+    Yield thumbnail specifications from a template.
+
+    Arguments:
+        template_name (string): Template name to search.
+        seen (set): Names of templates which have already been searched.
+
+    Yields:
+        tuple: Specification as a tuple ``(source, geometry, options)``.
+    """
+    if template_name in seen:
+        return
+
+    seen.add(template_name)
+
+    try:
+        template = get_template(template_name)
+    except TemplateDoesNotExist:
+        return
+
+    yield from iter_nodelist_thumbnails(template.template.nodelist, seen)
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_thumbnails(template_name):
+    """
+    Return thumbnail specifications from a template.
+
+    Result is cached for the process lifetime since templates are not expected to
+    change.
+
+    Arguments:
+        template_name (string): Template name.
+
+    Returns:
+        tuple: Unique specifications as tuples ``(source, geometry, options)``, in
+        the order they have been found.
+    """
+    return tuple(dict.fromkeys(iter_template_thumbnails(template_name, set())))
+
+
+def get_templates_thumbnails(template_names, exclude_root=None):
+    """
+    Return thumbnail specifications from many templates.
+
+    Arguments:
+        template_names (list): Template names.
+
+    Keyword Arguments:
+        exclude_root (string): Optional variable name, specifications with a source
+            starting from this variable are excluded. Commonly ``instance`` to only
+            get specifications for items.
+
+    Returns:
+        list: Unique specifications as tuples ``(geometry, options)``.
+    """
+    specs = {}
+
+    for template_name in template_names:
+        for source, geometry, options in get_template_thumbnails(template_name):
+            if exclude_root and source.split(".")[0] == exclude_root:
+                continue
+
+            specs[(geometry, options)] = None
+
+    return list(specs)
+
+
+def generate_thumbnails(fieldfiles, specs):
+    """
+    Generate thumbnails of image files.
+
+    Thumbnails already generated are only looked up from thumbnail store. Errors are
+    not raised but logged under logging spacename ``cmsplugin_blocks.utils``.
+
+    Arguments:
+        fieldfiles (iterable): Image field files, empty ones are ignored.
+        specs (list): Specifications as tuples ``(geometry, options)``.
+
+    Returns:
+        integer: Number of thumbnails successfully generated or looked up.
+    """
+    logger = logging.getLogger("cmsplugin_blocks.utils")
+
+    done = 0
+
+    for fieldfile in fieldfiles:
+        if not fieldfile:
+            continue
+
+        for geometry, options in specs:
+            try:
+                media_thumb(fieldfile, geometry, **dict(options))
+            except Exception as e:
+                msg = "Error generating thumbnail {} for '{}': {}".format(
+                    geometry,
+                    fieldfile.name,
+                    str(e)
+                )
+                logger.error(msg)
+            else:
+                done += 1
+
+    return done
@@ -1,3 +1,4 @@
+import re
 import zipfile
 
 from django.conf import settings
@@ -5,6 +6,21 @@ from django.core.exceptions import ValidationError
 from django.template.defaultfilters import filesizeformat
 from django.utils.translation import gettext_lazy as _
 
+from .manifest import read_manifest
+
+
+CSS_CLASSNAME_REGEX = re.compile(r"[\w-]+")
+"""
+Compiled pattern for characters allowed in a single CSS class name. Like
+``str.isalnum()``, ``\\w`` matches any Unicode alphanumeric character.
+"""
+
+CSS_CLASSNAMES_REGEX = re.compile(r"(?!\d)[\w-]*(?: (?!\d)[\w-]*)*")
+"""
+Compiled pattern for CSS class names divided by whitespaces, none of them starting
+with an ASCII digit.
+"""
+
 
 def is_valid_image_filename(filename):
     """
@@ -54,16 +70,83 @@ def validate_file_size(data):
     return True
 
 
+def validate_zip_budgets(archive):
+    """
+    Validate archive members against mass upload limits.
+
+    This only relies on archive metadatas, nothing is decompressed. Decompressed
+    sizes can be trusted since ``zipfile`` never reads more than the declared size
+    of a member.
+
+    Limits are from settings ``BLOCKS_MASSUPLOAD_MEMBERS_LIMIT``,
+    ``BLOCKS_MASSUPLOAD_MEMBER_LIMIT`` and ``BLOCKS_MASSUPLOAD_UNCOMPRESSED_LIMIT``,
+    a limit set to ``None`` is not checked.
+
+    Raises:
+        ValidationError: If a limit is exceeded.
+
+    Arguments:
+        archive (zipfile.ZipFile): Archive file object.
+
+    Returns:
+        boolean: Always True, obvisously excepted if an exception is raised
+        when a limit is exceeded.
+    """
+    members = [info for info in archive.infolist() if not info.is_dir()]
+
+    members_limit = settings.BLOCKS_MASSUPLOAD_MEMBERS_LIMIT
+    if members_limit is not None and len(members) > members_limit:
+        raise ValidationError(
+            _("Please keep ZIP archive under {} files. Current files {}").format(
+                members_limit,
+                len(members)
+            )
+        )
+
+    member_limit = settings.BLOCKS_MASSUPLOAD_MEMBER_LIMIT
+    if member_limit is not None:
+        for info in members:
+            if info.file_size > member_limit:
+                raise ValidationError(
+                    _("File '{}' in ZIP archive is over {}. Current size {}").format(
+                        info.filename,
+                        filesizeformat(member_limit),
+                        filesizeformat(info.file_size)
+                    )
+                )
+
+    total_limit = settings.BLOCKS_MASSUPLOAD_UNCOMPRESSED_LIMIT
+    total = sum([info.file_size for info in members])
+    if total_limit is not None and total > total_limit:
+        raise ValidationError(
+            _("Please keep decompressed ZIP archive under {}. Current size {}").format(
+                filesizeformat(total_limit),
+                filesizeformat(total)
+            )
+        )
+
+    return True
+
+
 def validate_zip(data, obj=None):
     """
     Validate uploaded ZIP archive file.
 
     If 'obj' is given and valid temporary store it as 'uploaded_zip' attribute
-    onto object.
+    onto object, with its parsed manifest as 'uploaded_manifest' attribute (see
+    ``cmsplugin_blocks.utils.manifest``).
+
+    Only the archive structure is validated here, members are not decompressed.
+    Their CRC is checked when they are extracted, along their image validity, so
+    each member is decompressed only once, see
+    ``cmsplugin_blocks.utils.archive.store_zip_member()``.
+
+    Archive is also validated against mass upload limits, see
+    ``validate_zip_budgets()``.
 
     Raises:
-        ValidationError: If not a valid zip file or has corrupted files
-            (return corrupted filename in exception).
+        ValidationError: If not a valid zip file, if it exceeds a mass upload
+            limit or if its manifest is invalid.
 
     Arguments:
         data (file object): A file like object suitable to zipfile module.
@@ -84,20 +167,73 @@ def validate_zip(data, obj=None):
     except zipfile.BadZipFile:
         raise ValidationError("Submitted ZIP file is invalid")
 
-    # Search for corrupted files
-    corrupted_file = archive.testzip()
-    if corrupted_file:
-        raise ValidationError("File '{}' in ZIP archive is corrupted".format(
-            corrupted_file
-        ))
+    try:
+        validate_zip_budgets(archive)
+    except ValidationError:
+        archive.close()
+        raise
+
+    # Parse optional manifest
+    try:
+        manifest = read_manifest(archive)
+    except (ValueError, UnicodeDecodeError) as e:
+        archive.close()
+        raise ValidationError(
+            _("Manifest from ZIP archive is invalid: {}").format(str(e))
+        )
 
     # ZIP is totally ok, store it to attribute
     if obj:
         obj.uploaded_zip = archive
+        obj.uploaded_manifest = manifest
 
     return archive
 
 
+def find_invalid_css_classname(value, allow_multiple=None):
+    """
+    Find the invalid CSS class name from a value.
+
+    Value is checked at once with a compiled pattern, the first character of
+    class names is still checked with ``str.isdigit()`` for non ASCII values.
+
+    Arguments:
+        value (string): A string with a CSS class name to check.
+
+    Keyword Arguments:
+        allow_multiple (boolean): If True, value may contain multiple class names
+            divided by whitespaces. If None, it is determined from setting
+            ``BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES``.
+
+    Returns:
+        string: The first invalid class name or None if value is valid. An empty
+        value is returned as is since it is invalid.
+    """
+    if not value:
+        return value
+
+    if allow_multiple is None:
+        allow_multiple = settings.BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES is True
+
+    if not allow_multiple:
+        if CSS_CLASSNAME_REGEX.fullmatch(value) and not value[0].isdigit():
+            return None
+
+        return value
+
+    # Pattern only excludes ASCII digits at start of class names, some other Unicode
+    # characters are digits
+    if CSS_CLASSNAMES_REGEX.fullmatch(value) and (
+        value.isascii() or not any(name[:1].isdigit() for name in value.split(" "))
+    ):
+        return None
+
+    # Invalid value, search for the name to report
+    for name in value.split(" "):
+        if name[:1].isdigit() or (name and not CSS_CLASSNAME_REGEX.fullmatch(name)):
+            return name
+
+
 def validate_css_classname(value):
     """
     A callable validator to validate a CSS class name.
@@ -118,37 +254,49 @@ def validate_css_classname(value):
         bool: True if valid.
 
     """
-    # TODO: Switch to an another message when whitespace are allowed ?
-    msg = _("'%(value)s' is not a valid CSS class name")
+    invalid = find_invalid_css_classname(value)
 
-    if not value:
-        raise ValidationError(msg, params={"value": value})
+    if invalid is not None:
+        # TODO: Switch to an another message when whitespace are allowed ?
+        raise ValidationError(
+            _("'%(value)s' is not a valid CSS class name"),
+            params={"value": invalid},
+        )
 
-    if settings.BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES is True:
-        classnames = value.split(" ")
-    else:
-        classnames = [value]
+    return True
 
-    for name in classnames:
-        for i, item in enumerate(name):
-            if i == 0 and item.isdigit():
-                raise ValidationError(msg, params={"value": name})
 
-            if item.isalnum() or item in ["-", "_"]:
-                continue
+def get_css_classnames_errors(values):
+    """
+    Check a list of CSS class names in a single call.
 
-            raise ValidationError(msg, params={"value": name})
+    Setting ``BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES`` is read once for all values.
 
-    return True
+    Arguments:
+        values (list): A list of strings for CSS class names to check.
+
+    Returns:
+        dict: Invalid class names indexed on the position of their value in given
+        list. It is empty if every value is valid.
+    """
+    allow_multiple = settings.BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES is True
+
+    errors = {}
+    for i, value in enumerate(values):
+        invalid = find_invalid_css_classname(value, allow_multiple=allow_multiple)
+        if invalid is not None:
+            errors[i] = invalid
+
+    return errors
 
 
 def validate_css_classnames(value):
     """
-    A callable validator to validate a list of CSS class names using
-    ``validate_css_classname`` on each item.
+    A callable validator to validate a list of CSS class names.
 
     Raises:
-        ValidationError: If an item is an invalid CSS class name.
+        ValidationError: If any item is an invalid CSS class name, with an error
+            for each invalid item.
 
     Arguments:
         value (list): A list of strings for CSS class names to validate.
@@ -157,7 +305,13 @@ def validate_css_classnames(value):
         bool: True if every list item are valid.
 
     """
-    for item in value:
-        validate_css_classname(item)
+    msg = _("'%(value)s' is not a valid CSS class name")
+
+    errors = get_css_classnames_errors(value)
+    if errors:
+        raise ValidationError([
+            ValidationError(msg, params={"value": invalid})
+            for invalid in errors.values()
+        ])
 
     return True
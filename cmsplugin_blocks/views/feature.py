@@ -1,14 +1,12 @@
-import datetime
-
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
 from django.views.generic import View, FormView
 from django.utils.translation import gettext_lazy as _
 from django.urls import reverse_lazy
 
-from .. import __version__
 from ..models import Feature
 from ..forms import FeatureImportForm
+from ..utils.dumps import DUMP_FORMATS, iter_feature_dump
 from .admin_mixins import CustomAdminContext
 
 
@@ -42,6 +40,11 @@ class FeatureExportAdminView(View):
 
     Item ``items`` is a list of dictionnary for feature items to load. All feature item
     fields are required and must not be empty.
+
+    Response is streamed from a queryset iterator so features are never all loaded
+    in memory. Output format can be chosen with URL argument ``format``, either
+    ``json`` (default), ``compact`` or ``ndjson``. See
+    ``cmsplugin_blocks.utils.dumps`` for details.
     """
     model = Feature
     http_method_names = ["get", "head", "options", "trace"]
@@ -51,15 +54,19 @@ class FeatureExportAdminView(View):
 
     def get(self, request):
         """
-        Return built JSON content from features.
+        Return streamed JSON content from features.
         """
-        return JsonResponse(
-            {
-                "version":  __version__,
-                "date": datetime.datetime.now().isoformat(timespec="seconds"),
-                "items": list(self.get_queryset().query_full_payload()),
-            },
-            json_dumps_params={"indent": 4},
+        output_format = request.GET.get("format", "json")
+        if output_format not in DUMP_FORMATS:
+            return HttpResponseBadRequest(
+                "Unknown format, available ones are: {}".format(
+                    ", ".join(DUMP_FORMATS.keys())
+                )
+            )
+
+        return StreamingHttpResponse(
+            iter_feature_dump(self.get_queryset(), output_format=output_format),
+            content_type=DUMP_FORMATS[output_format],
         )
 
 
@@ -68,6 +75,8 @@ class FeatureImportAdminView(CustomAdminContext, FormView):
     View to import Feature items from a JSON file.
 
     Expected JSON format is the same as described in ``FeatureExportAdminView``.
+    Import mode to only create, update or fully synchronize features is chosen
+    from form, see ``FeatureImportForm.save()``.
     """
     model = Feature
     form_class = FeatureImportForm
@@ -97,12 +106,16 @@ class FeatureImportAdminView(CustomAdminContext, FormView):
                 ``FeatureImportForm.save()``.
 
         Returns:
-            string: The success message may be composed of created, ignored per scope
-            and ignored duplicates parts, depending they are empty or not.
+            string: The success message may be composed of created, updated,
+            deleted, unchanged, ignored per scope and ignored duplicates parts,
+            depending they are empty or not.
         """
         parts = []
 
         created_msg = _("{count} items have been created")
+        updated_msg = _("{count} items have been updated")
+        deleted_msg = _("{count} items have been deleted")
+        unchanged_msg = _("{count} items were unchanged")
         ignored_msg = _("{count} items have been ignored from scopes ({scopes})")
         duplicates_msg = _("{count} items were duplicated titles")
 
@@ -111,6 +124,14 @@ class FeatureImportAdminView(CustomAdminContext, FormView):
                 created_msg.format(count=len(results["created"]))
             )
 
+        for name, msg in (
+            ("updated", updated_msg),
+            ("deleted", deleted_msg),
+            ("unchanged", unchanged_msg),
+        ):
+            if len(results.get(name, [])) > 0:
+                parts.append(msg.format(count=len(results[name])))
+
         if len(results["ignored"]) > 0:
             parts.append(
                 ignored_msg.format(
@@ -2,7 +2,10 @@ import pytest
 
 from django.core.exceptions import ValidationError
 
-from cmsplugin_blocks.utils import validate_css_classname, validate_css_classnames
+from cmsplugin_blocks.utils import (
+    find_invalid_css_classname, get_css_classnames_errors, validate_css_classname,
+    validate_css_classnames,
+)
 
 
 @pytest.mark.parametrize("name", [
@@ -69,3 +72,60 @@ def test_validate_css_classnames_fail():
             "1foo",
             "foo-bar",
         ])
+
+
+@pytest.mark.parametrize("value, allow_multiple, expected", [
+    ("", False, ""),
+    ("foo", False, None),
+    ("été", False, None),
+    ("²foo", False, "²foo"),
+    ("foo bar", False, "foo bar"),
+    ("foo\n", False, "foo\n"),
+    ("", True, ""),
+    ("foo bar", True, None),
+    ("foo  bar ", True, None),
+    ("foo 1bar", True, "1bar"),
+    ("foo ²bar", True, "²bar"),
+    ("foo\tbar", True, "foo\tbar"),
+    ("foo ba.r", True, "ba.r"),
+])
+def test_find_invalid_css_classname(value, allow_multiple, expected):
+    """
+    The invalid class name should be returned or None if value is valid.
+    """
+    assert find_invalid_css_classname(value, allow_multiple=allow_multiple) == (
+        expected
+    )
+
+
+def test_get_css_classnames_errors(settings):
+    """
+    Every invalid value should be returned on its position.
+    """
+    values = ["foo", "1foo", "foo bar", "", "foo-bar 2bar"]
+
+    settings.BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES = False
+    assert get_css_classnames_errors(values) == {
+        1: "1foo",
+        2: "foo bar",
+        3: "",
+        4: "foo-bar 2bar",
+    }
+
+    settings.BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES = True
+    assert get_css_classnames_errors(values) == {1: "1foo", 3: "", 4: "2bar"}
+
+
+def test_validate_css_classnames_all_errors(settings):
+    """
+    Validator exception should contain an error for each invalid item.
+    """
+    settings.LANGUAGE_CODE = "en"
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate_css_classnames(["foo", "1foo", "foo-bar", "foo@bar"])
+
+    assert excinfo.value.messages == [
+        "'1foo' is not a valid CSS class name",
+        "'foo@bar' is not a valid CSS class name",
+    ]
@@ -1,4 +1,6 @@
+import io
 import zipfile
+from unittest import mock
 
 import pytest
 
@@ -69,3 +71,51 @@ def test_valid_zip_basic_to_object(tests_settings):
 
     assert isinstance(dummy.uploaded_zip, zipfile.ZipFile)
     assert str(filepath) == dummy.uploaded_zip.filename
+
+
+@pytest.mark.parametrize("limits,expected", [
+    ({}, None),
+    ({"MEMBERS_LIMIT": 3}, "Please keep ZIP archive under 3 files"),
+    ({"MEMBER_LIMIT": 500}, "File 'basic/"),
+    ({"UNCOMPRESSED_LIMIT": 1000}, "Please keep decompressed ZIP archive under"),
+    (
+        {"MEMBERS_LIMIT": None, "MEMBER_LIMIT": None, "UNCOMPRESSED_LIMIT": None},
+        None
+    ),
+])
+def test_validate_zip_budgets(settings, tests_settings, limits, expected):
+    """
+    Archive should be rejected from its metadatas when it exceeds a limit.
+    """
+    for name, value in limits.items():
+        setattr(settings, "BLOCKS_MASSUPLOAD_" + name, value)
+
+    filepath = tests_settings.fixtures_path / "zip_samples/basic.zip"
+
+    if expected is None:
+        assert isinstance(validate_zip(filepath), zipfile.ZipFile)
+    else:
+        with pytest.raises(ValidationError) as excinfo:
+            validate_zip(filepath)
+
+        assert excinfo.value.messages[0].startswith(expected)
+
+
+def test_validate_zip_budgets_no_decompression(settings):
+    """
+    A decompression bomb should be rejected without decompressing it.
+    """
+    settings.BLOCKS_MASSUPLOAD_MEMBER_LIMIT = 1024 * 1024
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as built:
+        built.writestr("bomb.png", b"\0" * (10 * 1024 * 1024))
+
+    # Compressed archive is tiny
+    assert len(buffer.getvalue()) < 20 * 1024
+
+    with mock.patch.object(zipfile.ZipFile, "open") as mocked:
+        with pytest.raises(ValidationError):
+            validate_zip(buffer)
+
+    assert mocked.called is False
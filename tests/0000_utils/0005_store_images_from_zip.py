@@ -1,8 +1,14 @@
+import hashlib
+import io
 import zipfile
+from unittest import mock
 
 import pytest
 
+from cmsplugin_blocks.cms_plugins import AlbumPlugin
+from cmsplugin_blocks.factories import AlbumFactory
 from cmsplugin_blocks.utils import store_images_from_zip, validate_zip
+from cmsplugin_blocks.utils.archive import ARCHIVE_CHUNK_SIZE, read_zip_member
 
 
 class DummyContainer:
@@ -135,3 +141,249 @@ def test_store_images_from_zip_success(caplog, tests_settings, filename,
     found_items = [(item.title, item.image.filename) for item in album._awaiting_items]
 
     assert expected_items == found_items
+
+
+@pytest.mark.parametrize("spool_size,rolled", [
+    (1024 * 1024, False),
+    (10, True),
+])
+def test_read_zip_member(settings, tests_settings, spool_size, rolled):
+    """
+    Member should be extracted in memory until its size exceeds spool size, then
+    in a temporary file on disk.
+    """
+    settings.BLOCKS_MASSUPLOAD_SPOOL_SIZE = spool_size
+
+    filepath = tests_settings.fixtures_path / "zip_samples" / "basic.zip"
+
+    with zipfile.ZipFile(filepath) as archive:
+        expected = archive.read("basic/120x100.png")
+
+        with read_zip_member(archive, "basic/120x100.png") as data:
+            assert data._rolled is rolled
+            assert data.read() == expected
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_store_images_from_zip_workers(caplog, tests_settings, workers):
+    """
+    Items should be in the same order and errors logged the same whatever the
+    number of workers.
+    """
+    source = tests_settings.fixtures_path / "zip_samples" / "with_subdirectories.zip"
+
+    # Build an archive with the valid images and a broken one
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(source) as archive:
+        with zipfile.ZipFile(buffer, "w") as built:
+            for info in archive.infolist():
+                built.writestr(info.filename, archive.read(info.filename))
+            built.writestr("with_subdirectories/broken.png", b"not an image")
+
+    album = DummyAlbum(title="workers")
+    items = store_images_from_zip(
+        album,
+        zipfile.ZipFile(buffer),
+        DummyItem,
+        "album",
+        "image",
+        label_attrname="title",
+        workers=workers,
+    )
+
+    assert [item.title for item in items] == [
+        "with_subdirectories/107x107.png",
+        "with_subdirectories/120x100.jpg",
+        "with_subdirectories/subdir/120x100.png",
+        "with_subdirectories/subdir/120x120.png",
+    ]
+
+    errors = [
+        msg
+        for name, level, msg in caplog.record_tuples
+        if name == "cmsplugin_blocks.utils"
+    ]
+    assert len(errors) == 1
+    assert errors[0].startswith("Error verifying image:")
+
+
+def test_store_images_from_zip_single_pass(caplog, tests_settings):
+    """
+    Validation and extraction should decompress each image member only once, a
+    corrupted member is skipped on extraction.
+    """
+    source = tests_settings.fixtures_path / "zip_samples" / "basic.zip"
+
+    # Build an uncompressed archive to easily corrupt a member content
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(source) as archive:
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as built:
+            for info in archive.infolist():
+                built.writestr(info.filename, archive.read(info.filename))
+
+    content = bytearray(buffer.getvalue())
+    with zipfile.ZipFile(buffer) as built:
+        info = built.getinfo("basic/120x100.png")
+        # Skip local header to alter the last byte of member data
+        offset = info.header_offset + 30 + len(info.filename) + len(info.extra)
+        content[offset + info.compress_size - 1] ^= 0xFF
+
+    opened = []
+    original_open = zipfile.ZipFile.open
+
+    def counted_open(self, name, *args, **kwargs):
+        opened.append(getattr(name, "filename", name))
+        return original_open(self, name, *args, **kwargs)
+
+    with mock.patch.object(zipfile.ZipFile, "open", counted_open):
+        archive = validate_zip(io.BytesIO(bytes(content)))
+        assert opened == []
+
+        items = store_images_from_zip(
+            DummyAlbum(title="single"),
+            archive,
+            DummyItem,
+            "album",
+            "image",
+            label_attrname="title",
+        )
+
+    assert sorted(opened) == [
+        "basic/107x107.png",
+        "basic/120x100.jpg",
+        "basic/120x100.png",
+        "basic/120x120.png",
+    ]
+    assert [item.title for item in items] == [
+        "basic/107x107.png",
+        "basic/120x100.jpg",
+        "basic/120x120.png",
+    ]
+
+    errors = [
+        msg
+        for name, level, msg in caplog.record_tuples
+        if name == "cmsplugin_blocks.utils"
+    ]
+    assert len(errors) == 1
+    assert errors[0].startswith("Corrupted file 'basic/120x100.png' in archive:")
+
+
+def test_store_images_from_zip_pixels_limit(settings, caplog, tests_settings):
+    """
+    Images over the pixel limit should be skipped.
+    """
+    # Only 107x107 is under limit (11449 pixels), others are at least 12000
+    settings.BLOCKS_MASSUPLOAD_PIXELS_LIMIT = 11500
+
+    filepath = tests_settings.fixtures_path / "zip_samples" / "basic.zip"
+
+    items = store_images_from_zip(
+        DummyAlbum(title="pixels"),
+        zipfile.ZipFile(filepath),
+        DummyItem,
+        "album",
+        "image",
+        label_attrname="title",
+    )
+
+    assert [item.title for item in items] == ["basic/107x107.png"]
+
+    errors = [
+        msg
+        for name, level, msg in caplog.record_tuples
+        if name == "cmsplugin_blocks.utils"
+    ]
+    assert len(errors) == 3
+    assert errors[0] == (
+        "Error verifying image: Image size 120x100 is over the limit of 11500 pixels"
+    )
+
+
+def test_read_zip_member_pixels_limit(settings, tests_settings):
+    """
+    Image over the pixel limit should be rejected from its header, before the rest
+    of the member is decompressed.
+    """
+    settings.BLOCKS_MASSUPLOAD_PIXELS_LIMIT = 11500
+
+    filepath = tests_settings.fixtures_path / "zip_samples" / "basic.zip"
+
+    # Image followed with a lot of data
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(filepath) as archive:
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as built:
+            built.writestr(
+                "big.png",
+                archive.read("basic/120x100.png") + b"\0" * 10 * 1024 * 1024,
+            )
+            built.writestr("small.png", archive.read("basic/107x107.png"))
+
+    decompressed = []
+    original_read = zipfile.ZipExtFile.read
+
+    def counted_read(self, *args, **kwargs):
+        data = original_read(self, *args, **kwargs)
+        decompressed.append(len(data))
+        return data
+
+    with zipfile.ZipFile(buffer) as archive:
+        with mock.patch.object(zipfile.ZipExtFile, "read", counted_read):
+            with pytest.raises(ValueError) as excinfo:
+                read_zip_member(archive, "big.png", verify_header=True)
+
+        assert str(excinfo.value) == (
+            "Image size 120x100 is over the limit of 11500 pixels"
+        )
+        assert sum(decompressed) <= ARCHIVE_CHUNK_SIZE
+
+        with read_zip_member(archive, "small.png", verify_header=True) as data:
+            assert data.read() == archive.read("small.png")
+
+
+def test_store_images_deduplicate(db, tests_settings):
+    """
+    With deduplication, identical images should share the same stored file, even
+    from different plugin objects.
+    """
+    filepath = tests_settings.fixtures_path / "zip_samples" / "basic.zip"
+
+    first = AlbumFactory()
+    second = AlbumFactory()
+
+    with zipfile.ZipFile(filepath) as archive:
+        expected = {
+            name: hashlib.sha256(archive.read(name)).hexdigest()
+            for name in archive.namelist()
+            if not name.endswith("/")
+        }
+
+    first_items = store_images_from_zip(
+        first, zipfile.ZipFile(filepath), deduplicate=True,
+        **AlbumPlugin.get_massupload_options()
+    )
+    second_items = store_images_from_zip(
+        second, zipfile.ZipFile(filepath), deduplicate=True,
+        **AlbumPlugin.get_massupload_options()
+    )
+
+    assert [item.image.name for item in first_items] == [
+        "blocks/hashed/{}/{}.{}".format(
+            expected[item.title][:2],
+            expected[item.title],
+            item.title.split(".")[-1],
+        )
+        for item in first_items
+    ]
+    assert [item.image.name for item in second_items] == [
+        item.image.name for item in first_items
+    ]
+    for item in first_items:
+        assert item.image.storage.exists(item.image.name)
+
+    # Without deduplication, each upload stores its own files
+    items = store_images_from_zip(
+        second, zipfile.ZipFile(filepath), deduplicate=False,
+        **AlbumPlugin.get_massupload_options()
+    )
+    assert not any(item.image.name.startswith("blocks/hashed/") for item in items)
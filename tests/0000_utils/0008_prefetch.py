@@ -0,0 +1,175 @@
+from unittest import mock
+
+import pytest
+
+from django.contrib.auth.models import AnonymousUser
+from django.template import Context
+
+from cms.api import add_plugin, create_page
+from cms.models import Placeholder
+from cms.plugin_rendering import ContentRenderer
+from cms.toolbar.toolbar import CMSToolbar
+from cms.utils.plugins import assign_plugins
+
+from cmsplugin_blocks.cms_plugins import AlbumPlugin, ContainerPlugin, SliderPlugin
+from cmsplugin_blocks.compat.cms import CmsAPI
+from cmsplugin_blocks.factories import (
+    AlbumFactory, AlbumItemFactory, CardFactory, FeatureFactory, HeroFactory,
+    SlideItemFactory,
+)
+from cmsplugin_blocks.utils.prefetch import (
+    iter_plugins_tree, prefetch_features, prefetch_placeholder,
+)
+
+
+@pytest.mark.parametrize("registry", [False, True])
+def test_prefetch_features(db, settings, django_assert_num_queries, registry):
+    """
+    Features prefetching should attach the same features than the ones resolved
+    from each object, with a single query for each plugin model.
+    """
+    settings.BLOCKS_FEATURE_REGISTRY = registry
+
+    size_foo = FeatureFactory(value="foo", scope="size", plugins=["Card", "Album"])
+    size_bar = FeatureFactory(value="bar", scope="size", plugins=["Card"])
+    color_ping = FeatureFactory(value="ping", scope="color", plugins=["Album"])
+    extra_pong = FeatureFactory(value="pong", scope="extra", plugins=["Card"])
+
+    objects = [
+        CardFactory(
+            fill_size_features=[size_foo, size_bar],
+            fill_extra_features=[extra_pong],
+        ),
+        CardFactory(fill_color_features=[color_ping]),
+        AlbumFactory(
+            fill_size_features=[size_foo, size_bar],
+            fill_color_features=[color_ping],
+        ),
+        HeroFactory(),
+    ]
+
+    expected = [
+        obj._meta.concrete_model.objects.get(pk=obj.pk).scoped_features()
+        for obj in objects
+    ]
+
+    objects = [
+        obj._meta.concrete_model.objects.get(pk=obj.pk)
+        for obj in objects
+    ]
+
+    if registry:
+        # Load registry before so it is not involved in counted queries
+        objects[0].flat_features()
+        objects[0] = objects[0]._meta.concrete_model.objects.get(pk=objects[0].pk)
+
+    with django_assert_num_queries(3):
+        assert prefetch_features(objects) == 3
+
+    with django_assert_num_queries(0):
+        assert [obj.scoped_features() for obj in objects] == expected
+
+    assert [obj.flat_features() for obj in objects] == [
+        "bar foo pong",
+        "",
+        "foo ping",
+        "",
+    ]
+
+
+def test_prefetch_placeholder(db, settings, rf, django_assert_num_queries):
+    """
+    Placeholder prefetching should prefetch features and items for every plugin
+    objects, including the nested ones, and be done only once.
+    """
+    cmsapi = CmsAPI()
+
+    page = create_page(
+        language="en",
+        title="Dummy",
+        slug="dummy",
+        template=settings.TEST_PAGE_TEMPLATES,
+    )
+    placeholder = cmsapi.get_placeholders(page).get(slot="content")
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Album", "Slider"])
+
+    album = add_plugin(placeholder, AlbumPlugin, "en", title="Album")
+    album.size_features.add(foo)
+    AlbumItemFactory(album=album, order=2, title="2")
+    AlbumItemFactory(album=album, order=1, title="1")
+    other_album = add_plugin(placeholder, AlbumPlugin, "en", title="Other")
+    AlbumItemFactory(album=other_album, order=1, title="1")
+    container = add_plugin(placeholder, ContainerPlugin, "en", title="Container")
+    slider = add_plugin(
+        placeholder, SliderPlugin, "en", target=container, title="Slider",
+    )
+    slider.size_features.add(foo)
+    SlideItemFactory(slider=slider, order=1, title="1")
+
+    # Placeholder plugins have not been assigned yet
+    assert prefetch_placeholder(placeholder) is None
+
+    assign_plugins(rf.get("/"), [placeholder], lang="en")
+
+    report = prefetch_placeholder(placeholder)
+    # One query for features and items of each plugin model instead of one for
+    # each plugin object
+    assert report == {"objects": 4, "queries": 5, "saved": 2}
+
+    with django_assert_num_queries(0):
+        assert prefetch_placeholder(placeholder) is report
+
+        plugins = {
+            instance.title: instance
+            for instance in iter_plugins_tree(placeholder._plugins_cache)
+        }
+        assert plugins["Album"].flat_features() == "foo"
+        assert plugins["Other"].flat_features() == ""
+        assert plugins["Slider"].flat_features() == "foo"
+        assert plugins["Container"].flat_features() == ""
+
+        album_plugin = plugins["Album"].get_plugin_class_instance()
+        assert [
+            item.title
+            for item in album_plugin.get_ordered_items(plugins["Album"])
+        ] == ["1", "2"]
+
+
+def test_prefetch_placeholder_render(db, settings, rf):
+    """
+    Placeholder prefetching should be done once when rendering a placeholder and
+    only if enabled from settings.
+    """
+    placeholder = Placeholder.objects.create(slot="test")
+    add_plugin(placeholder, AlbumPlugin, "en", title="Album")
+    add_plugin(placeholder, SliderPlugin, "en", title="Slider")
+
+    def render():
+        request = rf.get("/")
+        request.user = AnonymousUser()
+        request.toolbar = CMSToolbar(request)
+        # Use a fresh placeholder object without any plugins cache
+        return ContentRenderer(request).render_placeholder(
+            Placeholder.objects.get(pk=placeholder.pk),
+            context=Context({"request": request}),
+            language="en",
+        )
+
+    target = "cmsplugin_blocks.plugins.mixins.prefetch_placeholder"
+
+    with mock.patch(target, wraps=prefetch_placeholder) as mocked:
+        html = render()
+
+    assert "Slider" in html
+    assert mocked.call_count == 2
+    # Same placeholder object for every calls
+    rendered = {id(call.args[0]): call.args[0] for call in mocked.call_args_list}
+    assert len(rendered) == 1
+    assert list(rendered.values())[0]._blocks_prefetch["objects"] == 2
+
+    settings.BLOCKS_PLACEHOLDER_PREFETCH = False
+    with mock.patch(target) as mocked:
+        render()
+
+    mocked.assert_not_called()
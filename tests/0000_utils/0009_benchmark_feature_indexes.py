@@ -0,0 +1,44 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+
+from cmsplugin_blocks.benchmarks.feature_indexes import BENCHMARKED_INDEXES, run
+from cmsplugin_blocks.models import Feature, FeaturePlugin
+
+
+def get_index_names():
+    with connection.cursor() as cursor:
+        return set().union(*[
+            connection.introspection.get_constraints(cursor, model._meta.db_table)
+            for model in (Feature, FeaturePlugin)
+        ])
+
+
+def test_benchmark_feature_indexes(db):
+    """
+    Benchmark should measure queries with and without indexes then rollback
+    everything.
+    """
+    results = run(features=20, repeat=2, seed=42)
+
+    assert results["features"] == 20
+    assert list(results["queries"].keys()) == [
+        "scope and plugin (contains)",
+        "scope and plugin (indexed)",
+        "scope and value",
+    ]
+    for states in results["queries"].values():
+        assert list(states.keys()) == ["indexed", "unindexed"]
+        for result in states.values():
+            assert result["plan"]
+            assert result["stats"]["count"] == 2
+
+    assert Feature.objects.count() == 0
+    assert set(BENCHMARKED_INDEXES).issubset(get_index_names())
+
+    out = StringIO()
+    call_command("blocks_benchmark_feature_indexes", "--features=10", "--repeat=1",
+                 stdout=out)
+    assert "scope and value" in out.getvalue()
+    assert set(BENCHMARKED_INDEXES).issubset(get_index_names())
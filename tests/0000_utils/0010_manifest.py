@@ -0,0 +1,205 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from django.core.exceptions import ValidationError
+
+from cmsplugin_blocks.utils import store_images_from_zip, validate_zip
+from cmsplugin_blocks.utils.manifest import (
+    find_manifest, parse_manifest, read_manifest,
+)
+
+
+class DummyItem:
+    """
+    A dummy item object with a lazy image field which only keeps filename.
+    """
+    class DummyFileField:
+        def save(self, filename, data, save=None):
+            self.filename = filename
+
+    def __init__(self, album=None):
+        self.album = album
+        self.image = self.DummyFileField()
+        self.title = None
+        self.image_alt = ""
+        self.order = 0
+
+
+def build_archive(tests_settings, manifests):
+    """
+    Build an archive with images from sample "basic.zip" and given manifest files.
+    """
+    source = tests_settings.fixtures_path / "zip_samples" / "basic.zip"
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(source) as archive:
+        with zipfile.ZipFile(buffer, "w") as built:
+            for info in archive.infolist():
+                built.writestr(info.filename, archive.read(info.filename))
+            for filename, content in manifests.items():
+                built.writestr(filename, content)
+
+    buffer.seek(0)
+
+    return buffer
+
+
+@pytest.mark.parametrize("filename,content", [
+    (
+        "manifest.json",
+        json.dumps([
+            {"filename": "a.png", "title": "A", "alt": "Alt A", "order": 2},
+            {"filename": "b/c.jpg", "order": "1", "alt": ""},
+        ]),
+    ),
+    (
+        "manifest.json",
+        json.dumps({
+            "a.png": {"title": "A", "alt": "Alt A", "order": 2},
+            "b/c.jpg": {"order": 1, "title": None},
+        }),
+    ),
+    (
+        "manifest.csv",
+        "filename,title,alt,order\na.png,A,Alt A,2\nb/c.jpg,,,1\n",
+    ),
+])
+def test_parse_manifest(filename, content):
+    """
+    Every manifest format should be parsed to the same entries without empty values.
+    """
+    assert parse_manifest(content.encode("utf-8"), filename) == [
+        ("a.png", {"title": "A", "alt": "Alt A", "order": 2}),
+        ("b/c.jpg", {"order": 1}),
+    ]
+
+
+@pytest.mark.parametrize("filename,content,expected", [
+    ("manifest.json", "{nope", "Invalid manifest JSON:"),
+    ("manifest.json", '"nope"', "Manifest JSON must be a list or an object"),
+    ("manifest.json", '["nope"]', "Manifest entry must be an object"),
+    ("manifest.json", '[{"title": "A"}]', "Manifest entry must have a filename"),
+    ("manifest.json", '[{"filename": "a.png", "order": "first"}]', "Invalid order"),
+    ("manifest.json", '[{"filename": 5}]', "Manifest entry must have a filename"),
+    ("manifest.json", '[{"filename": "a.png", "order": true}]', "Invalid order"),
+    (
+        "manifest.json",
+        json.dumps([{"filename": "a.png", "order": 10 ** 20}]),
+        "Order value is out of range",
+    ),
+    ("manifest.csv", "filename,order\na.png,2147483648\n", "Order value is out"),
+    ("manifest.csv", "filename,order\na.png,-2147483649\n", "Order value is out"),
+    ("manifest.json", '[{"filename": "a.png", "title": 5}]', "Invalid title"),
+    ("manifest.json", '[{"filename": "a.png", "alt": ["A"]}]', "Invalid alt"),
+    (
+        "manifest.json",
+        json.dumps([{"filename": "a.png", "title": "A" * 151}]),
+        "Value for title is longer than 150 characters",
+    ),
+    (
+        "manifest.csv",
+        "filename,alt\na.png,{}\n".format("A" * 126),
+        "Value for alt is longer than 125 characters",
+    ),
+    ("manifest.csv", "name,title\na.png,A\n", "Manifest CSV must have a 'filename'"),
+])
+def test_parse_manifest_invalid(filename, content, expected):
+    """
+    Invalid manifest should raise an explicit error.
+    """
+    with pytest.raises(ValueError) as excinfo:
+        parse_manifest(content.encode("utf-8"), filename)
+
+    assert str(excinfo.value).startswith(expected)
+
+
+def test_read_manifest(tests_settings):
+    """
+    Manifest closest to the archive root should be used, its filenames are relative
+    to its directory.
+    """
+    buffer = build_archive(tests_settings, {
+        "basic/manifest.csv": "filename,title\n120x100.png,Foo\n",
+        "basic/deep/manifest.json": "[]",
+    })
+
+    with zipfile.ZipFile(buffer) as archive:
+        assert find_manifest(archive).filename == "basic/manifest.csv"
+        assert read_manifest(archive) == {"basic/120x100.png": {"title": "Foo"}}
+
+    with zipfile.ZipFile(build_archive(tests_settings, {})) as archive:
+        assert find_manifest(archive) is None
+        assert read_manifest(archive) == {}
+
+
+def test_store_images_from_zip_manifest(tests_settings):
+    """
+    Manifest entries should fill item attributes, images without entry keep the
+    default values.
+    """
+    buffer = build_archive(tests_settings, {
+        "basic/manifest.json": json.dumps([
+            {"filename": "120x100.png", "title": "Foo", "alt": "A foo", "order": 2},
+            {"filename": "107x107.png", "order": 1},
+        ]),
+    })
+
+    items = store_images_from_zip(
+        None,
+        zipfile.ZipFile(buffer),
+        DummyItem,
+        "album",
+        "image",
+        label_attrname="title",
+        alt_attrname="image_alt",
+        order_attrname="order",
+    )
+
+    assert [
+        (item.image.filename, item.title, item.image_alt, item.order)
+        for item in items
+    ] == [
+        ("basic/107x107.png", "basic/107x107.png", "", 1),
+        ("basic/120x100.jpg", "basic/120x100.jpg", "", 0),
+        ("basic/120x100.png", "Foo", "A foo", 2),
+        ("basic/120x120.png", "basic/120x120.png", "", 0),
+    ]
+
+
+def test_validate_zip_manifest(tests_settings):
+    """
+    Validation should parse manifest once for the form or raise an error for an
+    invalid manifest.
+    """
+    class Dummy:
+        pass
+
+    dummy = Dummy()
+    buffer = build_archive(tests_settings, {
+        "manifest.csv": "filename,title\nbasic/120x100.png,Foo\n",
+    })
+    validate_zip(buffer, obj=dummy)
+    assert dummy.uploaded_manifest == {"basic/120x100.png": {"title": "Foo"}}
+
+    buffer = build_archive(tests_settings, {"manifest.json": "{nope"})
+    with pytest.raises(ValidationError) as excinfo:
+        validate_zip(buffer)
+
+    assert excinfo.value.messages[0].startswith(
+        "Manifest from ZIP archive is invalid:"
+    )
+
+    buffer = build_archive(tests_settings, {"manifest.json": '[{"filename": 5}]'})
+    with pytest.raises(ValidationError):
+        validate_zip(buffer)
+
+    buffer = build_archive(tests_settings, {
+        "manifest.json": json.dumps([
+            {"filename": "basic/120x100.png", "order": 10 ** 20},
+        ]),
+    })
+    with pytest.raises(ValidationError):
+        validate_zip(buffer)
@@ -0,0 +1,143 @@
+import zipfile
+from io import StringIO
+from unittest import mock
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.template import engines
+
+from sorl.thumbnail.models import KVStore
+
+from cmsplugin_blocks.cms_plugins import AlbumPlugin, SliderPlugin
+from cmsplugin_blocks.factories import AlbumFactory, AlbumItemFactory
+from cmsplugin_blocks.utils import store_images_from_zip
+from cmsplugin_blocks.utils.thumbnails import (
+    generate_thumbnails, get_template_thumbnails, get_templates_thumbnails,
+    iter_nodelist_thumbnails,
+)
+
+
+def test_get_template_thumbnails():
+    """
+    Specifications should be found from included templates.
+    """
+    assert get_template_thumbnails("cmsplugin_blocks/album/default.html") == (
+        ("item.image", "250x200", ()),
+    )
+    assert get_template_thumbnails("cmsplugin_blocks/hero/default.html") == (
+        ("instance.image", "1200x400", ()),
+    )
+    assert get_template_thumbnails("cmsplugin_blocks/nope.html") == ()
+
+
+def test_iter_nodelist_thumbnails():
+    """
+    Only tags with literal geometry and options should be collected, once.
+    """
+    template = engines["django"].from_string(
+        "{% load smart_image %}"
+        "{% for item in items %}"
+        "{% media_thumb item.image \"100x100\" as thumb %}"
+        "{% media_thumb item.image \"100x100\" crop=\"center\" as thumb %}"
+        "{% media_thumb item.image size as thumb %}"
+        "{% media_thumb item.image \"100x100\" crop=mode as thumb %}"
+        "{% endfor %}"
+    )
+
+    assert list(iter_nodelist_thumbnails(template.template.nodelist, set())) == [
+        ("item.image", "100x100", ()),
+        ("item.image", "100x100", (("crop", "center"),)),
+    ]
+
+
+def test_get_templates_thumbnails():
+    """
+    Specifications should be merged from templates, optionally without the ones
+    from plugin object.
+    """
+    names = [
+        "cmsplugin_blocks/album/default.html",
+        "cmsplugin_blocks/album/test.html",
+        "cmsplugin_blocks/hero/test.html",
+    ]
+
+    assert get_templates_thumbnails(names) == [
+        ("250x200", ()),
+        ("1200x400", ()),
+    ]
+    assert get_templates_thumbnails(names, exclude_root="instance") == [
+        ("250x200", ()),
+    ]
+    assert SliderPlugin.get_items_thumbnails() == [("1200x400", ())]
+
+
+def test_generate_thumbnails(db):
+    """
+    Thumbnails should be generated for each file and specification.
+    """
+    items = AlbumItemFactory.create_batch(2)
+
+    assert generate_thumbnails(
+        [item.image for item in items] + [None],
+        [("20x20", ()), ("10x10", (("crop", "center"),))]
+    ) == 4
+    assert KVStore.objects.count() > 0
+
+
+def test_warmup_items_thumbnails(db, settings):
+    """
+    Item thumbnails should only be generated when enabled or forced.
+    """
+    items = AlbumItemFactory.create_batch(2)
+
+    settings.BLOCKS_THUMBNAIL_WARMUP = False
+    assert AlbumPlugin.warmup_items_thumbnails(items) == 0
+    assert KVStore.objects.count() == 0
+
+    assert AlbumPlugin.warmup_items_thumbnails(items, force=True) == 2
+    stored = KVStore.objects.count()
+    assert stored > 0
+
+    settings.BLOCKS_THUMBNAIL_WARMUP = True
+    assert AlbumPlugin.warmup_items_thumbnails(items) == 2
+    # Thumbnails have been generated only once
+    assert KVStore.objects.count() == stored
+
+
+def test_save_massupload_items_thumbnails(db, settings, tests_settings):
+    """
+    Thumbnails of items saved from a mass upload should be generated when warmup
+    is enabled.
+    """
+    settings.BLOCKS_THUMBNAIL_WARMUP = True
+
+    album = AlbumFactory()
+    filepath = tests_settings.fixtures_path / "zip_samples" / "basic.zip"
+    items = store_images_from_zip(
+        album, zipfile.ZipFile(filepath), **AlbumPlugin.get_massupload_options()
+    )
+
+    warmup = AlbumPlugin.warmup_items_thumbnails
+    with mock.patch.object(
+        AlbumPlugin, "warmup_items_thumbnails", wraps=warmup
+    ) as mocked:
+        saved = AlbumPlugin.save_massupload_items(album, items)
+
+    mocked.assert_called_once_with(saved)
+    assert KVStore.objects.count() > 0
+
+
+def test_thumbnails_warmup_command(db):
+    """
+    Command should generate thumbnails for all items of required plugin models.
+    """
+    AlbumItemFactory.create_batch(3)
+
+    out = StringIO()
+    call_command("blocks_thumbnails_warmup", "--model=Album", stdout=out)
+    assert out.getvalue() == "- Album: 3 thumbnail(s)\n"
+
+    with pytest.raises(CommandError):
+        call_command("blocks_thumbnails_warmup", "--model=Card", stdout=out)
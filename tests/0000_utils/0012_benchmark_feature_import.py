@@ -0,0 +1,30 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from cmsplugin_blocks.benchmarks.feature_import import run
+from cmsplugin_blocks.models import Feature, FeaturePlugin
+
+
+def test_benchmark_feature_import(db):
+    """
+    Benchmark should measure import with a constant number of queries then rollback
+    everything.
+    """
+    small = run(features=20, existing=5, repeat=2, seed=42)
+    large = run(features=200, existing=5, repeat=1, seed=42)
+
+    assert small["validation"]["count"] == 2
+    assert small["save"]["count"] == 2
+    assert small["results"] == {"created": 15, "duplicates": 5}
+    assert large["results"] == {"created": 195, "duplicates": 5}
+    # Number of queries does not depend from the number of items
+    assert small["queries"] == large["queries"]
+
+    assert Feature.objects.count() == 0
+    assert FeaturePlugin.objects.count() == 0
+
+    out = StringIO()
+    call_command("blocks_benchmark_feature_import", "--features=10", "--repeat=1",
+                 stdout=out)
+    assert "- Created: 10, duplicates: 0" in out.getvalue()
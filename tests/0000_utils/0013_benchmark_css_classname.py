@@ -0,0 +1,53 @@
+from io import StringIO
+
+import pytest
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+
+from cmsplugin_blocks.benchmarks.css_classname import (
+    build_values, legacy_validate_css_classname, run,
+)
+from cmsplugin_blocks.utils import validate_css_classname
+
+
+@pytest.mark.parametrize("allow_multiple", [False, True])
+def test_compiled_matches_legacy(settings, allow_multiple):
+    """
+    Compiled validator should give the same result than the previous one, including
+    the reported class name.
+    """
+    settings.BLOCKS_FEATURE_ALLOW_MULTIPLE_CLASSES = allow_multiple
+
+    def outcome(validator, value):
+        try:
+            return validator(value)
+        except ValidationError as e:
+            return e.params["value"]
+
+    values = build_values(50, multiple=allow_multiple, seed=42) + [
+        "", " ", "foo  bar", "1foo", "foo 1bar", "²foo", "été", "½", "foo.bar",
+        "foo\nbar", "foo\tbar", "-foo _bar", "foo bar ",
+    ]
+
+    for value in values:
+        assert outcome(validate_css_classname, value) == outcome(
+            legacy_validate_css_classname, value
+        )
+
+
+def test_benchmark_css_classname():
+    """
+    Benchmark should measure every validator for both modes.
+    """
+    results = run(values=20, repeat=2, seed=42)
+
+    assert results["values"] == 20
+    for mode in ("single", "multiple"):
+        for name in ("legacy", "compiled", "list"):
+            assert results[mode][name]["count"] == 2
+
+    out = StringIO()
+    call_command("blocks_benchmark_css_classname", "--values=10", "--repeat=1",
+                 stdout=out)
+    assert "Multiple class name(s) mode:" in out.getvalue()
@@ -2,7 +2,7 @@ import pytest
 
 from django.core.exceptions import ValidationError
 
-from cmsplugin_blocks.models.feature import Feature
+from cmsplugin_blocks.models.feature import Feature, FeaturePlugin
 
 
 def test_basic(db):
@@ -128,3 +128,52 @@ def test_plugins_string(db):
     foo.save()
     created = Feature.objects.get(pk=foo.id)
     assert created.plugins == ["f", "o", "o"]
+
+
+def test_allowed_plugins_sync(db):
+    """
+    Allowed plugin relations should follow the 'plugins' field value on each save.
+    """
+    instance = Feature(
+        title="Foo",
+        value="Dummy",
+        scope="size",
+        plugins=["Card", "Hero"],
+    )
+    instance.save()
+
+    assert sorted(instance.allowed_plugins.values_list("name", flat=True)) == [
+        "Card",
+        "Hero",
+    ]
+
+    instance.plugins = ["Album", "Hero"]
+    instance.save()
+
+    assert sorted(instance.allowed_plugins.values_list("name", flat=True)) == [
+        "Album",
+        "Hero",
+    ]
+    assert FeaturePlugin.objects.count() == 2
+
+    instance.delete()
+    assert FeaturePlugin.objects.count() == 0
+
+
+@pytest.mark.parametrize("indexed, expected", [
+    (False, ["Bar", "Foo"]),
+    (True, ["Foo"]),
+])
+def test_filter_plugin(db, settings, indexed, expected):
+    """
+    Plugin filtering should use a 'contains' lookup on default and an exact lookup
+    when indexed plugins are enabled.
+    """
+    settings.BLOCKS_FEATURE_INDEXED_PLUGINS = indexed
+
+    Feature(title="Foo", value="foo", scope="size", plugins=["Card"]).save()
+    Feature(title="Bar", value="bar", scope="size", plugins=["CardItem"]).save()
+    Feature(title="Ping", value="ping", scope="size", plugins=["Hero"]).save()
+
+    queryset = Feature.objects.all().filter_plugin("Card").order_by("title")
+    assert [item.title for item in queryset] == expected
@@ -0,0 +1,145 @@
+from cmsplugin_blocks.factories import CardFactory, FeatureFactory
+from cmsplugin_blocks.models import Feature
+from cmsplugin_blocks.registry import feature_registry
+
+
+def test_registry_load(db):
+    """
+    Registry should load every features on its first usage and index them on their
+    id.
+    """
+    feature_registry.clear()
+    assert feature_registry.is_loaded is False
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card", "Hero"])
+    bar = FeatureFactory(value="bar", scope="color", plugins=["Album"])
+
+    assert feature_registry.get(foo.id) == {
+        "value": "foo",
+        "scope": "size",
+        "plugins": ["Card", "Hero"],
+    }
+    assert feature_registry.get(bar.id) == {
+        "value": "bar",
+        "scope": "color",
+        "plugins": ["Album"],
+    }
+    assert feature_registry.get(42000) is None
+    assert feature_registry.is_loaded is True
+
+
+def test_registry_signals(db):
+    """
+    Registry should be cleared when a Feature is saved or deleted.
+    """
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card"])
+    assert feature_registry.get(foo.id)["value"] == "foo"
+
+    foo.value = "bar"
+    foo.save()
+    assert feature_registry.is_loaded is False
+    assert feature_registry.get(foo.id)["value"] == "bar"
+
+    pk = foo.id
+    foo.delete()
+    assert feature_registry.is_loaded is False
+    assert feature_registry.get(pk) is None
+
+
+def test_registry_clear_on_commit(db, django_capture_on_commit_callbacks):
+    """
+    Registry loaded during the transaction which saved a Feature should be cleared
+    again once committed.
+    """
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card"])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        foo.value = "bar"
+        foo.save()
+        # Simulate a concurrent load before commit
+        feature_registry.load()
+        assert feature_registry.is_loaded is True
+
+    assert feature_registry.is_loaded is False
+
+
+def test_registry_load_race(db, monkeypatch):
+    """
+    A load started before a clear should not store its outdated features.
+    """
+    feature_registry.clear()
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card"])
+
+    query_features = feature_registry.query_features
+
+    def racing_query():
+        features = query_features()
+        # A Feature is changed while features are queried
+        feature_registry.clear()
+        return features
+
+    monkeypatch.setattr(feature_registry, "query_features", racing_query)
+
+    assert feature_registry.load()[foo.id]["value"] == "foo"
+    assert feature_registry.is_loaded is False
+
+    monkeypatch.undo()
+
+    feature_registry.load()
+    assert feature_registry.is_loaded is True
+
+
+def test_registry_resolve(db):
+    """
+    Resolution should enforce relation scope and allowed plugin name.
+    """
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card"])
+    bar = FeatureFactory(value="bar", scope="color", plugins=["Album"])
+
+    assert feature_registry.resolve(
+        [(foo.id, "size"), (foo.id, "color"), (bar.id, "color")],
+        "Card",
+    ) == [{"value": "foo", "scope": "size"}]
+
+
+def test_features_from_registry(db, settings, django_assert_num_queries):
+    """
+    With registry enabled, features getters should return the same results than
+    from database and only perform a single query once registry is loaded.
+    """
+    size_foo = FeatureFactory(title="Foo", value="foo bis", scope="size", plugins=[
+        "Card"
+    ])
+    color_foo = FeatureFactory(title="Foo", scope="color", plugins=["Card"])
+    color_zap = FeatureFactory(title="Zap", scope="color", plugins=["Album"])
+    color_ping = FeatureFactory(title="Ping", scope="color", plugins=[
+        "Card",
+        "Hero"
+    ])
+    extra_bang = FeatureFactory(title="bang", scope="extra", plugins=["Card"])
+
+    card = CardFactory(
+        fill_size_features=[size_foo, color_foo],
+        fill_color_features=[color_ping, color_foo, color_zap],
+        fill_extra_features=[size_foo, color_zap, extra_bang],
+    )
+
+    # Get expected results from database
+    settings.BLOCKS_FEATURE_REGISTRY = False
+    expected_scoped = card.scoped_features()
+    expected_flat = card.flat_features()
+
+    settings.BLOCKS_FEATURE_REGISTRY = True
+    feature_registry.load()
+    card = CardFactory._meta.model.objects.get(pk=card.pk)
+
+    with django_assert_num_queries(1):
+        assert card.scoped_features() == expected_scoped
+        assert card.flat_features() == expected_flat
+
+    assert expected_scoped == {
+        "color": ["foo", "ping"],
+        "extra": ["bang"],
+        "size": ["bis", "foo"],
+    }
+    assert Feature.objects.count() == 5
@@ -0,0 +1,143 @@
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from cmsplugin_blocks.factories import AlbumFactory, CardFactory, FeatureFactory
+from cmsplugin_blocks.models import Album, Card
+
+
+def test_cache_disabled(db, settings):
+    """
+    Denormalized features should not be maintained when setting is disabled.
+    """
+    settings.BLOCKS_FEATURE_DENORMALIZED = False
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card"])
+    card = CardFactory(fill_size_features=[foo])
+
+    card = Card.objects.get(pk=card.pk)
+    assert card.features_cache is None
+    assert card.scoped_features_cache is None
+    assert card.flat_features() == "foo"
+
+
+def test_cache_relations_changes(db, settings, django_assert_num_queries):
+    """
+    Denormalized features should be updated when plugin features change and be used
+    without any query.
+    """
+    settings.BLOCKS_FEATURE_DENORMALIZED = True
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card"])
+    bar = FeatureFactory(value="bar", scope="color", plugins=["Card"])
+    ping = FeatureFactory(value="ping", scope="extra", plugins=["Album"])
+
+    card = CardFactory(fill_size_features=[foo], fill_color_features=[bar])
+
+    card = Card.objects.get(pk=card.pk)
+    with django_assert_num_queries(0):
+        assert card.flat_features() == "bar foo"
+        assert card.scoped_features() == {
+            "size": ["foo"],
+            "color": ["bar"],
+            "extra": [],
+        }
+
+    # Features not allowed for plugin are ignored
+    card.extra_features.add(ping)
+    card.size_features.remove(foo)
+    card = Card.objects.get(pk=card.pk)
+    assert card.features_cache == "bar"
+
+    card.color_features.clear()
+    card = Card.objects.get(pk=card.pk)
+    assert card.features_cache == ""
+
+    # Relations changed from a feature
+    foo.cmsplugin_blocks_card_size_related.add(card)
+    card = Card.objects.get(pk=card.pk)
+    assert card.features_cache == "foo"
+
+    foo.cmsplugin_blocks_card_size_related.clear()
+    card = Card.objects.get(pk=card.pk)
+    assert card.features_cache == ""
+
+
+def test_cache_feature_changes(db, settings):
+    """
+    Denormalized features should be updated for all related plugin objects when a
+    feature is saved or deleted.
+    """
+    settings.BLOCKS_FEATURE_DENORMALIZED = True
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card", "Album"])
+    bar = FeatureFactory(value="bar", scope="size", plugins=["Card"])
+
+    card = CardFactory(fill_size_features=[foo, bar])
+    album = AlbumFactory(fill_size_features=[foo])
+    other = CardFactory(fill_size_features=[bar])
+
+    foo.value = "zip"
+    foo.save()
+
+    assert Card.objects.get(pk=card.pk).features_cache == "bar zip"
+    assert Album.objects.get(pk=album.pk).features_cache == "zip"
+    assert Card.objects.get(pk=other.pk).features_cache == "bar"
+
+    foo.delete()
+
+    assert Card.objects.get(pk=card.pk).features_cache == "bar"
+    assert Album.objects.get(pk=album.pk).features_cache == ""
+    assert Card.objects.get(pk=other.pk).features_cache == "bar"
+
+
+def test_cache_feature_plugins_changes_indexed(db, settings):
+    """
+    Allowed plugins relations should be synchronized before related plugin objects
+    are rebuilt, so an indexed plugin lookup does not use the previous ones.
+    """
+    settings.BLOCKS_FEATURE_DENORMALIZED = True
+    settings.BLOCKS_FEATURE_INDEXED_PLUGINS = True
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card"])
+    card = CardFactory(fill_size_features=[foo])
+    assert Card.objects.get(pk=card.pk).features_cache == "foo"
+
+    foo.plugins = ["Hero"]
+    foo.save()
+
+    assert Card.objects.get(pk=card.pk).features_cache == ""
+
+    foo.plugins = ["Hero", "Card"]
+    foo.save()
+
+    assert Card.objects.get(pk=card.pk).features_cache == "foo"
+
+
+def test_cache_command(db, settings):
+    """
+    Command should rebuild denormalized features of every plugin objects.
+    """
+    settings.BLOCKS_FEATURE_DENORMALIZED = False
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card", "Album"])
+    card = CardFactory(fill_size_features=[foo])
+    album = AlbumFactory(fill_size_features=[foo])
+
+    out = StringIO()
+    call_command("blocks_features_cache", "--model=Card", stdout=out)
+    assert "- Card: 1 object(s)" in out.getvalue()
+
+    card = Card.objects.get(pk=card.pk)
+    assert card.features_cache == "foo"
+    assert card.scoped_features_cache == {"size": ["foo"], "color": [], "extra": []}
+    assert Album.objects.get(pk=album.pk).features_cache is None
+
+    call_command("blocks_features_cache", stdout=out)
+    assert Album.objects.get(pk=album.pk).features_cache == "foo"
+
+    with pytest.raises(CommandError):
+        call_command("blocks_features_cache", "--model=Nope", stdout=out)
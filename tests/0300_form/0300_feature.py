@@ -1,9 +1,15 @@
+import json
+
 import pytest
 
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from cmsplugin_blocks.factories import CardFactory, FeatureFactory
 from cmsplugin_blocks.forms import FeatureImportForm
-from cmsplugin_blocks.models import Feature
+from cmsplugin_blocks.models import Card, Feature
+from cmsplugin_blocks.registry import feature_registry
 from cmsplugin_blocks.utils.tests import flatten_form_errors
 
 
@@ -199,3 +205,226 @@ def test_import_dump_value_whitespaces(db, settings, tests_settings):
     assert results["disallowed_scopes"] == []
     assert len(results["ignored"]) == 0
     assert Feature.objects.count() == 0
+
+
+def test_import_dump_bulk_save(db, tests_settings):
+    """
+    Features should be created in bulk with their allowed plugins relations and the
+    Feature registry should be cleared.
+    """
+    filepath = tests_settings.fixtures_path / "feature_samples" / "valid.json"
+    payload = json.loads(filepath.read_text())
+
+    dump = SimpleUploadedFile(
+        "dump.json",
+        filepath.read_bytes(),
+        content_type="application/json"
+    )
+
+    feature_registry.load()
+
+    form = FeatureImportForm({}, {"json_file": dump})
+    assert form.is_valid() is True
+
+    with CaptureQueriesContext(connection) as captured:
+        form.save(commit=True)
+
+    inserts = [
+        query for query in captured.captured_queries
+        if query["sql"].startswith("INSERT")
+    ]
+    assert len(inserts) == 2
+    assert feature_registry.is_loaded is False
+
+    assert sorted([
+        (feature.scope, feature.title, sorted(
+            feature.allowed_plugins.values_list("name", flat=True)
+        ))
+        for feature in Feature.objects.all()
+    ]) == sorted([
+        (item["scope"], item["title"], sorted(item["plugins"]))
+        for item in payload["items"]
+    ])
+
+
+def get_dump(items):
+    """
+    Return an uploaded JSON dump file for given items.
+    """
+    return SimpleUploadedFile(
+        "dump.json",
+        json.dumps({"version": "1.3.0", "items": items}).encode("utf-8"),
+        content_type="application/json"
+    )
+
+
+def test_import_dump_update_mode(db):
+    """
+    In update mode, existing features should be updated if they differ, other
+    ones are created and nothing is deleted.
+    """
+    FeatureFactory(scope="size", title="Small", value="small", plugins=["Card"])
+    FeatureFactory(scope="size", title="Large", value="large", plugins=["Card"])
+    FeatureFactory(scope="color", title="Red", value="red", plugins=["Card"])
+    FeatureFactory(scope="extra", title="Shadow", value="shadow", plugins=["Card"])
+
+    form = FeatureImportForm({"mode": "update", "scopes": ["extra"]}, {
+        "json_file": get_dump([
+            {"title": "Small", "value": "small", "scope": "size",
+             "plugins": ["Card"]},
+            {"title": "Large", "value": "xlarge", "scope": "size",
+             "plugins": ["Card", "Hero"]},
+            {"title": "Blue", "value": "blue", "scope": "color",
+             "plugins": ["Hero"]},
+            {"title": "Shadow", "value": "no-shadow", "scope": "extra",
+             "plugins": ["Card"]},
+        ])
+    })
+    assert form.is_valid() is True
+
+    feature_registry.load()
+
+    results = form.save(commit=True)
+    assert results["mode"] == "update"
+    assert [item["title"] for item in results["created"]] == ["Blue"]
+    assert [item["title"] for item in results["updated"]] == ["Large"]
+    assert [item["title"] for item in results["unchanged"]] == ["Small"]
+    assert [item["title"] for item in results["ignored"]] == ["Shadow"]
+    assert results["deleted"] == []
+    assert results["duplicates"] == []
+    assert feature_registry.is_loaded is False
+
+    assert sorted([
+        (feature.scope, feature.title, feature.value, sorted(
+            feature.allowed_plugins.values_list("name", flat=True)
+        ))
+        for feature in Feature.objects.all()
+    ]) == [
+        ("color", "Blue", "blue", ["Hero"]),
+        ("color", "Red", "red", ["Card"]),
+        ("extra", "Shadow", "shadow", ["Card"]),
+        ("size", "Large", "xlarge", ["Card", "Hero"]),
+        ("size", "Small", "small", ["Card"]),
+    ]
+
+
+def test_import_dump_sync_mode(db):
+    """
+    In sync mode, existing features missing from dump should be deleted except the
+    ones from ignored scopes, all within a single transaction.
+    """
+    FeatureFactory(scope="size", title="Small", value="small", plugins=["Card"])
+    FeatureFactory(scope="size", title="Large", value="large", plugins=["Card"])
+    FeatureFactory(scope="extra", title="Shadow", value="shadow", plugins=["Card"])
+
+    form = FeatureImportForm({"mode": "sync", "scopes": ["extra"]}, {
+        "json_file": get_dump([
+            {"title": "Large", "value": "xlarge", "scope": "size",
+             "plugins": ["Card"]},
+            {"title": "Red", "value": "red", "scope": "color",
+             "plugins": ["Card"]},
+        ])
+    })
+    assert form.is_valid() is True
+
+    # Without commit nothing is changed
+    results = form.save(commit=False)
+    assert [item["title"] for item in results["deleted"]] == ["Small"]
+    assert Feature.objects.count() == 3
+
+    with CaptureQueriesContext(connection) as captured:
+        results = form.save(commit=True)
+
+    assert [item["title"] for item in results["created"]] == ["Red"]
+    assert [item["title"] for item in results["updated"]] == ["Large"]
+    assert results["deleted"] == [
+        {"title": "Small", "value": "small", "scope": "size", "plugins": ["Card"]},
+    ]
+
+    statements = [query["sql"].split(" ")[0] for query in captured.captured_queries]
+    assert statements.count("SAVEPOINT") == 1
+
+    assert sorted(Feature.objects.values_list("scope", "title", "value")) == [
+        ("color", "Red", "red"),
+        ("extra", "Shadow", "shadow"),
+        ("size", "Large", "xlarge"),
+    ]
+
+    # Importing the same dump again does not change anything
+    form = FeatureImportForm({"mode": "sync"}, {
+        "json_file": get_dump([
+            {"title": "Large", "value": "xlarge", "scope": "size",
+             "plugins": ["Card"]},
+            {"title": "Red", "value": "red", "scope": "color",
+             "plugins": ["Card"]},
+        ])
+    })
+    assert form.is_valid() is True
+    results = form.save(commit=True)
+    assert len(results["unchanged"]) == 2
+    assert [item["title"] for item in results["deleted"]] == ["Shadow"]
+    assert Feature.objects.count() == 2
+
+
+def test_import_dump_update_related_plugins(db, settings):
+    """
+    Denormalized features of plugin objects related to updated features should be
+    rebuilt.
+    """
+    settings.BLOCKS_FEATURE_DENORMALIZED = True
+
+    feature = FeatureFactory(scope="size", title="Large", value="large",
+                             plugins=["Card"])
+    card = CardFactory(fill_size_features=[feature])
+    assert Card.objects.get(pk=card.pk).features_cache == "large"
+
+    form = FeatureImportForm({"mode": "update"}, {
+        "json_file": get_dump([
+            {"title": "Large", "value": "xlarge", "scope": "size",
+             "plugins": ["Card"]},
+        ])
+    })
+    assert form.is_valid() is True
+    form.save(commit=True)
+
+    assert Card.objects.get(pk=card.pk).features_cache == "xlarge"
+
+
+def test_import_dump_sync_bulk_deletion(db, settings):
+    """
+    Deleting features in sync mode should update related plugin objects once for
+    all deleted features, with a number of queries which does not depend on the
+    number of deleted features.
+    """
+    settings.BLOCKS_FEATURE_DENORMALIZED = True
+
+    def sync(count):
+        Feature.objects.all().delete()
+
+        kept = FeatureFactory(scope="size", title="Kept", value="kept",
+                              plugins=["Card"])
+        deleted = [
+            FeatureFactory(scope="color", title="Deleted {}".format(i),
+                           value="deleted-{}".format(i), plugins=["Card"])
+            for i in range(count)
+        ]
+        card = CardFactory(fill_size_features=[kept], fill_color_features=deleted)
+        assert Card.objects.get(pk=card.pk).features_cache.startswith("deleted-")
+
+        form = FeatureImportForm({"mode": "sync"}, {
+            "json_file": get_dump([
+                {"title": "Kept", "value": "kept", "scope": "size",
+                 "plugins": ["Card"]},
+            ])
+        })
+        assert form.is_valid() is True
+
+        with CaptureQueriesContext(connection) as captured:
+            results = form.save(commit=True)
+
+        assert len(results["deleted"]) == count
+        assert Card.objects.get(pk=card.pk).features_cache == "kept"
+
+        return len(captured.captured_queries)
+
+    assert sync(1) == sync(10)
@@ -1,3 +1,5 @@
+import pytest
+
 from cmsplugin_blocks.factories import CardFactory, FeatureFactory
 from cmsplugin_blocks.forms import CardForm
 from cmsplugin_blocks.models import Card
@@ -70,3 +72,20 @@ def test_empty_feature_choices(db, settings):
     assert instance.template == card.template
     assert instance.size_features.count() == card.size_features.count()
     assert instance.content == card.content
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_features_choices(db, settings, indexed):
+    """
+    Feature field choices should be limited to the field scope and features allowed
+    for plugin.
+    """
+    settings.BLOCKS_FEATURE_INDEXED_PLUGINS = indexed
+
+    foo = FeatureFactory(title="Foo", scope="size", plugins=["Card", "Hero"])
+    FeatureFactory(title="Bar", scope="size", plugins=["Hero"])
+    FeatureFactory(title="Ping", scope="color", plugins=["Card"])
+
+    form = CardForm()
+
+    assert list(form.fields["size_features"].queryset) == [foo]
@@ -1,3 +1,5 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+
 from cmsplugin_blocks.factories import SliderFactory, SlideItemFactory, FeatureFactory
 from cmsplugin_blocks.forms import SliderForm, SlideItemForm
 from cmsplugin_blocks.utils.tests import build_post_data_from_object
@@ -105,3 +107,39 @@ def test_item_success(db, client, settings):
     assert instance.slider == slider
     assert instance.order == item.order
     assert instance.image == item.image
+
+
+def test_mass_upload_success(db, tests_settings):
+    """
+    When "mass_upload" field is filled with a valid ZIP file, form save
+    should fill the Slider attribute ``_awaiting_items`` with item instances
+    for each valid image file from ZIP archive.
+    """
+    slider = SliderFactory()
+
+    filepath = tests_settings.fixtures_path / "zip_samples/basic.zip"
+    archive = SimpleUploadedFile(
+        "basic.zip",
+        filepath.read_bytes(),
+        content_type="application/zip"
+    )
+
+    form = SliderForm({
+        "title": slider.title,
+        "template": slider.template,
+    }, {
+        "mass_upload": archive,
+    }, instance=slider)
+
+    assert form.is_valid() is True
+    instance = form.save()
+
+    assert [
+        (item.slider, item.title, item.image.name.split(".")[-1])
+        for item in instance._awaiting_items
+    ] == [
+        (slider, "basic/107x107.png", "png"),
+        (slider, "basic/120x100.jpg", "jpg"),
+        (slider, "basic/120x100.png", "png"),
+        (slider, "basic/120x120.png", "png"),
+    ]
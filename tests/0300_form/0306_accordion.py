@@ -1,3 +1,5 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+
 from cmsplugin_blocks.factories import (
     AccordionFactory, AccordionItemFactory, FeatureFactory
 )
@@ -107,3 +109,39 @@ def test_item_success(db, client, settings):
     assert instance.accordion == accordion
     assert instance.order == item.order
     assert instance.image == item.image
+
+
+def test_mass_upload_success(db, tests_settings):
+    """
+    When "mass_upload" field is filled with a valid ZIP file, form save
+    should fill the Accordion attribute ``_awaiting_items`` with item instances
+    for each valid image file from ZIP archive.
+    """
+    accordion = AccordionFactory()
+
+    filepath = tests_settings.fixtures_path / "zip_samples/basic.zip"
+    archive = SimpleUploadedFile(
+        "basic.zip",
+        filepath.read_bytes(),
+        content_type="application/zip"
+    )
+
+    form = AccordionForm({
+        "title": accordion.title,
+        "template": accordion.template,
+    }, {
+        "mass_upload": archive,
+    }, instance=accordion)
+
+    assert form.is_valid() is True
+    instance = form.save()
+
+    assert [
+        (item.accordion, item.title, item.image.name.split(".")[-1])
+        for item in instance._awaiting_items
+    ] == [
+        (accordion, "basic/107x107.png", "png"),
+        (accordion, "basic/120x100.jpg", "jpg"),
+        (accordion, "basic/120x100.png", "png"),
+        (accordion, "basic/120x120.png", "png"),
+    ]
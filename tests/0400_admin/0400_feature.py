@@ -1,6 +1,17 @@
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 
 from cmsplugin_blocks.factories import FeatureFactory
+from cmsplugin_blocks.models import Feature
+
+
+def get_streamed_content(response):
+    """
+    Return the full content from a streamed response.
+    """
+    return b"".join(response.streaming_content).decode("utf-8")
 
 
 def test_export_permission(db, client):
@@ -25,7 +36,7 @@ def test_export_empty(db, admin_client):
     response = admin_client.get(url)
     assert response.status_code == 200
 
-    payload = response.json()
+    payload = json.loads(get_streamed_content(response))
     assert sorted(payload.keys()) == ["date", "items", "version"]
     assert len(payload["items"]) == 0
 
@@ -49,7 +60,7 @@ def test_export_content(db, admin_client, settings):
     response = admin_client.get(url)
     assert response.status_code == 200
 
-    payload = response.json()
+    payload = json.loads(get_streamed_content(response))
     assert payload["items"] == [
         {
             "title": "Ping",
@@ -85,3 +96,81 @@ def test_export_content(db, admin_client, settings):
             ]
         }
     ]
+
+
+def test_export_formats(db, admin_client):
+    """
+    Exporting view should stream the dump in the required format.
+    """
+    FeatureFactory(title="Foo", value="foo", scope="size", plugins=["Card"])
+    FeatureFactory(title="Bar", value="bar", scope="size", plugins=["Hero"])
+
+    url = reverse("admin:cmsplugin_blocks_feature_export")
+    expected = [
+        {"title": "Bar", "value": "bar", "scope": "size", "plugins": ["Hero"]},
+        {"title": "Foo", "value": "foo", "scope": "size", "plugins": ["Card"]},
+    ]
+
+    response = admin_client.get(url)
+    assert response.streaming is True
+    assert response["Content-Type"] == "application/json"
+    content = get_streamed_content(response)
+    assert content == json.dumps(
+        dict(json.loads(content), items=expected),
+        indent=4
+    )
+
+    response = admin_client.get(url, {"format": "compact"})
+    content = get_streamed_content(response)
+    assert content == json.dumps(
+        dict(json.loads(content), items=expected),
+        separators=(",", ":")
+    )
+
+    response = admin_client.get(url, {"format": "ndjson"})
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = get_streamed_content(response).splitlines()
+    assert sorted(json.loads(lines[0]).keys()) == ["date", "version"]
+    assert [json.loads(line) for line in lines[1:]] == expected
+
+    response = admin_client.get(url, {"format": "nope"})
+    assert response.status_code == 400
+
+
+def test_import_sync_message(db, admin_client, settings):
+    """
+    Import view should apply the chosen mode and report diff stats.
+    """
+    settings.LANGUAGE_CODE = "en"
+
+    FeatureFactory(scope="size", title="Small", value="small", plugins=["Card"])
+    FeatureFactory(scope="size", title="Large", value="large", plugins=["Card"])
+
+    dump = SimpleUploadedFile(
+        "dump.json",
+        json.dumps({"version": "1.3.0", "items": [
+            {"title": "Large", "value": "xlarge", "scope": "size",
+             "plugins": ["Card"]},
+            {"title": "Red", "value": "red", "scope": "color",
+             "plugins": ["Card"]},
+        ]}).encode("utf-8"),
+        content_type="application/json"
+    )
+
+    url = reverse("admin:cmsplugin_blocks_feature_import")
+    response = admin_client.post(
+        url,
+        {"mode": "sync", "json_file": dump},
+        follow=True,
+    )
+    assert response.status_code == 200
+
+    assert [str(message) for message in response.context["messages"]] == [
+        (
+            "1 items have been created. 1 items have been updated. "
+            "1 items have been deleted"
+        ),
+    ]
+    assert sorted(Feature.objects.values_list("title", flat=True)) == [
+        "Large", "Red",
+    ]
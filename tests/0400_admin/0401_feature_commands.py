@@ -0,0 +1,100 @@
+import io
+import json
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from cmsplugin_blocks.factories import FeatureFactory
+from cmsplugin_blocks.models import Feature
+
+
+def test_export_stdout(db):
+    """
+    Export command should write the dump to standard output by default.
+    """
+    FeatureFactory(scope="size", title="Large", value="large", plugins=["Card"])
+
+    out = io.StringIO()
+    call_command("blocks_features_export", stdout=out)
+
+    dump = json.loads(out.getvalue())
+    assert dump["items"] == [
+        {"title": "Large", "value": "large", "scope": "size", "plugins": ["Card"]},
+    ]
+
+    out = io.StringIO()
+    call_command("blocks_features_export", "--format=ndjson", stdout=out)
+    assert len(out.getvalue().splitlines()) == 2
+
+
+def test_export_import_file(db, tmp_path):
+    """
+    A dump exported to a file should be importable with the import command.
+    """
+    FeatureFactory(scope="size", title="Large", value="large", plugins=["Card"])
+    FeatureFactory(scope="color", title="Red", value="red", plugins=["Hero"])
+
+    destination = tmp_path / "dump.json"
+    call_command("blocks_features_export", str(destination), "--format=compact")
+
+    Feature.objects.all().delete()
+
+    # Dry run does not save anything
+    out = io.StringIO()
+    call_command("blocks_features_import", str(destination), "--dry-run", stdout=out)
+    assert "- Created: 2" in out.getvalue()
+    assert Feature.objects.count() == 0
+
+    out = io.StringIO()
+    call_command(
+        "blocks_features_import",
+        str(destination),
+        "--ignore-scope=color",
+        stdout=out,
+    )
+    assert "- Created: 1" in out.getvalue()
+    assert "- Ignored: 1" in out.getvalue()
+    assert list(Feature.objects.values_list("title", flat=True)) == ["Large"]
+
+
+def test_import_stdin(db, monkeypatch):
+    """
+    Import command should read dump from standard input with the chosen mode.
+    """
+    FeatureFactory(scope="size", title="Small", value="small", plugins=["Card"])
+    FeatureFactory(scope="size", title="Large", value="large", plugins=["Card"])
+
+    payload = json.dumps({"version": "1.3.0", "items": [
+        {"title": "Large", "value": "xlarge", "scope": "size", "plugins": ["Card"]},
+    ]}).encode("utf-8")
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(payload)))
+
+    out = io.StringIO()
+    call_command("blocks_features_import", "--mode=sync", stdout=out)
+    assert "- Updated: 1" in out.getvalue()
+    assert "- Deleted: 1" in out.getvalue()
+    assert list(Feature.objects.values_list("title", "value")) == [
+        ("Large", "xlarge"),
+    ]
+
+
+def test_import_invalid(db, settings, tmp_path):
+    """
+    Import command should fail with form validation errors.
+    """
+    settings.LANGUAGE_CODE = "en"
+
+    source = tmp_path / "dump.json"
+    source.write_text(json.dumps({"version": "1.3.0", "items": [{"title": "Foo"}]}))
+
+    with pytest.raises(CommandError) as excinfo:
+        call_command("blocks_features_import", str(source))
+
+    assert str(excinfo.value) == (
+        "Some dump items are invalid:\n#1 is missing one or more required items"
+    )
+
+    with pytest.raises(CommandError):
+        call_command("blocks_features_import", str(tmp_path / "nope.json"))
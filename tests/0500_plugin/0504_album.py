@@ -167,3 +167,31 @@ def test_form_view_edit(db, client, settings):
     # There should be no more than a single item
     item_title_field = dom.find("input#id_album_item-1-title")
     assert len(item_title_field) == 0
+
+
+def test_prefetched_items(db, django_assert_num_queries):
+    """
+    Prefetched items should be used in their order without any query.
+    """
+    placeholder = Placeholder.objects.create(slot="test")
+
+    albums = []
+    for i in range(3):
+        album = add_plugin(placeholder, AlbumPlugin, "en", title="Album {}".format(i))
+        AlbumItemFactory.create(album=album, order=2, title="2")
+        AlbumItemFactory.create(album=album, order=1, title="1")
+        albums.append(album)
+
+    with django_assert_num_queries(1):
+        assert AlbumPlugin.prefetch_items(albums) == albums
+
+    # Already prefetched objects are ignored
+    with django_assert_num_queries(0):
+        assert AlbumPlugin.prefetch_items(albums) == []
+
+    plugin_instance = albums[0].get_plugin_class_instance()
+    with django_assert_num_queries(0):
+        for album in albums:
+            context = plugin_instance.render({}, album, None)
+            items = [(item.title, item.order) for item in context["ressources"]]
+            assert items == [("1", 1), ("2", 2)]
@@ -0,0 +1,104 @@
+from unittest import mock
+
+from cms.api import create_page, add_plugin
+
+from cmsplugin_blocks.cms_plugins import AlbumPlugin, CardPlugin
+from cmsplugin_blocks.compat.cms import CmsAPI
+from cmsplugin_blocks.factories import FeatureFactory
+from cmsplugin_blocks.utils.cache import invalidate_plugins_cache
+from cmsplugin_blocks.utils.features import get_related_plugin_ids
+
+
+def test_invalidate_plugins_cache(db, settings, django_capture_on_commit_callbacks):
+    """
+    Only placeholders containing given plugin objects should be invalidated.
+    """
+    cmsapi = CmsAPI()
+
+    page = create_page(
+        language="en",
+        title="Dummy",
+        slug="dummy",
+        template=settings.TEST_PAGE_TEMPLATES,
+    )
+    placeholder = cmsapi.get_placeholders(page).get(slot="content")
+
+    other_page = create_page(
+        language="en",
+        title="Other",
+        slug="other",
+        template=settings.TEST_PAGE_TEMPLATES,
+    )
+    other_placeholder = cmsapi.get_placeholders(other_page).get(slot="content")
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card", "Album"])
+
+    card = add_plugin(placeholder, CardPlugin, "en", title="Card")
+    card.size_features.add(foo)
+    album = add_plugin(placeholder, AlbumPlugin, "en", title="Album")
+    album.size_features.add(foo)
+    # Plugin without the feature in another page
+    add_plugin(other_placeholder, CardPlugin, "en", title="Other")
+
+    related = get_related_plugin_ids([foo.pk])
+    assert related == {
+        album.__class__: {album.pk},
+        card.__class__: {card.pk},
+    }
+
+    target = "cmsplugin_blocks.utils.cache.clear_placeholder_cache"
+    with mock.patch(target) as mocked:
+        assert invalidate_plugins_cache(related) == 1
+
+    mocked.assert_called_once_with(placeholder, "en", page.site_id)
+
+    # Feature edition invalidates the related placeholder once committed
+    with mock.patch(target) as mocked:
+        with django_capture_on_commit_callbacks(execute=True):
+            foo.value = "bar"
+            foo.save()
+            mocked.assert_not_called()
+
+    mocked.assert_called_once_with(placeholder, "en", page.site_id)
+
+    # Relations changed from a feature invalidate the related placeholder
+    with mock.patch(target) as mocked:
+        with django_capture_on_commit_callbacks(execute=True):
+            foo.cmsplugin_blocks_card_size_related.remove(card)
+            mocked.assert_not_called()
+
+    mocked.assert_called_once_with(placeholder, "en", page.site_id)
+
+    # Feature deletion invalidates the related placeholder once committed
+    with mock.patch(target) as mocked:
+        with django_capture_on_commit_callbacks(execute=True):
+            foo.delete()
+            mocked.assert_not_called()
+
+    mocked.assert_called_once_with(placeholder, "en", page.site_id)
+
+
+def test_invalidate_plugins_cache_disabled(db, settings):
+    """
+    Nothing should be done when DjangoCMS caches are disabled.
+    """
+    settings.CMS_PLACEHOLDER_CACHE = False
+    settings.CMS_PAGE_CACHE = False
+
+    placeholder = CmsAPI().get_placeholders(create_page(
+        language="en",
+        title="Dummy",
+        slug="dummy",
+        template=settings.TEST_PAGE_TEMPLATES,
+    )).get(slot="content")
+
+    foo = FeatureFactory(value="foo", scope="size", plugins=["Card"])
+    card = add_plugin(placeholder, CardPlugin, "en", title="Card")
+    card.size_features.add(foo)
+
+    target = "cmsplugin_blocks.utils.cache.clear_placeholder_cache"
+    with mock.patch(target) as mocked:
+        assert invalidate_plugins_cache({card.__class__: {card.pk}}) == 0
+        foo.save()
+
+    mocked.assert_not_called()
@@ -0,0 +1,293 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+import pytest
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from cms.api import add_plugin
+from cms.models import Placeholder
+
+from cmsplugin_blocks.cms_plugins import AccordionPlugin, AlbumPlugin, SliderPlugin
+from cmsplugin_blocks.forms import AccordionForm, AlbumForm, SliderForm
+from cmsplugin_blocks.jobs import (
+    claim_job,
+    create_job,
+    process_job,
+    process_pending_jobs,
+)
+from cmsplugin_blocks.models import AccordionItem, AlbumItem, MassUploadJob, SlideItem
+
+
+def get_archive(tests_settings, name="basic.zip"):
+    """
+    Return an uploaded file from a ZIP sample.
+    """
+    filepath = tests_settings.fixtures_path / "zip_samples" / name
+
+    return SimpleUploadedFile(
+        name,
+        filepath.read_bytes(),
+        content_type="application/zip"
+    )
+
+
+def create_album():
+    """
+    Create an Album plugin object in a new placeholder.
+    """
+    placeholder = Placeholder.objects.create(slot="test")
+
+    return add_plugin(
+        placeholder,
+        AlbumPlugin,
+        "en",
+        template="cmsplugin_blocks/album/default.html",
+        title="Foo",
+    )
+
+
+def test_job_progress_display(db):
+    """
+    Progress message should depend from job status.
+    """
+    job = MassUploadJob(total=4, processed=2, created=3, error="Nope")
+
+    assert job.get_progress_display() == "Waiting to be processed"
+
+    job.status = MassUploadJob.STATUS_RUNNING
+    assert job.get_progress_display() == "Processing: 2/4 files"
+
+    job.status = MassUploadJob.STATUS_DONE
+    assert job.get_progress_display() == "Done: 3 item(s) created"
+
+    job.status = MassUploadJob.STATUS_FAILED
+    assert job.get_progress_display() == "Failed: Nope"
+
+
+def test_form_job_mode(db, settings, tests_settings):
+    """
+    In job mode, form should keep the archive for a job instead of creating items.
+    """
+    settings.BLOCKS_MASSUPLOAD_JOB_RUNNER = "cmsplugin_blocks.jobs.queue_job"
+
+    form = AlbumForm({
+        "title": "Foo",
+        "template": "cmsplugin_blocks/album/default.html",
+    }, {
+        "mass_upload": get_archive(tests_settings),
+    })
+
+    assert form.is_valid() is True
+    instance = form.save(commit=False)
+
+    assert instance._awaiting_items == []
+    assert instance._awaiting_archive.name == "basic.zip"
+
+
+def test_run_job(db, settings, tests_settings, django_capture_on_commit_callbacks):
+    """
+    Runner "run_job" should process job once transaction is committed.
+    """
+    settings.BLOCKS_MASSUPLOAD_JOB_RUNNER = "cmsplugin_blocks.jobs.run_job"
+
+    album = create_album()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        job = create_job(album, get_archive(tests_settings))
+        assert job.status == MassUploadJob.STATUS_PENDING
+
+    job.refresh_from_db()
+    assert job.status == MassUploadJob.STATUS_DONE
+    assert job.total == 4
+    assert job.processed == 4
+    assert job.created == 4
+    # Archive is removed once job is finished
+    assert not job.archive
+
+    assert [item.title for item in album.album_item.order_by("title")] == [
+        "basic/107x107.png",
+        "basic/120x100.jpg",
+        "basic/120x100.png",
+        "basic/120x120.png",
+    ]
+
+
+def test_queue_job_worker(db, settings, tests_settings,
+                          django_capture_on_commit_callbacks):
+    """
+    Runner "queue_job" should leave job pending until worker command process it.
+    """
+    settings.BLOCKS_MASSUPLOAD_JOB_RUNNER = "cmsplugin_blocks.jobs.queue_job"
+
+    album = create_album()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        job = create_job(album, get_archive(tests_settings))
+
+    job.refresh_from_db()
+    assert job.status == MassUploadJob.STATUS_PENDING
+    assert album.album_item.count() == 0
+
+    out = StringIO()
+    call_command("blocks_massupload_worker", "--once", stdout=out)
+
+    job.refresh_from_db()
+    assert job.status == MassUploadJob.STATUS_DONE
+    assert album.album_item.count() == 4
+    assert "Done: 4 item(s) created" in out.getvalue()
+
+    # Nothing left to process
+    out = StringIO()
+    call_command("blocks_massupload_worker", "--once", stdout=out)
+    assert out.getvalue() == ""
+
+
+def test_job_invalidate_cache(db, tests_settings):
+    """
+    Processed job should invalidate CMS cache for its plugin object.
+    """
+    album = create_album()
+    job = create_job(album, get_archive(tests_settings))
+
+    target = "cmsplugin_blocks.jobs.invalidate_plugins_cache"
+    with mock.patch(target) as mocked:
+        assert claim_job(job) is True
+        process_job(job)
+
+    assert job.status == MassUploadJob.STATUS_DONE
+    mocked.assert_called_once_with({album.__class__: {album.pk}})
+
+
+def test_claim_stale_job(db, settings, tests_settings):
+    """
+    A running job without progress since the timeout should be claimed again.
+    """
+    settings.BLOCKS_MASSUPLOAD_JOB_TIMEOUT = 60
+
+    album = create_album()
+    job = create_job(album, get_archive(tests_settings))
+
+    assert claim_job(job) is True
+    # Already running with a recent progress
+    assert claim_job(job) is False
+    assert process_pending_jobs() == []
+
+    # Simulate a job which process has been killed
+    MassUploadJob.objects.filter(pk=job.pk).update(
+        updated_at=timezone.now() - datetime.timedelta(seconds=61),
+    )
+
+    settings.BLOCKS_MASSUPLOAD_JOB_TIMEOUT = None
+    assert process_pending_jobs() == []
+
+    settings.BLOCKS_MASSUPLOAD_JOB_TIMEOUT = 60
+    processed = process_pending_jobs()
+    assert [item.pk for item in processed] == [job.pk]
+
+    job.refresh_from_db()
+    assert job.status == MassUploadJob.STATUS_DONE
+    assert album.album_item.count() == 4
+
+
+def test_massupload_status_fieldset(db, settings, tests_settings):
+    """
+    Mass upload status should only be looked up when job mode is enabled.
+    """
+    album = create_album()
+    create_job(album, get_archive(tests_settings))
+    plugin = AlbumPlugin(AlbumPlugin.model)
+
+    settings.BLOCKS_MASSUPLOAD_JOB_RUNNER = None
+    with CaptureQueriesContext(connection) as captured:
+        fieldsets = plugin.get_fieldsets(None, obj=album)
+
+    assert len(captured) == 0
+    assert "massupload_status" not in fieldsets[2][1]["fields"]
+
+    settings.BLOCKS_MASSUPLOAD_JOB_RUNNER = "cmsplugin_blocks.jobs.queue_job"
+    fieldsets = plugin.get_fieldsets(None, obj=album)
+    assert "massupload_status" in fieldsets[2][1]["fields"]
+
+
+def test_job_failed(db, settings, tests_settings):
+    """
+    Job should be marked as failed with its error when archive can not be read.
+    """
+    album = create_album()
+
+    job = create_job(
+        album,
+        SimpleUploadedFile("broken.zip", b"nope", content_type="application/zip"),
+    )
+    job = process_job(job)
+
+    job.refresh_from_db()
+    assert job.status == MassUploadJob.STATUS_FAILED
+    assert job.error != ""
+    assert not job.archive
+    assert album.album_item.count() == 0
+
+
+def test_save_massupload_items_bulk(db):
+    """
+    Items should be inserted with a single query and signals still sent for each
+    item.
+    """
+    album = create_album()
+    items = [
+        AlbumItem(title="item-{}".format(i), image="blocks/albumitem/{}.png".format(i))
+        for i in range(5)
+    ]
+
+    received = []
+
+    def receiver(sender, instance, created, **kwargs):
+        received.append((instance.pk, instance.album_id, created))
+
+    post_save.connect(receiver, sender=AlbumItem)
+    try:
+        with CaptureQueriesContext(connection) as captured:
+            saved = AlbumPlugin.save_massupload_items(album, items)
+    finally:
+        post_save.disconnect(receiver, sender=AlbumItem)
+
+    inserts = [
+        query for query in captured.captured_queries
+        if query["sql"].startswith("INSERT")
+    ]
+    assert len(inserts) == 1
+
+    assert len(saved) == 5
+    assert album.album_item.count() == 5
+    assert received == [(item.pk, album.pk, True) for item in saved]
+    assert all(item.pk for item in saved)
+
+    assert AlbumPlugin.save_massupload_items(album, []) == []
+
+
+@pytest.mark.parametrize("plugin,form,item_model,link_attrname", [
+    (AlbumPlugin, AlbumForm, AlbumItem, "album"),
+    (AccordionPlugin, AccordionForm, AccordionItem, "accordion"),
+    (SliderPlugin, SliderForm, SlideItem, "slider"),
+])
+def test_massupload_options(plugin, form, item_model, link_attrname):
+    """
+    Mass upload options should be resolved from plugin items relation and plugin
+    form should use the same ones.
+    """
+    assert form().get_massupload_options() == plugin.get_massupload_options()
+    assert plugin.get_massupload_options() == {
+        "item_model": item_model,
+        "link_attrname": link_attrname,
+        "image_attrname": "image",
+        "label_attrname": "title",
+        "alt_attrname": "image_alt",
+        "order_attrname": "order",
+    }
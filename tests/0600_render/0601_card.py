@@ -61,6 +61,7 @@ class CardRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             CardPlugin,
+            query_budget=4,
             template=card.template,
             image=card.image,
             content=card.content,
@@ -116,6 +116,7 @@ class HeroRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             HeroPlugin,
+            query_budget=4,
             template=hero.template,
             image=hero.image,
             content=hero.content,
@@ -21,6 +21,7 @@ class SliderRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             SliderPlugin,
+            query_budget=5,
             template=slider.template,
             title=slider.title,
         )
@@ -164,6 +165,7 @@ class SliderRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             SliderPlugin,
+            query_budget=5,
             template=slider.template,
             title=slider.title,
             copy_relations_from=slider,
@@ -21,6 +21,7 @@ class AlbumRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             AlbumPlugin,
+            query_budget=5,
             template=album.template,
             title=album.title,
         )
@@ -153,6 +154,7 @@ class AlbumRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             AlbumPlugin,
+            query_budget=5,
             template=album.template,
             title=album.title,
             copy_relations_from=album,
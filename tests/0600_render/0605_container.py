@@ -1,4 +1,10 @@
 import logging
+from collections import deque
+from unittest import mock
+
+import pytest
+
+from django.db import connection
 
 from cmsplugin_blocks.cms_plugins import CardPlugin, ContainerPlugin, HeroPlugin
 from cmsplugin_blocks.factories import (
@@ -66,6 +72,7 @@ class ContainerRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             ContainerPlugin,
+            query_budget=4,
             template=container.template,
             image=container.image,
             content=container.content,
@@ -158,6 +165,7 @@ class ContainerRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             ContainerPlugin,
+            query_budget=8,
             template=container.template,
             title=container.title,
             children=[
@@ -188,3 +196,74 @@ class ContainerRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
         children_hero_content = dom.find(".container__items .hero .hero__content")
         assert len(children_hero_content) == 1
         assert children_hero_content[0].text == hero.content
+
+    def test_query_budget(self):
+        """
+        Render statistics should be recorded for each plugin, including children,
+        and a render exceeding query budget should fail.
+        """
+        container = ContainerFactory(image=None)
+        card = CardFactory(image=None)
+
+        self.create_basic_render(
+            ContainerPlugin,
+            template=container.template,
+            title=container.title,
+            children=[
+                (CardPlugin, {"title": card.title, "template": card.template}),
+            ],
+        )
+
+        assert [
+            item["plugin_type"] for item in self.render_stats["plugins"]
+        ] == ["CardPlugin", "ContainerPlugin"]
+        # Parent plugin queries include the ones from its children
+        assert self.render_stats["queries"] >= (
+            self.render_stats["plugins"][1]["queries"]
+        )
+        assert self.render_stats["duration"] > 0
+
+        with pytest.raises(AssertionError) as excinfo:
+            self.create_basic_render(
+                ContainerPlugin,
+                query_budget=0,
+                template=container.template,
+                title=container.title,
+            )
+
+        assert "while budget is 0" in str(excinfo.value)
+        assert "- ContainerPlugin #" in str(excinfo.value)
+
+    def test_query_budget_full_query_log(self):
+        """
+        Render statistics should still count queries once the connection query log
+        has reached its size limit.
+        """
+        container = ContainerFactory(image=None)
+        card = CardFactory(image=None)
+
+        def render():
+            self.create_basic_render(
+                ContainerPlugin,
+                template=container.template,
+                title=container.title,
+                children=[
+                    (CardPlugin, {"title": card.title, "template": card.template}),
+                ],
+            )
+            return self.render_stats
+
+        # First render fills some caches
+        render()
+
+        # A query log which is always full
+        with mock.patch.object(connection, "queries_log", deque(maxlen=1)):
+            full_log_stats = render()
+
+        render()
+
+        assert full_log_stats["queries"] > 0
+        assert full_log_stats["queries"] == self.render_stats["queries"]
+        assert [item["queries"] for item in full_log_stats["plugins"]] == [
+            item["queries"] for item in self.render_stats["plugins"]
+        ]
@@ -23,6 +23,7 @@ class AccordionRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             AccordionPlugin,
+            query_budget=5,
             template=accordion.template,
             title=accordion.title,
         )
@@ -155,6 +156,7 @@ class AccordionRenderTestCase(FixturesTestCaseMixin, CMSPluginTestCase):
 
         placeholder, model_instance, context, html = self.create_basic_render(
             AccordionPlugin,
+            query_budget=5,
             template=accordion.template,
             title=accordion.title,
             copy_relations_from=accordion,
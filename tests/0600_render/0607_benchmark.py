@@ -0,0 +1,69 @@
+from collections import deque
+from io import StringIO
+from unittest import mock
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+
+from cmsplugin_blocks.benchmarks.render import run
+from cmsplugin_blocks.models import Album, Card, Container, Feature
+
+
+def test_benchmark_render(db):
+    """
+    Benchmark should measure render of each plugin then rollback everything.
+    """
+    results = run(objects=2, items=2, features=1, depth=2, children=1, repeat=2)
+
+    assert list(results["plugins"].keys()) == [
+        "Accordion", "Album", "Card", "Container", "Hero", "Slider",
+    ]
+    for result in results["plugins"].values():
+        assert result["stats"]["count"] == 2
+        assert result["queries"] > 0
+        assert result["memory"] > 0
+
+    assert Feature.objects.count() == 0
+    assert Album.objects.count() == 0
+    assert Card.objects.count() == 0
+    assert Container.objects.count() == 0
+
+
+def test_benchmark_render_full_query_log(db):
+    """
+    Render queries should be counted even when the query log is full.
+    """
+    results = run(plugins=["Card"], objects=2, features=1, repeat=1)
+
+    # A query log which is always full
+    with mock.patch.object(connection, "queries_log", deque(maxlen=1)):
+        full_log_results = run(plugins=["Card"], objects=2, features=1, repeat=1)
+
+    assert results["plugins"]["Card"]["queries"] > 0
+    assert full_log_results["plugins"]["Card"]["queries"] == (
+        results["plugins"]["Card"]["queries"]
+    )
+
+
+def test_benchmark_render_command(db):
+    """
+    Command should output results for required plugins only.
+    """
+    out = StringIO()
+    call_command(
+        "blocks_benchmark_render",
+        "--plugin=Container",
+        "--objects=1",
+        "--repeat=1",
+        stdout=out,
+    )
+    output = out.getvalue()
+    assert "Container" in output
+    assert "Album" not in output
+    assert "- Queries: " in output
+
+    with pytest.raises(CommandError):
+        call_command("blocks_benchmark_render", "--plugin=Nope", stdout=out)
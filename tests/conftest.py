@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 import cmsplugin_blocks
+from cmsplugin_blocks.registry import feature_registry
 
 
 class FixturesSettingsTestMixin(object):
@@ -81,3 +82,14 @@ def temp_builds_dir(tmp_path):
     NOTE: You should use directly the "tmp_path" fixture in your tests.
     """
     return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def clear_feature_registry():
+    """
+    Ensure Feature registry is empty for each test since database changes from test
+    rollbacks do not send any signal.
+    """
+    feature_registry.clear()
+    yield
+    feature_registry.clear()